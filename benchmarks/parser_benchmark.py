@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML parser backends on documentation pages
+
+Parses each page with every installed backend and reports the median parse
+time and the peak Python memory allocated while parsing.
+
+Usage:
+    python benchmarks/parser_benchmark.py [URL or file ...] [--repeat N]
+
+Note: tracemalloc only sees Python allocations, so lxml's libxml2 buffers
+are not included in its peak; the BeautifulSoup tree itself is.
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import tracemalloc
+
+# Add the project directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from webscraperui.http_session import get_session_manager
+from webscraperui.parsing import available_parsers, make_soup
+
+# Large real-world documentation pages
+DEFAULT_SOURCES = [
+    "https://docs.python.org/3/library/stdtypes.html",
+    "https://docs.python.org/3/library/argparse.html",
+    "https://requests.readthedocs.io/en/latest/api/",
+]
+
+
+def load_source(source):
+    """
+    Read a page from a file or URL
+
+    Args:
+        source: File path or URL
+
+    Returns:
+        str: HTML content
+    """
+    if os.path.exists(source):
+        with open(source, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    response = get_session_manager().get(source)
+    response.raise_for_status()
+    return response.text
+
+
+def measure(html, parser, repeat):
+    """
+    Time and memory-profile parsing one page with one backend
+
+    Args:
+        html: HTML content
+        parser: Parser backend name
+        repeat: Number of timed parses
+
+    Returns:
+        tuple: (median seconds, peak bytes, number of tags)
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        soup = make_soup(html, parser=parser)
+        soup.get_text(" ", strip=True)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    soup = make_soup(html, parser=parser)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(timings), peak, len(soup.find_all(True))
+
+
+def main():
+    """Run the benchmark"""
+    arg_parser = argparse.ArgumentParser(description="Compare HTML parser backends")
+    arg_parser.add_argument("sources", nargs="*", default=DEFAULT_SOURCES, help="URLs or HTML files")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Timed parses per page and parser")
+    args = arg_parser.parse_args()
+
+    parsers = available_parsers()
+    print(f"Installed parsers: {', '.join(parsers)}\n")
+    print(f"{'page':<50} {'parser':<12} {'KB':>7} {'tags':>7} {'median ms':>10} {'peak MB':>8}")
+
+    for source in args.sources:
+        try:
+            html = load_source(source)
+        except Exception as e:
+            print(f"{source[:50]:<50} skipped: {e}")
+            continue
+
+        for parser in parsers:
+            seconds, peak, tags = measure(html, parser, args.repeat)
+            print(f"{source[-50:]:<50} {parser:<12} {len(html) // 1024:>7} {tags:>7} "
+                  f"{seconds * 1000:>10.1f} {peak / (1024 * 1024):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
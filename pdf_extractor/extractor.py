@@ -7,27 +7,29 @@ import json
 import logging
 import datetime
 import tempfile
-import requests
 import PyPDF2
 from urllib.parse import urlparse
 from io import BytesIO
 
 from webscraperui.analyzer import ContentAnalyzer
+from webscraperui.http_session import get_session_manager
 
 logger = logging.getLogger(__name__)
 
 class PDFExtractor:
     """Class for extracting content from PDF files"""
     
-    def __init__(self, output_folder="./pdf_output"):
+    def __init__(self, output_folder="./pdf_output", session_manager=None):
         """
         Initialize the PDF Extractor
         
         Args:
             output_folder: Folder to save extracted data
+            session_manager: HTTPSessionManager to download with (default: shared pool)
         """
         self.output_folder = output_folder
         self.analyzer = ContentAnalyzer()
+        self.session_manager = session_manager or get_session_manager()
         
         # Create output folder if it doesn't exist
         if not os.path.exists(output_folder):
@@ -130,7 +132,7 @@ class PDFExtractor:
             logger.info(f"Downloading and extracting PDF from {url}")
             
             # Download the PDF
-            response = requests.get(url, stream=True, timeout=30)
+            response = self.session_manager.get(url, stream=True)
             response.raise_for_status()
             
             # Create a temporary file to store the PDF
@@ -175,7 +177,7 @@ class PDFExtractor:
             
         # If the extension doesn't clearly indicate, make a HEAD request to check Content-Type
         try:
-            response = requests.head(url, allow_redirects=True, timeout=10)
+            response = self.session_manager.head(url, allow_redirects=True, timeout=10)
             content_type = response.headers.get('Content-Type', '').lower()
             
             # Check for various PDF content type formats
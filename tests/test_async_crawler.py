@@ -0,0 +1,64 @@
+import unittest
+import os
+import sys
+import threading
+import time
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.async_crawler import AsyncCrawler
+
+class TestAsyncCrawler(unittest.TestCase):
+    """Tests for the AsyncCrawler class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.peak = {}
+
+    def _fetch(self, url):
+        """Fake fetch that records how many requests run at once per host"""
+        host = url.split('/')[2]
+        with self.lock:
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.in_flight['*'] = self.in_flight.get('*', 0) + 1
+            for key in (host, '*'):
+                self.peak[key] = max(self.peak.get(key, 0), self.in_flight[key])
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight[host] -= 1
+            self.in_flight['*'] -= 1
+        if url.endswith('/fail'):
+            raise ValueError('boom')
+        return url.upper()
+
+    def test_results_keep_input_order(self):
+        """Test that results come back in the order the URLs were given"""
+        urls = [f'https://a.example/{i}' for i in range(6)]
+        results = AsyncCrawler(self._fetch, max_concurrency=3).run(urls)
+
+        self.assertEqual([url for url, _, _ in results], urls)
+        self.assertEqual(results[0][1], 'HTTPS://A.EXAMPLE/0')
+
+    def test_concurrency_limits(self):
+        """Test that the global and per-host limits are respected"""
+        urls = [f'https://a.example/{i}' for i in range(6)] + [f'https://b.example/{i}' for i in range(6)]
+        AsyncCrawler(self._fetch, max_concurrency=3, per_host_concurrency=2).run(urls)
+
+        self.assertLessEqual(self.peak['*'], 3)
+        self.assertLessEqual(self.peak['a.example'], 2)
+        self.assertLessEqual(self.peak['b.example'], 2)
+        self.assertGreater(self.peak['*'], 1)
+
+    def test_errors_are_returned_per_url(self):
+        """Test that a failing fetch does not abort the other fetches"""
+        urls = ['https://a.example/ok', 'https://a.example/fail']
+        results = AsyncCrawler(self._fetch).run(urls)
+
+        self.assertIsNone(results[0][2])
+        self.assertIsInstance(results[1][2], ValueError)
+
+if __name__ == '__main__':
+    unittest.main()
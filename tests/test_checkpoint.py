@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import threading
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.checkpoint import CheckpointStore, CrawlCheckpoint
+
+class TestCrawlCheckpoint(unittest.TestCase):
+    """Tests for the CrawlCheckpoint class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = CheckpointStore(self.temp_dir)
+        self.key = 'batch:https://docs.example/:html'
+
+    def tearDown(self):
+        """Clean up after tests"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_resume_skips_done_urls(self):
+        """Test that a resumed checkpoint knows which URLs are done"""
+        checkpoint = CrawlCheckpoint(self.store, self.key, interval=1)
+        checkpoint.set_frontier(['https://docs.example/a', 'https://docs.example/b'])
+        checkpoint.mark_done('https://docs.example/a', result={'url': 'https://docs.example/a'},
+                             output_path='/tmp/a.html')
+
+        resumed = CrawlCheckpoint(self.store, self.key, resume=True)
+        self.assertTrue(resumed.resumed)
+        self.assertTrue(resumed.is_done('https://docs.example/a'))
+        self.assertFalse(resumed.is_done('https://docs.example/b'))
+        self.assertEqual(resumed.frontier, ['https://docs.example/a', 'https://docs.example/b'])
+        self.assertEqual(resumed.outputs, {'https://docs.example/a': '/tmp/a.html'})
+        self.assertEqual(resumed.results, [{'url': 'https://docs.example/a'}])
+
+    def test_saves_on_interval(self):
+        """Test that progress is only flushed every `interval` URLs"""
+        checkpoint = CrawlCheckpoint(self.store, self.key, interval=2)
+        checkpoint.mark_done('https://docs.example/a')
+        self.assertIsNone(self.store.load(self.key))
+        checkpoint.mark_done('https://docs.example/b')
+        self.assertEqual(len(self.store.load(self.key)['visited']), 2)
+
+    def test_fresh_start_ignores_checkpoint(self):
+        """Test that resume=False starts from scratch"""
+        CrawlCheckpoint(self.store, self.key, interval=1).mark_done('https://docs.example/a')
+        fresh = CrawlCheckpoint(self.store, self.key)
+        self.assertFalse(fresh.resumed)
+        self.assertFalse(fresh.is_done('https://docs.example/a'))
+
+    def test_finish_removes_checkpoint(self):
+        """Test that finishing a crawl deletes its checkpoint"""
+        checkpoint = CrawlCheckpoint(self.store, self.key, interval=1)
+        checkpoint.mark_done('https://docs.example/a')
+        checkpoint.finish()
+        self.assertIsNone(self.store.load(self.key))
+
+    def test_concurrent_saves(self):
+        """Test that overlapping saves each write their own temp file and leave a whole checkpoint"""
+        errors = []
+
+        def save(worker):
+            try:
+                for i in range(50):
+                    self.store.save(self.key, {'visited': [f'https://docs.example/{worker}/{i}']})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.store.load(self.key)['visited']), 1)
+        self.assertEqual([name for name in os.listdir(self.temp_dir) if name.endswith('.tmp')], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.content_extractor import find_main_content, extract_main_content
+from webscraperui.parsing import make_soup
+
+DOC_HTML = """
+<html>
+    <head><title>Developer Interface</title></head>
+    <body>
+        <div class="related" role="navigation">
+            <ul><li><a href="index.html">index</a></li><li><a href="modules.html">modules</a></li></ul>
+        </div>
+        <div class="document">
+            <div class="documentwrapper"><div class="body" role="main">
+                <section id="api">
+                    <h1>Developer Interface<a class="headerlink" href="#api">¶</a></h1>
+                    <p>This part of the documentation covers all the interfaces of Requests. For parts where
+                    Requests depends on external libraries, we document the most important right here.</p>
+                    <section id="main-interface">
+                        <h2>Main Interface</h2>
+                        <p>All of the functionality can be accessed by these 7 methods. They all return an
+                        instance of the Response object, which is documented below.</p>
+                    </section>
+                    <section id="exceptions">
+                        <h2>Exceptions</h2>
+                        <p>An ambiguous exception occurred while handling your request, such as a connection
+                        error, a timeout, or an invalid URL.</p>
+                        <p>A Connection error occurred, for example a refused connection, a DNS failure, or a
+                        reset connection from the server side.</p>
+                    </section>
+                </section>
+            </div></div>
+            <div class="sphinxsidebar" role="navigation">
+                <h3>Navigation</h3>
+                <ul><li><a href="quickstart.html">Quickstart guide, with lots of text here</a></li></ul>
+                <p>Requests is an elegant and simple HTTP library for Python, built for human beings.</p>
+            </div>
+        </div>
+        <div class="footer">Copyright 2024, a project with help from many, many contributors.</div>
+    </body>
+</html>
+"""
+
+class TestContentExtractor(unittest.TestCase):
+    """Tests for the main content extractor"""
+
+    def test_finds_main_container(self):
+        """Test that the documentation body is chosen over its sections and wrappers"""
+        soup = make_soup(DOC_HTML)
+        self.assertEqual(find_main_content(soup).get('class'), ['body'])
+
+    def test_boilerplate_left_out(self):
+        """Test that navigation, sidebar, footer and header links are not extracted"""
+        content = extract_main_content(make_soup(DOC_HTML))
+        self.assertTrue(content.startswith('Developer Interface'))
+        self.assertIn('This part of the documentation', content)
+        self.assertIn('reset connection from the server side.', content)
+        for boilerplate in ('modules', 'elegant', 'Copyright'):
+            self.assertNotIn(boilerplate, content)
+
+    def test_sections_named_like_boilerplate_kept(self):
+        """Test that doc sections with ids like custom-headers or cookies are not dropped"""
+        sections = ''.join(
+            f'<section id="{name}"><h2>{name}</h2><p>The {name} section explains how requests '
+            f'handles this topic, with examples, caveats, and the options it accepts.</p></section>'
+            for name in ('custom-headers', 'cookies', 'comments', 'pagination')
+        )
+        soup = make_soup(f'<html><body><div class="body" role="main">{sections}</div></body></html>')
+        content = extract_main_content(soup)
+        for name in ('custom-headers', 'cookies', 'comments', 'pagination'):
+            self.assertIn(f'The {name} section explains', content)
+
+    def test_short_page_falls_back_to_body(self):
+        """Test that a page without scorable blocks returns its body text"""
+        soup = make_soup('<html><body><h1>Title</h1><span>Short</span><script>x = 1</script></body></html>')
+        self.assertIs(find_main_content(soup), soup.body)
+        self.assertEqual(extract_main_content(soup, separator='\n'), 'Title\nShort')
+
+if __name__ == '__main__':
+    unittest.main()
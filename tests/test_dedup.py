@@ -0,0 +1,72 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import MagicMock
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.dedup import simhash, hamming_distance, NearDuplicateIndex
+from webscraperui.scraper import WebScraper
+
+PAGE_TEXT = " ".join(
+    f"The client module exposes function number {i} which accepts a session and returns a response object."
+    for i in range(30)
+)
+
+class TestNearDuplicateIndex(unittest.TestCase):
+    """Tests for SimHash fingerprints and the NearDuplicateIndex class"""
+
+    def test_similar_texts_have_close_fingerprints(self):
+        """Test that a small edit changes few bits and a different text changes many"""
+        edited = PAGE_TEXT.replace("number 7 ", "number seven ")
+        other = " ".join(f"Installation step {i}: download the archive and unpack it into a folder." for i in range(30))
+
+        self.assertLessEqual(hamming_distance(simhash(PAGE_TEXT), simhash(edited)), 3)
+        self.assertGreater(hamming_distance(simhash(PAGE_TEXT), simhash(other)), 10)
+
+    def test_check_finds_versioned_copies(self):
+        """Test that the same page under another version is reported with its payload"""
+        index = NearDuplicateIndex()
+        self.assertIsNone(index.check('https://docs.example/en/latest/client.html', PAGE_TEXT, 'latest.html'))
+
+        match = index.check('https://docs.example/en/stable/client.html', PAGE_TEXT + " Version 2.1.")
+        self.assertEqual(match, ('https://docs.example/en/latest/client.html', 'latest.html'))
+        self.assertEqual(len(index), 1)
+
+    def test_same_url_and_short_pages(self):
+        """Test that a page never duplicates itself and short pages are not compared"""
+        index = NearDuplicateIndex()
+        index.check('https://docs.example/a', PAGE_TEXT)
+        self.assertIsNone(index.check('https://docs.example/a#top', PAGE_TEXT))
+
+        index.check('https://docs.example/short1', 'Page not found')
+        self.assertIsNone(index.check('https://docs.example/short2', 'Page not found'))
+
+    def test_scraper_links_duplicates_instead_of_saving(self):
+        """Test that WebScraper returns a duplicate result without writing a file"""
+        output_folder = tempfile.mkdtemp()
+        try:
+            scraper = WebScraper(output_folder=output_folder, session_manager=MagicMock(),
+                                 scheduler=MagicMock(), use_cache=False)
+            scraper._fetch_content = MagicMock(
+                return_value=f"<html><head><title>Client</title></head><body><p>{PAGE_TEXT}</p></body></html>"
+            )
+
+            scraper._save_output = MagicMock(wraps=scraper._save_output)
+
+            first = scraper.scrape('https://docs.example/en/latest/client.html')
+            second = scraper.scrape('https://docs.example/en/stable/client.html')
+
+            self.assertEqual(first['status'], 'success')
+            self.assertEqual(second['status'], 'duplicate')
+            self.assertEqual(second['duplicate_of'], 'https://docs.example/en/latest/client.html')
+            self.assertEqual(second['output_path'], first['output_path'])
+            self.assertEqual(scraper._save_output.call_count, 1)
+        finally:
+            shutil.rmtree(output_folder)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui import document as document_module
+from webscraperui.document import ParsedDocument, DocumentCache
+from webscraperui.analyzer import ContentAnalyzer
+from webscraperui.link_extractor import LinkExtractor
+
+class TestParsedDocument(unittest.TestCase):
+    """Tests for the ParsedDocument and DocumentCache classes"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.html = ('<html><head><title>API</title></head><body><h1>Reference</h1>'
+                     '<p>See <a href="/a.html">Module A</a> and <a href="b.html">B</a>.</p>'
+                     '<a name="top">Top</a></body></html>')
+
+    def test_lazy_text_and_links(self):
+        """Test that text and links are computed from the document"""
+        document = ParsedDocument(self.html, url='https://example.com/')
+        self.assertIsNone(document._soup)
+        self.assertEqual(document.links, [{'url': '/a.html', 'text': 'Module A'}, {'url': 'b.html', 'text': 'B'}])
+        # The link table alone does not build the full tree
+        self.assertIsNone(document._soup)
+        self.assertEqual(document.text, 'API Reference See Module A and B . Top')
+        self.assertEqual(document.soup.title.string, 'API')
+
+    def test_cache_returns_same_document(self):
+        """Test that identical content is parsed once and the cache is bounded"""
+        cache = DocumentCache(max_size=2)
+        first = cache.get(self.html)
+        self.assertIs(cache.get(self.html), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache.get('<p>two</p>')
+        cache.get('<p>three</p>')
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(cache.get(self.html), first)
+
+    def test_stages_share_one_parse(self):
+        """Test that link extraction and analysis reuse one parse of the same HTML"""
+        cache = DocumentCache()
+        with patch.object(document_module, 'get_document_cache', return_value=cache), \
+             patch.object(document_module, 'make_soup', wraps=document_module.make_soup) as make_soup:
+            soup = document_module.parse_document(self.html).soup
+            links = LinkExtractor().extract_links_from_html(self.html)
+            results = ContentAnalyzer().analyze_html(self.html)
+
+        self.assertEqual(make_soup.call_count, 1)
+        self.assertIs(cache.get(self.html).soup, soup)
+        self.assertEqual(len(links), 2)
+        self.assertEqual(results['link_count'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
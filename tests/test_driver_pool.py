@@ -0,0 +1,105 @@
+import unittest
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, PropertyMock
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.driver_pool import DriverPool, DriverPoolTimeout
+
+class TestDriverPool(unittest.TestCase):
+    """Tests for the DriverPool class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.drivers = []
+
+        def factory():
+            driver = MagicMock()
+            driver.window_handles = ['main', 'popup']
+            driver.current_url = 'https://docs.example/page'
+            self.drivers.append(driver)
+            return driver
+
+        self.factory = factory
+
+    def test_sessions_are_reused_and_reset(self):
+        """Test that a released session is cleaned and handed out again"""
+        pool = DriverPool(self.factory, max_size=2)
+        driver = pool.acquire()
+        pool.release(driver)
+
+        # Cookies of every host and the storage of the pages shown are cleared through DevTools
+        driver.execute_cdp_cmd.assert_any_call('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd.assert_any_call(
+            'Storage.clearDataForOrigin', {'origin': 'https://docs.example', 'storageTypes': 'all'}
+        )
+        driver.get.assert_called_with('about:blank')
+        driver.switch_to.window.assert_any_call('popup')
+        driver.close.assert_called_once()
+
+        self.assertIs(pool.acquire(), driver)
+        self.assertEqual(pool.stats()['created'], 1)
+
+    def test_reset_without_devtools(self):
+        """Test that a session without DevTools access falls back to WebDriver cookie deletion"""
+        pool = DriverPool(self.factory)
+        driver = pool.acquire()
+        driver.execute_cdp_cmd.side_effect = AttributeError('execute_cdp_cmd')
+        pool.release(driver)
+
+        driver.delete_all_cookies.assert_called_once()
+        self.assertIs(pool.acquire(), driver)
+
+    def test_recycled_after_max_uses(self):
+        """Test that a session is quit once it has served max_uses pages"""
+        pool = DriverPool(self.factory, max_uses=3)
+        driver = pool.acquire()
+        pool.release(driver, pages=3)
+
+        driver.quit.assert_called_once()
+        self.assertIsNot(pool.acquire(), driver)
+        self.assertEqual(pool.stats()['recycled'], 1)
+
+    def test_unhealthy_session_replaced(self):
+        """Test that a session failing its health check is discarded"""
+        pool = DriverPool(self.factory, max_size=1)
+        driver = pool.acquire()
+        pool.release(driver)
+        type(driver).current_url = PropertyMock(side_effect=Exception('chrome not reachable'))
+
+        replacement = pool.acquire()
+        self.assertIsNot(replacement, driver)
+        driver.quit.assert_called_once()
+        self.assertEqual(pool.stats()['alive'], 1)
+
+    def test_pool_is_bounded(self):
+        """Test that acquire waits for a free session and times out"""
+        pool = DriverPool(self.factory, max_size=1, acquire_timeout=0.05)
+        driver = pool.acquire()
+        with self.assertRaises(DriverPoolTimeout):
+            pool.acquire()
+
+        timer = threading.Timer(0.05, pool.release, args=(driver,))
+        timer.start()
+        pool.acquire_timeout = 5
+        self.assertIs(pool.acquire(), driver)
+        timer.join()
+        self.assertEqual(len(self.drivers), 1)
+
+    def test_close_quits_sessions(self):
+        """Test that closing the pool quits idle sessions and ones returned later"""
+        pool = DriverPool(self.factory, max_size=2)
+        idle, busy = pool.acquire(), pool.acquire()
+        pool.release(idle)
+        pool.close()
+        idle.quit.assert_called_once()
+
+        pool.release(busy)
+        busy.quit.assert_called_once()
+        self.assertEqual(pool.stats()['alive'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,270 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.browser_extraction import EXTRACT_SCRIPT
+from webscraperui.content_extractor import content_text
+from webscraperui.enhanced_scraper import EnhancedWebScraper
+from webscraperui.extraction import extract_elements
+from webscraperui.parsing import make_soup
+from webscraperui.readiness import NAVIGATE_SCRIPT, STATUS_SCRIPT, ReadinessPolicy
+from webscraperui.resilience import FaultHandler, OPEN
+
+def page_html(url):
+    """Build a small documentation page for a URL"""
+    name = url.rstrip('/').rsplit('/', 1)[-1]
+    paragraphs = ''.join(f'<p>The {name} page, paragraph {i}, explains its topic in enough words.</p>' for i in range(3))
+    # The index and guide pages link to the topic pages and to each other
+    links = ''
+    if name in ('index', 'guide'):
+        links = ''.join(f'<a href="/page{i}">page{i}</a>' for i in range(6)) + '<a href="/guide">guide</a>'
+    return (f'<html><head><title>{name}</title></head><body><div class="body"><h1>{name}</h1>{paragraphs}'
+            f'{links}</div></body></html>')
+
+class FakeBrowser:
+    """Browser session with tabs whose pages become ready after a few status checks"""
+
+    def __init__(self, checks_until_ready=3, runs_extraction=False):
+        self.checks_until_ready = checks_until_ready
+        self.runs_extraction = runs_extraction
+        self.source_reads = 0
+        # URLs whose navigation never commits, and hosts that cannot be reached
+        self.stalled = set()
+        self.dead_hosts = set()
+        self.navigations = []
+        self.tabs = {'tab-0': {'url': 'about:blank', 'checks': checks_until_ready}}
+        self.current = 'tab-0'
+        self.loading = 0
+        self.most_loading = 0
+        self.switch_to = MagicMock()
+        self.switch_to.window.side_effect = self._switch
+        self.switch_to.new_window.side_effect = self._new_tab
+
+    def _switch(self, handle):
+        self.current = handle
+
+    def _new_tab(self, kind):
+        handle = f'tab-{len(self.tabs)}'
+        self.tabs[handle] = {'url': 'about:blank', 'checks': self.checks_until_ready}
+        self.current = handle
+
+    @property
+    def current_window_handle(self):
+        return self.current
+
+    @property
+    def window_handles(self):
+        return list(self.tabs)
+
+    @property
+    def current_url(self):
+        return self.tabs[self.current]['url']
+
+    @property
+    def page_source(self):
+        self.source_reads += 1
+        return page_html(self.current_url)
+
+    def execute_script(self, script, *args):
+        tab = self.tabs[self.current]
+        if script == NAVIGATE_SCRIPT:
+            self.navigations.append(args[0])
+            tab['stale'] = args[0] in self.stalled
+            if not tab['stale']:
+                dead = args[0].split('/')[2] in self.dead_hosts
+                tab['url'] = 'chrome-error://chromewebdata/' if dead else args[0]
+            tab['checks'] = 0
+            self.loading += 1
+            self.most_loading = max(self.most_loading, self.loading)
+            return None
+        if script == STATUS_SCRIPT:
+            tab['checks'] += 1
+            ready = tab['checks'] > self.checks_until_ready
+            if tab['checks'] == self.checks_until_ready + 1:
+                self.loading -= 1
+            return {'readyState': 'complete' if ready else 'loading', 'pending': 0, 'networkQuiet': 1,
+                    'domQuiet': 1, 'selector': True, 'stale': tab['checks'] == 1 or tab.get('stale', False),
+                    'challenge': False}
+        if script == EXTRACT_SCRIPT and self.runs_extraction:
+            # What the script returns, worked out from the page the tab shows
+            soup = make_soup(page_html(self.current_url))
+            payload = extract_elements(soup, self.current_url, tables=True, code_blocks=True)
+            main = soup.select_one(args[0]) if args[0] else None
+            payload['content'] = content_text(main, separator=args[3]) if main is not None else None
+            return payload
+        return None
+
+    def close(self):
+        del self.tabs[self.current]
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        self.tabs[self.current]['url'] = url
+
+    def quit(self):
+        pass
+
+class TestEnhancedScraper(unittest.TestCase):
+    """Tests for the EnhancedWebScraper class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.temp_dir = tempfile.mkdtemp()
+        session_manager = MagicMock()
+        session_manager.head.return_value.headers = {'Content-Type': 'text/html'}
+        self.browser = FakeBrowser()
+        self.scraper = EnhancedWebScraper(
+            output_folder=self.temp_dir,
+            session_manager=session_manager,
+            scheduler=MagicMock(),
+            fault_handler=FaultHandler(),
+            readiness=ReadinessPolicy(poll_interval=0.001)
+        )
+        self.scraper.driver_pool.factory = lambda: self.browser
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.scraper.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_scrape_many_renders_in_tabs(self):
+        """Test that a batch is rendered in parallel tabs of one session"""
+        urls = [f'https://docs.example/page{i}' for i in range(7)]
+        finished = []
+        results = self.scraper.scrape_many(urls, scroll=False, tabs=3,
+                                           on_result=lambda url, result: finished.append(url))
+
+        self.assertEqual(sorted(finished), sorted(urls))
+        for url in urls:
+            self.assertEqual(results[url]['status'], 'success')
+            self.assertEqual(results[url]['title'], url.rsplit('/', 1)[-1])
+            self.assertTrue(os.path.exists(results[url]['output_path']))
+        self.assertEqual(self.browser.most_loading, 3)
+        self.assertEqual(self.scraper.driver_pool.stats()['created'], 1)
+        # The extra tabs are closed when the session goes back to the pool
+        self.assertEqual(self.browser.window_handles, ['tab-0'])
+
+    def test_scrape_many_reports_failed_pages(self):
+        """Test that a page that fails is reported without stopping the batch"""
+        urls = ['https://docs.example/good', 'https://docs.example/bad']
+        original = self.scraper._extract_data
+
+        def extract_data(soup, url):
+            if url.endswith('bad'):
+                raise ValueError('broken page')
+            return original(soup, url)
+
+        with patch.object(self.scraper, '_extract_data', side_effect=extract_data):
+            results = self.scraper.scrape_many(urls, scroll=False, tabs=2)
+        self.assertEqual(results['https://docs.example/good']['status'], 'success')
+        self.assertEqual(results['https://docs.example/bad'], {
+            'url': 'https://docs.example/bad', 'status': 'error', 'error': 'broken page'
+        })
+
+    def test_extraction_in_one_script_call(self):
+        """Test that once a domain's selector is learned pages are extracted without the page source"""
+        self.browser.runs_extraction = True
+        urls = [f'https://docs.example/page{i}' for i in range(3)]
+        results = self.scraper.scrape_many(urls, scroll=False, tabs=1)
+
+        # Only the first page is scored from its source to learn the selector
+        self.assertEqual(self.browser.source_reads, 1)
+        self.assertEqual(self.scraper.selector_cache.stats('docs.example')['hits'], 2)
+        with open(results[urls[2]]['output_path'], encoding='utf-8') as f:
+            self.assertIn('The page2 page, paragraph 2', f.read())
+
+    def test_deep_crawl_in_pooled_sessions(self):
+        """Test that linked pages are rendered in parallel sessions sharing the batch's visited set"""
+        browsers = []
+
+        def new_browser():
+            browsers.append(FakeBrowser())
+            return browsers[-1]
+
+        self.scraper.driver_pool.factory = new_browser
+        self.scraper.crawl_concurrency = 4
+        urls = ['https://docs.example/index', 'https://docs.example/guide']
+        with patch.object(self.scraper, '_save_output', wraps=self.scraper._save_output) as save_output:
+            results = self.scraper.scrape_many(urls, depth=2, scroll=False, tabs=2)
+
+        # The guide is part of the batch and the topic pages are crawled once, from the index
+        stats = results[urls[0]]['crawl_stats']
+        self.assertEqual((stats['pages'], stats['failed']), (6, 0))
+        self.assertGreater(stats['pages_per_second'], 0)
+        self.assertEqual(results[urls[1]]['crawl_stats']['pages'], 0)
+        linked = save_output.call_args_list[0][0][0]['linked_pages']
+        self.assertEqual(sorted(page['title'] for page in linked), [f'page{i}' for i in range(6)])
+
+        # Two pooled sessions with two tabs each
+        self.assertEqual(self.scraper.driver_pool.stats()['created'], 2)
+        self.assertEqual(max(browser.most_loading for browser in browsers), 2)
+
+    def test_deep_crawl_checkpoints_each_page(self):
+        """Test that an interrupted deep crawl keeps the linked pages it finished"""
+        self.scraper.crawl_concurrency = 1
+        original = self.scraper._read_page
+
+        def read_page(driver, url, scroll):
+            if url.endswith('page5'):
+                raise KeyboardInterrupt
+            return original(driver, url, scroll)
+
+        with patch.object(self.scraper, '_read_page', side_effect=read_page):
+            with self.assertRaises(KeyboardInterrupt):
+                self.scraper.scrape('https://docs.example/index', depth=2, scroll=False)
+
+        # Only the page that was interrupted and the one never started are rendered again
+        self.browser.navigations.clear()
+        result = self.scraper.scrape('https://docs.example/index', depth=2, scroll=False, resume=True)
+        self.assertEqual(self.browser.navigations, ['https://docs.example/page5', 'https://docs.example/guide'])
+        self.assertEqual(result['crawl_stats']['pages'], 2)
+
+    def test_tab_that_never_navigates_times_out(self):
+        """Test that a tab still showing its previous page is not read as the new one"""
+        self.browser.stalled.add('https://docs.example/slow')
+        urls = ['https://docs.example/first', 'https://docs.example/slow']
+        results = self.scraper.scrape_many(urls, scroll=False, wait_time=0.05, tabs=1)
+
+        self.assertEqual(results[urls[0]]['status'], 'success')
+        self.assertEqual(results[urls[1]]['status'], 'error')
+        self.assertIn('did not start loading', results[urls[1]]['error'])
+
+    def test_failed_tabs_trip_circuit(self):
+        """Test that tab failures are retried and reported to the host's circuit breaker"""
+        self.browser.dead_hosts.add('dead.example')
+        urls = [f'https://dead.example/page{i}' for i in range(5)] + ['https://docs.example/page0']
+        results = self.scraper.scrape_many(urls, scroll=False, tabs=1)
+
+        # Three attempts open the circuit; the other pages of the host are never loaded
+        self.assertEqual(len([url for url in self.browser.navigations if 'dead.example' in url]), 3)
+        self.assertEqual(self.scraper.fault_handler.host_stats()['dead.example']['circuit'], OPEN)
+        self.assertIn('Circuit open', results[urls[4]]['error'])
+        self.assertEqual(results['https://docs.example/page0']['status'], 'success')
+
+    def test_tab_retries_back_off(self):
+        """Test that a failed tab waits out the retry backoff while other pages keep loading"""
+        self.browser.dead_hosts.add('dead.example')
+        urls = ['https://dead.example/page0', 'https://docs.example/page0']
+        with patch.object(self.scraper.fault_handler.policy, 'delay', return_value=0.05) as delay:
+            started = time.monotonic()
+            self.scraper.scrape_many(urls, scroll=False, tabs=1)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual([args[0] for args, _ in delay.call_args_list], [1, 2])
+        self.assertGreaterEqual(elapsed, 0.1)
+        self.assertEqual(self.browser.navigations, [urls[0], urls[1], urls[0], urls[0]])
+
+if __name__ == '__main__':
+    unittest.main()
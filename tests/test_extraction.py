@@ -0,0 +1,70 @@
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.extraction import extract_elements
+from webscraperui.parsing import make_soup
+
+PAGE_HTML = """
+<html>
+    <head>
+        <title> Client API </title>
+        <meta name="keywords" content="client">
+        <meta name="description" content="Client reference">
+    </head>
+    <body>
+        <nav class="sidebar"><a href="index.html">Home</a><a href="#top">Top</a></nav>
+        <div role="main" class="document content">
+            <h1>Client</h1>
+            <p>Intro <a href="javascript:void(0)">toggle</a> <img src="/img/logo.png" alt="Logo"></p>
+            <h3>Parameters</h3>
+            <table><tr><td>timeout</td></tr></table>
+            <h2>Methods</h2>
+            <pre><code>client.get(url)</code></pre>
+            <img alt="no source">
+        </div>
+        <div class="content">Second content block</div>
+    </body>
+</html>
+"""
+
+class TestExtractElements(unittest.TestCase):
+    """Tests for single-pass page element extraction"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.soup = make_soup(PAGE_HTML)
+        self.url = 'https://docs.example/en/latest/client.html'
+
+    def test_matches_separate_passes(self):
+        """Test that one walk finds the same elements as separate find_all passes"""
+        elements = extract_elements(self.soup, self.url, tables=True, code_blocks=True)
+
+        self.assertEqual(elements['title'], 'Client API')
+        self.assertEqual(elements['meta_description'], 'Client reference')
+        self.assertEqual(elements['links'], [{'text': 'Home', 'href': 'https://docs.example/en/latest/index.html'}])
+        self.assertEqual(elements['images'], [
+            {'src': 'https://docs.example/img/logo.png', 'alt': 'Logo', 'title': ''}
+        ])
+        self.assertEqual(elements['tables'], [str(table) for table in self.soup.find_all('table')])
+        self.assertEqual(elements['code_blocks'], ['client.get(url)', 'client.get(url)'])
+
+    def test_headings_in_document_order(self):
+        """Test that headings keep their document order rather than being grouped by level"""
+        elements = extract_elements(self.soup, self.url)
+        self.assertEqual(elements['headings'], [
+            {'level': 1, 'text': 'Client'},
+            {'level': 3, 'text': 'Parameters'},
+            {'level': 2, 'text': 'Methods'}
+        ])
+
+    def test_only_requested_kinds(self):
+        """Test that element kinds that were not asked for are left out"""
+        elements = extract_elements(self.soup, self.url, links=False, images=False)
+        self.assertEqual(set(elements), {'title', 'meta_description', 'headings'})
+
+if __name__ == '__main__':
+    unittest.main()
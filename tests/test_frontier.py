@@ -0,0 +1,87 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.frontier import URLFrontier, PENDING, VISITED, FAILED
+from webscraperui.url_utils import canonicalize_url
+
+class TestURLFrontier(unittest.TestCase):
+    """Tests for the URLFrontier class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'frontier.sqlite')
+        self.frontier = URLFrontier(self.db_path)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.frontier.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_breadth_first_order(self):
+        """Test that shallower URLs and higher priorities come first"""
+        self.frontier.add_many(['https://a.example/deep'], depth=2)
+        self.frontier.add_many(['https://a.example/low', 'https://a.example/next'], depth=1)
+        self.frontier.add('https://a.example/high', depth=1, priority=5)
+
+        batch = self.frontier.next_batch(10)
+        self.assertEqual([url for url, _ in batch], [
+            'https://a.example/high',
+            'https://a.example/low',
+            'https://a.example/next',
+            'https://a.example/deep'
+        ])
+
+    def test_urls_are_deduplicated(self):
+        """Test that a URL is only queued once"""
+        self.assertEqual(self.frontier.add_many(['https://a.example/1', 'https://a.example/1'], depth=1), 1)
+        self.assertFalse(self.frontier.add('https://a.example/1', depth=2))
+        self.assertTrue(self.frontier.is_known('https://a.example/1'))
+
+    def test_key_func_merges_spellings(self):
+        """Test that URLs with the same key are stored once under the first spelling"""
+        frontier = URLFrontier(os.path.join(self.temp_dir, 'keyed.sqlite'), key_func=canonicalize_url)
+        try:
+            added = frontier.add_many(['https://a.example/docs/', 'https://A.example/docs#intro'], depth=1)
+            self.assertEqual(added, 1)
+            self.assertTrue(frontier.is_known('https://a.example/docs/index.html'))
+            self.assertEqual(frontier.next_batch(10), [('https://a.example/docs/', 1)])
+        finally:
+            frontier.close()
+
+    def test_max_depth(self):
+        """Test that URLs deeper than max_depth are not handed out"""
+        self.frontier.add_many(['https://a.example/1'], depth=1)
+        self.frontier.add_many(['https://a.example/2'], depth=2)
+        self.assertEqual(self.frontier.next_batch(10, max_depth=1), [('https://a.example/1', 1)])
+
+    def test_states_and_results(self):
+        """Test visited/failed bookkeeping and stored summaries"""
+        self.frontier.add_many(['https://a.example/1', 'https://a.example/2'], depth=1)
+        self.frontier.next_batch(2)
+        self.frontier.mark_visited('https://a.example/1', {'url': 'https://a.example/1', 'title': 'One'})
+        self.frontier.mark_failed('https://a.example/2', 'timeout')
+
+        counts = self.frontier.counts()
+        self.assertEqual(counts[VISITED], 1)
+        self.assertEqual(counts[FAILED], 1)
+        self.assertEqual(list(self.frontier.results()), [{'url': 'https://a.example/1', 'title': 'One'}])
+
+    def test_resume_after_crash(self):
+        """Test that claimed URLs return to the queue when a crawl is reopened"""
+        self.frontier.add_many(['https://a.example/1'], depth=1)
+        self.frontier.next_batch(1)
+        self.frontier.close()
+
+        self.frontier = URLFrontier(self.db_path)
+        self.assertEqual(self.frontier.reset_in_progress(), 1)
+        self.assertEqual(self.frontier.state_of('https://a.example/1'), PENDING)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import MagicMock
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.http_cache import HTTPCache
+from webscraperui.scraper import WebScraper
+
+def make_response(body, status_code=200, headers=None):
+    """Build a minimal stand-in for requests.Response"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = body.encode('utf-8')
+    response.text = body
+    response.encoding = 'utf-8'
+    return response
+
+class TestHTTPCache(unittest.TestCase):
+    """Tests for the HTTPCache class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = HTTPCache(self.cache_dir, max_size_bytes=100)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        shutil.rmtree(self.cache_dir)
+
+    def test_store_and_validators(self):
+        """Test that responses with validators are stored with conditional headers"""
+        response = make_response('<p>hi</p>', headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        self.assertTrue(self.cache.store('https://a.example/', response))
+
+        entry = self.cache.get('https://a.example/')
+        self.assertEqual(self.cache.read_body(entry), '<p>hi</p>')
+        self.assertEqual(self.cache.conditional_headers(entry), {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        })
+        self.assertFalse(self.cache.is_fresh(entry))
+
+    def test_responses_without_validators_are_skipped(self):
+        """Test that responses that cannot be revalidated are not cached without a TTL"""
+        self.assertFalse(self.cache.store('https://a.example/', make_response('x')))
+        self.assertIsNone(self.cache.get('https://a.example/'))
+
+    def test_ttl_override(self):
+        """Test that a TTL makes entries fresh and allows caching without validators"""
+        cache = HTTPCache(self.cache_dir, ttl=60)
+        cache.store('https://a.example/', make_response('x'))
+        self.assertTrue(cache.is_fresh(cache.get('https://a.example/')))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entries are evicted first"""
+        headers = {'ETag': '"v"'}
+        self.cache.store('https://a.example/1', make_response('a' * 40, headers=headers))
+        self.cache.store('https://a.example/2', make_response('b' * 40, headers=headers))
+        # Touch the first entry so the second becomes the LRU one
+        old_time = os.path.getmtime(self.cache._paths('https://a.example/2')[1]) - 10
+        os.utime(self.cache._paths('https://a.example/2')[1], (old_time, old_time))
+        self.cache.store('https://a.example/3', make_response('c' * 40, headers=headers))
+
+        self.assertIsNotNone(self.cache.get('https://a.example/1'))
+        self.assertIsNone(self.cache.get('https://a.example/2'))
+        self.assertIsNotNone(self.cache.get('https://a.example/3'))
+
+    def test_scraper_serves_304_from_disk(self):
+        """Test that WebScraper sends conditional GETs and serves 304s from the cache"""
+        session_manager = MagicMock()
+        scheduler = MagicMock()
+        scraper = WebScraper(output_folder=self.cache_dir, session_manager=session_manager, scheduler=scheduler)
+
+        session_manager.get.return_value = make_response('<p>page</p>', headers={'ETag': '"v1"'})
+        self.assertEqual(scraper._fetch_content('https://a.example/'), '<p>page</p>')
+
+        not_modified = make_response('', status_code=304)
+        session_manager.get.return_value = not_modified
+        self.assertEqual(scraper._fetch_content('https://a.example/'), '<p>page</p>')
+        _, kwargs = session_manager.get.call_args
+        self.assertEqual(kwargs['headers'], {'If-None-Match': '"v1"'})
+        # The 304's connection goes back to the pool
+        not_modified.close.assert_called_once_with()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.http_session import HTTPSessionManager, get_session_manager
+
+class TestHTTPSessionManager(unittest.TestCase):
+    """Tests for the HTTPSessionManager class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.manager = HTTPSessionManager(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=1,
+            headers={'Accept-Language': 'en'}
+        )
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.manager.close()
+
+    def test_adapters_use_configured_pool(self):
+        """Test that mounted adapters use the configured pool sizes and retries"""
+        adapter = self.manager.session.get_adapter('https://example.com/')
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertEqual(adapter.max_retries.total, 1)
+
+    def test_single_attempt_session(self):
+        """Test that callers retrying on their own get a session whose adapters do not retry"""
+        adapter = self.manager.single_attempt_session.get_adapter('https://example.com/')
+        self.assertEqual(adapter.max_retries.total, 0)
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertIsNot(self.manager.single_attempt_session, self.manager.session)
+
+    def test_default_headers_are_merged(self):
+        """Test that custom headers are added to the default User-Agent"""
+        headers = self.manager.session.headers
+        self.assertIn('WebScraperUI', headers['User-Agent'])
+        self.assertEqual(headers['Accept-Language'], 'en')
+
+    def test_session_is_reused(self):
+        """Test that the same session is returned until closed"""
+        session = self.manager.session
+        self.assertIs(session, self.manager.session)
+        self.manager.close()
+        self.assertIsNot(session, self.manager.session)
+
+    def test_shared_manager_is_singleton(self):
+        """Test that the shared manager is the same object across calls"""
+        self.assertIs(get_session_manager(), get_session_manager())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import MagicMock
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.hybrid import HybridScraper, rendering_reasons
+
+STATIC_PAGE = """
+<html><head><title>json</title><script src="_static/searchtools.js"></script></head>
+<body><div class="sphinxsidebar"><a href="index.html">Index</a></div>
+<div class="body" role="main"><h1>json - JSON encoder and decoder</h1>
+<p>JSON (JavaScript Object Notation) is a lightweight data interchange format inspired by JavaScript object literal syntax.</p>
+<p>The json module exposes an API familiar to users of the standard library marshal and pickle modules.</p>
+</div></body></html>
+"""
+
+SHELL_PAGE = """
+<html><head><title>App</title><script src="/static/js/main.js"></script></head>
+<body><noscript>You need to enable JavaScript to run this app.</noscript><div id="root"></div></body></html>
+"""
+
+class TestRenderingReasons(unittest.TestCase):
+    """Tests for the JavaScript shell heuristics"""
+
+    def test_static_page_needs_no_browser(self):
+        """Test that a server-rendered documentation page is fetched statically"""
+        self.assertEqual(rendering_reasons(STATIC_PAGE), [])
+
+    def test_shell_needs_browser(self):
+        """Test that an empty framework root and a noscript warning are detected"""
+        reasons = rendering_reasons(SHELL_PAGE)
+        self.assertIn('empty framework root #root', reasons)
+        self.assertIn('noscript warning', reasons)
+
+    def test_short_page_without_scripts(self):
+        """Test that a short page without scripts is never rendered"""
+        self.assertEqual(rendering_reasons('<html><body><p>Moved to the new site.</p></body></html>'), [])
+
+class TestHybridScraper(unittest.TestCase):
+    """Tests for the HybridScraper class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'fetch_modes.json')
+        self.pages = {}
+        self.static = MagicMock()
+        self.static.fetch_html.side_effect = lambda url: self.pages[url]
+        self.static.scrape.side_effect = lambda url, **kwargs: {'url': url, 'status': 'success'}
+        self.browser = MagicMock()
+        self.browser.scrape.side_effect = lambda url, **kwargs: {'url': url, 'status': 'success'}
+        self.hybrid = HybridScraper(self.static, lambda: self.browser, self.path, recheck_every=2)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_static_first(self):
+        """Test that a server-rendered page is scraped from its static HTML"""
+        self.pages['https://docs.example/json'] = STATIC_PAGE
+        result = self.hybrid.scrape('https://docs.example/json', depth=2)
+        self.assertEqual(result['fetch_mode'], 'static')
+        self.static.scrape.assert_called_once_with('https://docs.example/json', depth=2, output_format='txt',
+                                                   resume=False, html=STATIC_PAGE)
+        self.browser.scrape.assert_not_called()
+
+    def test_escalation_remembered_per_domain(self):
+        """Test that a shell is rendered and its domain skips static fetches until the re-check"""
+        for i in range(4):
+            self.pages[f'https://app.example/{i}'] = SHELL_PAGE
+        self.assertEqual(self.hybrid.scrape('https://app.example/0')['fetch_mode'], 'browser')
+        self.assertEqual(self.static.fetch_html.call_count, 1)
+
+        self.hybrid.scrape('https://app.example/1')
+        self.hybrid.scrape('https://app.example/2')
+        self.assertEqual(self.static.fetch_html.call_count, 1)
+
+        # Every recheck_every pages plain HTTP is tried again
+        self.hybrid.scrape('https://app.example/3')
+        self.assertEqual(self.static.fetch_html.call_count, 2)
+        self.assertEqual(self.browser.scrape.call_count, 4)
+
+        # Decisions survive a restart
+        stats = HybridScraper(self.static, lambda: self.browser, self.path).stats('app.example')
+        self.assertEqual(stats['mode'], 'browser')
+
+    def test_scrape_many_splits_batch(self):
+        """Test that a batch renders only the pages that need the browser"""
+        self.pages['https://docs.example/json'] = STATIC_PAGE
+        self.pages['https://app.example/home'] = SHELL_PAGE
+
+        def scrape_many(urls, on_result=None, **kwargs):
+            for url in urls:
+                on_result(url, {'url': url, 'status': 'success'})
+
+        self.browser.scrape_many.side_effect = scrape_many
+        finished = {}
+        results = self.hybrid.scrape_many(list(self.pages), on_result=lambda url, result: finished.update({url: result}))
+
+        self.assertEqual(results['https://docs.example/json']['fetch_mode'], 'static')
+        self.assertEqual(results['https://app.example/home']['fetch_mode'], 'browser')
+        self.assertEqual(set(finished), set(self.pages))
+        self.assertEqual(self.browser.scrape_many.call_args[0][0], ['https://app.example/home'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui import parsing
+from webscraperui.parsing import resolve_parser, make_soup, make_link_soup, PARSER_ENV_VAR
+
+class TestParserFactory(unittest.TestCase):
+    """Tests for the HTML parser factory"""
+
+    def test_auto_prefers_lxml(self):
+        """Test that auto picks lxml when installed and html.parser otherwise"""
+        with patch.dict(os.environ, {PARSER_ENV_VAR: 'auto'}):
+            with patch.object(parsing, 'available_parsers', return_value=['lxml', 'html5lib', 'html.parser']):
+                self.assertEqual(resolve_parser(), 'lxml')
+            with patch.object(parsing, 'available_parsers', return_value=['html5lib', 'html.parser']):
+                self.assertEqual(resolve_parser(), 'html.parser')
+
+    def test_explicit_choice_and_fallback(self):
+        """Test that an explicit parser is used if installed and falls back otherwise"""
+        with patch.object(parsing, 'available_parsers', return_value=['html.parser']):
+            self.assertEqual(resolve_parser('html.parser'), 'html.parser')
+            self.assertEqual(resolve_parser('lxml'), 'html.parser')
+            with patch.dict(os.environ, {PARSER_ENV_VAR: 'html5lib'}):
+                self.assertEqual(resolve_parser(), 'html.parser')
+
+    def test_backends_agree_on_content(self):
+        """Test that every installed backend extracts the same title, links and text"""
+        html = '<html><head><title>Docs</title></head><body><h1>API</h1><p>See <a href="/a.html">A</a></p></body></html>'
+        for parser in parsing.available_parsers():
+            soup = make_soup(html, parser=parser)
+            self.assertEqual(soup.title.string, 'Docs', parser)
+            self.assertEqual([a['href'] for a in soup.find_all('a')], ['/a.html'], parser)
+            self.assertEqual(soup.get_text(' ', strip=True), 'Docs API See A', parser)
+
+    def test_link_soup_matches_full_parse(self):
+        """Test that the link-only parse finds the same links as a full parse"""
+        html = ('<html><body><nav><a href="/a.html">A <b>bold</b></a><a name="top">Top</a></nav>'
+                '<table><tr><td><a href="b.html#x">B</a></td></tr></table></body></html>')
+        for parser in parsing.available_parsers():
+            full = [(a['href'], a.get_text(strip=True)) for a in make_soup(html, parser=parser).find_all('a', href=True)]
+            links = [(a['href'], a.get_text(strip=True)) for a in make_link_soup(html, parser=parser).find_all('a', href=True)]
+            self.assertEqual(links, full, parser)
+            self.assertEqual(links, [('/a.html', 'Abold'), ('b.html#x', 'B')], parser)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.politeness import PolitenessScheduler
+
+class TestPolitenessScheduler(unittest.TestCase):
+    """Tests for the PolitenessScheduler class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.scheduler = PolitenessScheduler(default_rate=10.0, burst=2)
+
+    def test_burst_is_free(self):
+        """Test that requests within the burst do not wait"""
+        self.assertEqual(self.scheduler.reserve('https://a.example/1'), 0)
+        self.assertEqual(self.scheduler.reserve('https://a.example/2'), 0)
+        self.assertGreater(self.scheduler.reserve('https://a.example/3'), 0)
+
+    def test_hosts_are_independent(self):
+        """Test that each host has its own bucket"""
+        for i in range(3):
+            self.scheduler.reserve(f'https://a.example/{i}')
+        self.assertEqual(self.scheduler.reserve('https://b.example/'), 0)
+
+    def test_host_rate_override(self):
+        """Test that a per-host rate changes the delay"""
+        self.scheduler.set_host_rate('slow.example', 0.5, burst=1)
+        self.scheduler.reserve('https://slow.example/1')
+        delay = self.scheduler.reserve('https://slow.example/2')
+        self.assertAlmostEqual(delay, 2.0, places=1)
+
+    def test_backoff_on_429(self):
+        """Test that 429 responses slow a host down and honour Retry-After"""
+        self.scheduler.record_response('https://a.example/', 429, retry_after='5')
+        stats = self.scheduler.host_stats()['a.example']
+        self.assertLess(stats['effective_rate'], 10.0)
+        self.assertGreaterEqual(self.scheduler.reserve('https://a.example/'), 4.5)
+
+    def test_recovery_after_success(self):
+        """Test that successful responses restore the configured rate"""
+        self.scheduler.record_response('https://a.example/', 503)
+        for _ in range(10):
+            self.scheduler.record_response('https://a.example/', 200)
+        self.assertEqual(self.scheduler.host_stats()['a.example']['effective_rate'], 10.0)
+
+if __name__ == '__main__':
+    unittest.main()
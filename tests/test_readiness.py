@@ -0,0 +1,86 @@
+import unittest
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.readiness import ReadinessPolicy, install_probe, wait_until_ready
+
+def page_status(**overrides):
+    """Build a status report of a page that meets the default conditions"""
+    status = {
+        'readyState': 'complete',
+        'pending': 0,
+        'networkQuiet': 1.0,
+        'domQuiet': 1.0,
+        'selector': True,
+        'challenge': False
+    }
+    status.update(overrides)
+    return status
+
+def scripted_driver(statuses):
+    """Build a fake driver reporting the given statuses, repeating the last one"""
+    driver = MagicMock()
+    remaining = list(statuses)
+    driver.execute_script.side_effect = lambda script, selector: remaining.pop(0) if len(remaining) > 1 else remaining[0]
+    return driver
+
+class TestReadiness(unittest.TestCase):
+    """Tests for the page readiness conditions"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.policy = ReadinessPolicy(poll_interval=0.01, challenge_timeout=0.3)
+
+    def test_conditions(self):
+        """Test that each condition holds a page back until it is met"""
+        self.assertTrue(self.policy.is_met(page_status(readyState='interactive')))
+        self.assertFalse(self.policy.is_met(page_status(readyState='loading')))
+        self.assertFalse(self.policy.is_met(page_status(pending=1)))
+        self.assertFalse(self.policy.is_met(page_status(networkQuiet=0.1)))
+        self.assertFalse(self.policy.is_met(page_status(domQuiet=0.1)))
+        self.assertFalse(self.policy.is_met(page_status(selector=False)))
+        self.assertFalse(self.policy.is_met(page_status(challenge=True)))
+
+        relaxed = ReadinessPolicy(ready_state='complete', network_idle=None, dom_quiet=None)
+        self.assertFalse(relaxed.is_met(page_status(readyState='interactive')))
+        self.assertTrue(relaxed.is_met(page_status(pending=3, domQuiet=0)))
+
+        with self.assertRaises(ValueError):
+            ReadinessPolicy(ready_state='loaded')
+
+    def test_returns_once_ready(self):
+        """Test that the wait ends as soon as the page is ready"""
+        driver = scripted_driver([page_status(domQuiet=0), page_status(pending=2), page_status()])
+        result = wait_until_ready(driver, self.policy, timeout=5)
+        self.assertTrue(result['ready'])
+        self.assertLess(result['waited'], 1)
+        self.assertEqual(driver.execute_script.call_count, 3)
+
+    def test_timeout_is_a_ceiling(self):
+        """Test that a page that never settles is read after the timeout"""
+        driver = scripted_driver([page_status(pending=1)])
+        result = wait_until_ready(driver, self.policy, timeout=0.1)
+        self.assertFalse(result['ready'])
+        self.assertGreaterEqual(result['waited'], 0.1)
+        self.assertLess(result['waited'], 1)
+
+    def test_challenge_gets_extra_time(self):
+        """Test that a Cloudflare challenge gets extra time to clear"""
+        statuses = [page_status(challenge=True)] * 15 + [page_status()]
+        result = wait_until_ready(scripted_driver(statuses), self.policy, timeout=0.05)
+        self.assertTrue(result['ready'])
+        self.assertTrue(result['challenge'])
+
+    def test_probe_without_devtools(self):
+        """Test that registering the probe is optional"""
+        driver = MagicMock()
+        self.assertTrue(install_probe(driver))
+        driver.execute_cdp_cmd.side_effect = AttributeError('execute_cdp_cmd')
+        self.assertFalse(install_probe(driver))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import requests
+from selenium.common.exceptions import WebDriverException
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.resilience import FaultHandler, CircuitBreaker, CircuitOpenError, RetryPolicy, OPEN, CLOSED
+
+def http_error(status_code):
+    """Build a requests HTTPError carrying a response with the given status"""
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+class TestFaultHandler(unittest.TestCase):
+    """Tests for the FaultHandler, CircuitBreaker and RetryPolicy classes"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.handler = FaultHandler(max_attempts=3, base_delay=0.001, max_delay=0.002,
+                                    failure_threshold=3, reset_timeout=0.05)
+
+    def test_retries_transient_errors(self):
+        """Test that a transient error is retried and the call then succeeds"""
+        func = MagicMock(side_effect=[requests.ConnectionError("refused"), 'page'])
+        self.assertEqual(self.handler.call('https://a.example/1', func), 'page')
+        self.assertEqual(func.call_count, 2)
+
+        stats = self.handler.host_stats()['a.example']
+        self.assertEqual(stats['retries'], 1)
+        self.assertEqual(stats['failures'], 1)
+        self.assertEqual(stats['circuit'], CLOSED)
+
+    def test_client_errors_are_not_retried(self):
+        """Test that a 404 is raised at once and does not count against the host"""
+        func = MagicMock(side_effect=http_error(404))
+        with self.assertRaises(requests.HTTPError):
+            self.handler.call('https://a.example/missing', func)
+        self.assertEqual(func.call_count, 1)
+        self.assertEqual(self.handler.host_stats()['a.example']['failures'], 0)
+
+    def test_only_transport_errors_are_retried(self):
+        """Test that local errors are raised at once without counting against the host"""
+        for error in (ValueError("bad value"), requests.exceptions.MissingSchema("no scheme"),
+                      requests.exceptions.InvalidURL("bad url")):
+            func = MagicMock(side_effect=error)
+            with self.assertRaises(type(error)):
+                self.handler.call('https://a.example/1', func)
+            self.assertEqual(func.call_count, 1)
+        self.assertEqual(self.handler.host_stats()['a.example']['failures'], 0)
+
+        func = MagicMock(side_effect=[WebDriverException("net::ERR_CONNECTION_RESET"), 'page'])
+        self.assertEqual(self.handler.call('https://b.example/', func), 'page')
+        self.assertEqual(func.call_count, 2)
+
+    def test_circuit_opens_and_fails_fast(self):
+        """Test that a dead host trips its circuit and later calls fail without being sent"""
+        func = MagicMock(side_effect=requests.Timeout("timed out"))
+        with self.assertRaises(requests.Timeout):
+            self.handler.call('https://dead.example/1', func)
+        self.assertEqual(func.call_count, 3)
+
+        with self.assertRaises(CircuitOpenError):
+            self.handler.call('https://dead.example/2', func)
+        with self.assertRaises(CircuitOpenError):
+            self.handler.check('https://dead.example/3')
+        self.assertEqual(func.call_count, 3)
+
+        stats = self.handler.host_stats()['dead.example']
+        self.assertEqual(stats['circuit'], OPEN)
+        self.assertEqual(stats['fast_failures'], 2)
+
+        # Other hosts are unaffected
+        self.assertEqual(self.handler.call('https://a.example/', lambda: 'ok'), 'ok')
+
+    def test_outcomes_recorded_outside_call(self):
+        """Test that failures reported for browser tabs share the retry limits and the circuit"""
+        error = WebDriverException("net::ERR_CONNECTION_TIMED_OUT")
+        self.assertTrue(self.handler.record_failure('https://tab.example/1', error, attempt=1))
+        self.assertTrue(self.handler.record_failure('https://tab.example/1', error, attempt=2))
+        self.assertFalse(self.handler.record_failure('https://tab.example/1', error, attempt=3))
+        with self.assertRaises(CircuitOpenError):
+            self.handler.check('https://tab.example/2')
+
+        self.assertFalse(self.handler.record_failure('https://ok.example/', ValueError("bad page")))
+        self.handler.record_success('https://ok.example/')
+        stats = self.handler.host_stats()['ok.example']
+        self.assertEqual((stats['requests'], stats['failures'], stats['circuit']), (2, 0, CLOSED))
+
+    def test_half_open_trial_closes_circuit(self):
+        """Test that one successful trial call after the reset timeout closes the circuit"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.02)
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+
+        time.sleep(0.03)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_retry_budget_limits_retries(self):
+        """Test that retries stop once the host's budget is spent"""
+        handler = FaultHandler(max_attempts=5, base_delay=0.001, max_delay=0.001,
+                               retry_budget=0.0, min_retries=1, failure_threshold=100)
+        func = MagicMock(side_effect=http_error(503))
+        with self.assertRaises(requests.HTTPError):
+            handler.call('https://busy.example/', func)
+        self.assertEqual(func.call_count, 2)
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test that backoff delays stay within the exponential ceiling"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        with patch('webscraperui.resilience.random.uniform', side_effect=lambda low, high: high):
+            self.assertEqual([policy.delay(attempt) for attempt in range(1, 5)], [1.0, 2.0, 4.0, 4.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.resource_policy import ResourcePolicy
+
+class TestResourcePolicy(unittest.TestCase):
+    """Tests for the ResourcePolicy class"""
+
+    def test_docs_profile(self):
+        """Test that the docs profile blocks images, fonts, media and trackers but not stylesheets"""
+        policy = ResourcePolicy.from_profile('docs')
+        patterns = policy.blocked_patterns()
+        for pattern in ('*.png', '*.woff2?*', '*.mp4', '*://*.google-analytics.com/*', '*://ethicalads.io/*'):
+            self.assertIn(pattern, patterns)
+        self.assertNotIn('*.css', patterns)
+        self.assertEqual(policy.chrome_prefs(), {'profile.managed_default_content_settings.images': 2})
+
+    def test_deny_and_allow_lists(self):
+        """Test that extra hosts are blocked unless allowed"""
+        policy = ResourcePolicy.from_profile('trackers', deny_domains=['cdn.example'],
+                                             allow_domains=['disqus.com'])
+        patterns = policy.blocked_patterns()
+        self.assertIn('*://cdn.example/*', patterns)
+        self.assertNotIn('*://disqus.com/*', patterns)
+        self.assertFalse(any(pattern.startswith('*.') for pattern in patterns))
+        self.assertEqual(policy.chrome_prefs(), {})
+
+    def test_apply(self):
+        """Test that blocking is installed through DevTools and skipped when there is nothing to block"""
+        driver = MagicMock()
+        self.assertTrue(ResourcePolicy(block_types=['font']).apply(driver))
+        driver.execute_cdp_cmd.assert_any_call('Network.setBlockedURLs', {'urls': ResourcePolicy(block_types=['font']).blocked_patterns()})
+
+        driver = MagicMock()
+        self.assertFalse(ResourcePolicy.from_profile('none').apply(driver))
+        driver.execute_cdp_cmd.assert_not_called()
+
+        with self.assertRaises(ValueError):
+            ResourcePolicy(block_types=['script'])
+        with self.assertRaises(ValueError):
+            ResourcePolicy.from_profile('everything')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.scrolling import AdaptiveScroller
+
+def feed_driver(loads, pending_checks=0):
+    """
+    Build a fake driver for a page that grows on each of its first loads scrolls
+
+    Args:
+        loads: Number of scrolls that add content
+        pending_checks: Size checks after each scroll that report a request still in flight
+    """
+    page = {'height': 1000, 'elements': 100, 'loads': loads, 'checks': 0}
+
+    def execute_script(script, scroll):
+        if scroll:
+            page['checks'] = 0
+            if page['loads']:
+                page['loads'] -= 1
+                page['height'] += 1000
+                page['elements'] += 50
+        else:
+            page['checks'] += 1
+        pending = 1 if page['checks'] < pending_checks else 0
+        return {'height': page['height'], 'elements': page['elements'], 'pending': pending}
+
+    driver = MagicMock()
+    driver.execute_script.side_effect = execute_script
+    return driver
+
+class TestAdaptiveScroller(unittest.TestCase):
+    """Tests for the AdaptiveScroller class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.scroller = AdaptiveScroller(settle=0.05, max_settle=0.3, poll_interval=0.01)
+
+    def test_static_page_scrolled_once(self):
+        """Test that a page without lazy content stops after one scroll"""
+        driver = feed_driver(loads=0)
+        self.assertEqual(self.scroller.scroll(driver, 'docs.example'), 0)
+        scrolls = [call for call in driver.execute_script.call_args_list if call.args[1]]
+        self.assertEqual(len(scrolls), 1)
+
+    def test_feed_scrolled_until_plateau(self):
+        """Test that a growing page is scrolled until it stops growing and stats are kept"""
+        self.assertEqual(self.scroller.scroll(feed_driver(loads=4), 'feed.example'), 4)
+        self.scroller.scroll(feed_driver(loads=0), 'feed.example')
+        self.assertEqual(self.scroller.stats('feed.example'),
+                         {'pages': 2, 'scrolls': 4, 'max_scrolls': 4, 'grown': 1})
+        self.assertEqual(self.scroller.stats('other.example'), {})
+
+    def test_budget_limits_scrolls(self):
+        """Test that an endless feed stops at the scroll budget"""
+        scroller = AdaptiveScroller(max_scrolls=5, settle=0.05, poll_interval=0.01)
+        self.assertEqual(scroller.scroll(feed_driver(loads=100)), 5)
+
+    def test_waits_longer_for_requests_in_flight(self):
+        """Test that a scroll with a request still in flight gets more time to settle"""
+        driver = feed_driver(loads=0, pending_checks=10)
+        self.scroller.scroll(driver)
+        # The static page would stop after about 5 checks without the request in flight
+        self.assertGreaterEqual(driver.execute_script.call_count, 12)
+
+if __name__ == '__main__':
+    unittest.main()
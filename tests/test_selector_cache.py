@@ -0,0 +1,73 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui import selector_cache as selector_cache_module
+from webscraperui.selector_cache import SelectorCache, selector_for
+from webscraperui.parsing import make_soup
+
+def doc_page(topic, container='<div class="body" role="main">'):
+    """Build a documentation page with a sidebar and one main container"""
+    paragraphs = ''.join(
+        f'<p>The {topic} module, part {i}, documents its functions, classes and options in detail.</p>'
+        for i in range(4)
+    )
+    return (f'<html><body><div class="sphinxsidebar"><a href="index.html">Index</a></div>'
+            f'<div class="document">{container}<h1>{topic}</h1>{paragraphs}</div></div></body></html>')
+
+class TestSelectorCache(unittest.TestCase):
+    """Tests for the SelectorCache class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'selectors.json')
+
+    def tearDown(self):
+        """Clean up after tests"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_selector_for_is_unique(self):
+        """Test that the selector built for an element finds that element first"""
+        soup = make_soup('<div class="a"></div><div class="a b" id="x-1"></div><div class="a"></div><main></main>')
+        divs = soup.find_all('div')
+        self.assertEqual(selector_for(soup, divs[0]), 'div.a')
+        self.assertEqual(selector_for(soup, divs[1]), '#x-1')
+        self.assertEqual(selector_for(soup, soup.main), 'main')
+        self.assertIsNone(selector_for(soup, divs[2]))
+
+    def test_learned_selector_used_first(self):
+        """Test that later pages of a domain skip scoring and count hits"""
+        cache = SelectorCache(self.path)
+        first = make_soup(doc_page('json'))
+        self.assertEqual(cache.find(first, 'docs.example').get('class'), ['body'])
+        self.assertEqual(cache.stats('docs.example')['selector'], "div[role='main']")
+
+        with patch.object(selector_cache_module, 'find_main_content') as find_main_content:
+            node = cache.find(make_soup(doc_page('csv')), 'docs.example')
+        find_main_content.assert_not_called()
+        self.assertIn('The csv module', node.get_text())
+        self.assertEqual(cache.stats('docs.example')['hits'], 1)
+
+        # The map survives a restart
+        cache.save()
+        self.assertEqual(SelectorCache(self.path).stats('docs.example')['hits'], 1)
+
+    def test_miss_relearns(self):
+        """Test that a selector that stops matching is learned again"""
+        cache = SelectorCache(self.path)
+        cache.find(make_soup(doc_page('json')), 'docs.example')
+        node = cache.find(make_soup(doc_page('csv', container='<div id="content">')), 'docs.example')
+        self.assertEqual(node.get('id'), 'content')
+
+        stats = cache.stats('docs.example')
+        self.assertEqual((stats['selector'], stats['misses'], stats['learned']), ('#content', 1, 2))
+
+if __name__ == '__main__':
+    unittest.main()
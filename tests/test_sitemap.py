@@ -0,0 +1,165 @@
+import unittest
+import os
+import sys
+import gzip
+import shutil
+import tempfile
+import threading
+from unittest.mock import MagicMock, patch
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.scraper import WebScraper
+from webscraperui.sitemap import SiteDiscovery, _sitemap_chunks
+
+SITEMAP_NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests.Response"""
+
+    def __init__(self, status_code, body=b''):
+        self.status_code = status_code
+        self.headers = {}
+        self.text = body.decode('utf-8', errors='replace')
+        self.body = body
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), 7):
+            yield self.body[start:start + 7]
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+class TestSiteDiscovery(unittest.TestCase):
+    """Tests for the SiteDiscovery class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.temp_dir = tempfile.mkdtemp()
+        pages = ''.join(
+            f'<url><loc>https://docs.example/en/latest/page{i}.html</loc></url>' for i in range(3)
+        )
+        self.responses = {
+            'https://docs.example/robots.txt': FakeResponse(200, (
+                'User-agent: *\n'
+                'Crawl-delay: 2\n'
+                'Disallow: /en/latest/private\n'
+                'Sitemap: https://docs.example/sitemap_index.xml\n'
+            ).encode('utf-8')),
+            'https://docs.example/sitemap_index.xml': FakeResponse(200, (
+                f'<?xml version="1.0"?><sitemapindex {SITEMAP_NS}>'
+                '<sitemap><loc>https://docs.example/pages.xml.gz</loc></sitemap>'
+                '</sitemapindex>'
+            ).encode('utf-8')),
+            'https://docs.example/pages.xml.gz': FakeResponse(200, gzip.compress((
+                f'<?xml version="1.0"?><urlset {SITEMAP_NS}>{pages}'
+                '<url><loc>https://docs.example/en/latest/private/secret.html</loc></url>'
+                '<url><loc>https://docs.example/en/stable/page0.html</loc><lastmod>2024-01-01</lastmod></url>'
+                '</urlset>'
+            ).encode('utf-8')))
+        }
+        self.session_manager = MagicMock()
+        self.session_manager.get.side_effect = lambda url, **kwargs: self.responses.get(url, FakeResponse(404))
+        self.scheduler = MagicMock()
+        self.scheduler.default_rate = 2.0
+        self.discovery = SiteDiscovery(self.temp_dir, session_manager=self.session_manager, scheduler=self.scheduler)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_nested_gzipped_sitemaps(self):
+        """Test that sitemap indexes and gzipped sitemaps are followed"""
+        site = self.discovery.discover('https://docs.example/en/latest/')
+        self.assertEqual(len(site['urls']), 5)
+        self.assertEqual(site['urls'][-1], {'url': 'https://docs.example/en/stable/page0.html', 'lastmod': '2024-01-01'})
+        self.assertEqual(site['crawl_delay'], 2)
+
+    def test_crawl_delay_applied(self):
+        """Test that Crawl-delay slows the host down in the scheduler"""
+        self.discovery.discover('https://docs.example/')
+        self.scheduler.set_host_rate.assert_called_with('docs.example', 0.5, burst=1)
+
+    def test_seed_urls_respect_prefix_and_robots(self):
+        """Test that seeds stay under the base directory and skip disallowed paths"""
+        urls = self.discovery.seed_urls('https://docs.example/en/latest/index.html')
+        self.assertEqual(urls, [f'https://docs.example/en/latest/page{i}.html' for i in range(3)])
+        self.assertFalse(self.discovery.can_fetch('https://docs.example/en/latest/private/secret.html'))
+
+        links = self.discovery.doc_links('https://docs.example/en/latest/', limit=1)
+        self.assertEqual(links, [{'url': 'https://docs.example/en/latest/page0.html', 'text': 'page0'}])
+
+    def test_limited_crawl_skips_sitemap_seeds(self):
+        """Test that a scraper limited like the browser path follows page links only, within robots.txt"""
+        index = ('<html><body><a href="page0.html">Page 0</a><a href="private/secret.html">Secret</a>'
+                 '<a href="page1.html">Page 1</a></body></html>')
+        for i in range(3):
+            self.responses[f'https://docs.example/en/latest/page{i}.html'] = FakeResponse(
+                200, f'<html><body><p>Page {i}</p></body></html>'.encode('utf-8'))
+        scraper = WebScraper(output_folder=self.temp_dir, session_manager=self.session_manager,
+                             scheduler=self.scheduler, use_cache=False, site_discovery=self.discovery,
+                             fault_handler=MagicMock(call=lambda url, func: func()))
+        limited = scraper.with_limits(max_pages=10, max_links_per_page=1, seed_sitemaps=False)
+        self.assertEqual((scraper.max_pages, scraper.seed_sitemaps), (100, True))
+
+        result = limited.scrape('https://docs.example/en/latest/index.html', depth=2, html=index)
+        self.assertEqual(result['status'], 'success')
+        fetched = [call.args[0] for call in self.session_manager.get.call_args_list]
+        self.assertIn('https://docs.example/en/latest/page0.html', fetched)
+        self.assertNotIn('https://docs.example/en/latest/page1.html', fetched)
+        self.assertNotIn('https://docs.example/en/latest/page2.html', fetched)
+        self.assertNotIn('https://docs.example/en/latest/private/secret.html', fetched)
+
+    def test_result_is_cached(self):
+        """Test that a second discovery is served from the cache"""
+        self.discovery.discover('https://docs.example/')
+        calls = self.session_manager.get.call_count
+
+        other = SiteDiscovery(self.temp_dir, session_manager=self.session_manager, scheduler=self.scheduler)
+        site = other.discover('https://DOCS.example/en/')
+        self.assertEqual(self.session_manager.get.call_count, calls)
+        self.assertEqual(len(site['urls']), 5)
+        self.assertFalse(other.can_fetch('https://docs.example/en/latest/private/x.html'))
+
+    def test_gzip_tail_is_flushed(self):
+        """Test that output the decompressor still holds after the last chunk is not dropped"""
+        decompressor = MagicMock()
+        decompressor.decompress.side_effect = lambda chunk: b'<'
+        decompressor.flush.return_value = b'/urlset>'
+        with patch('webscraperui.sitemap.zlib.decompressobj', return_value=decompressor):
+            data = b''.join(_sitemap_chunks(FakeResponse(200, b'\x1f\x8b' + b'x' * 5)))
+        self.assertEqual(data, b'</urlset>')
+
+    def test_concurrent_discoveries(self):
+        """Test that overlapping discoveries each write their own temp file and leave a whole cache"""
+        errors = []
+
+        def discover():
+            try:
+                for _ in range(10):
+                    self.discovery.discover('https://docs.example/', refresh=True)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=discover) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual([name for name in os.listdir(self.temp_dir) if name.endswith('.tmp')], [])
+        self.assertEqual(len(self.discovery.discover('https://docs.example/')['urls']), 5)
+
+    def test_missing_sitemap(self):
+        """Test that a site without robots.txt or sitemap yields no URLs"""
+        site = self.discovery.discover('https://other.example/')
+        self.assertEqual(site['urls'], [])
+        self.assertTrue(self.discovery.can_fetch('https://other.example/anything'))
+
+if __name__ == '__main__':
+    unittest.main()
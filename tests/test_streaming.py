@@ -0,0 +1,106 @@
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+from unittest.mock import MagicMock
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.streaming import StreamingHTMLParser, stream_html
+from webscraperui.scraper import WebScraper
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests.Response"""
+
+    def __init__(self, body, encoding='utf-8', chunk=5):
+        self.status_code = 200
+        self.headers = {}
+        self.encoding = encoding
+        self.body = body
+        self.chunk = chunk
+        self.chunks_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), self.chunk):
+            self.chunks_read += 1
+            yield self.body[start:start + self.chunk]
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+class TestStreaming(unittest.TestCase):
+    """Tests for the streaming HTML reader"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.html = ('<html><head><title>Café</title></head><body><h1>API <em>Reference</em></h1>'
+                     '<a href="/a.html">Module <b>A</b></a><a href="#top">Top</a>'
+                     '<h2>Näive</h2><a href="b.html">B</a></body></html>')
+
+    def test_links_reported_while_feeding(self):
+        """Test that links and headings are reported as soon as they are closed"""
+        seen = []
+        parser = StreamingHTMLParser('https://docs.example/en/', on_link=seen.append)
+        parser.feed(self.html[:self.html.index('<h2>')])
+        self.assertEqual(seen, [{'text': 'Module A', 'href': 'https://docs.example/a.html'}])
+
+        parser.feed(self.html[self.html.index('<h2>'):])
+        parser.close()
+        self.assertEqual([link['href'] for link in parser.links],
+                         ['https://docs.example/a.html', 'https://docs.example/en/b.html'])
+        self.assertEqual(parser.headings, [{'level': 1, 'text': 'API Reference'}, {'level': 2, 'text': 'Näive'}])
+
+    def test_stream_decodes_split_characters(self):
+        """Test that multi-byte characters split across chunks are decoded"""
+        response = FakeResponse(self.html.encode('utf-8'), chunk=3)
+        links = []
+        html, truncated, parser = stream_html(response, 'https://docs.example/', on_link=links.append)
+        self.assertEqual(html, self.html)
+        self.assertFalse(truncated)
+        self.assertTrue(response.closed)
+        self.assertEqual(len(links), 2)
+        self.assertEqual(parser.headings[1]['text'], 'Näive')
+
+    def test_stream_without_callbacks_skips_tokenizing(self):
+        """Test that a body nobody listens to is read without being parsed"""
+        response = FakeResponse(self.html.encode('utf-8'), chunk=16)
+        html, truncated, parser = stream_html(response, 'https://docs.example/')
+        self.assertEqual(html, self.html)
+        self.assertEqual((parser.links, parser.headings), ([], []))
+
+    def test_body_limit_stops_download(self):
+        """Test that reading stops at the body size limit"""
+        body = self.html.encode('utf-8') * 100
+        response = FakeResponse(body, chunk=64)
+        html, truncated, _ = stream_html(response, 'https://docs.example/', max_bytes=256)
+        self.assertTrue(truncated)
+        self.assertEqual(len(html.encode('utf-8', errors='replace')), 256)
+        self.assertLessEqual(response.chunks_read, 5)
+        self.assertTrue(response.closed)
+
+    def test_scraper_streams_pages(self):
+        """Test that a streaming scraper reads and caches page bodies"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            session_manager = MagicMock()
+            response = FakeResponse(self.html.encode('utf-8'))
+            response.headers = {'ETag': '"v1"'}
+            session_manager.get.return_value = response
+            scraper = WebScraper(output_folder=temp_dir, session_manager=session_manager,
+                                 scheduler=MagicMock(), fault_handler=MagicMock(call=lambda url, func: func()),
+                                 stream=True)
+
+            self.assertEqual(scraper._fetch_content('https://docs.example/'), self.html)
+            self.assertEqual(session_manager.get.call_args[1]['stream'], True)
+            self.assertEqual(scraper.http_cache.read_body(scraper.http_cache.get('https://docs.example/')), self.html)
+        finally:
+            shutil.rmtree(temp_dir)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from webscraperui.url_utils import canonicalize_url, normalize_url, BloomFilter, VisitedURLSet
+from webscraperui.link_extractor import LinkExtractor
+
+class TestCanonicalizeURL(unittest.TestCase):
+    """Tests for URL canonicalization"""
+
+    def test_equivalent_spellings(self):
+        """Test that trivially different spellings share one canonical form"""
+        expected = 'https://example.com/docs?a=1&b=2'
+        for url in [
+            'https://example.com/docs?a=1&b=2',
+            'HTTPS://Example.COM/docs?b=2&a=1',
+            'https://example.com:443/docs/?a=1&b=2',
+            'https://example.com/docs/index.html?a=1&b=2#section',
+            'https://example.com/docs?a=1&b=2&utm_source=feed',
+        ]:
+            self.assertEqual(canonicalize_url(url), expected, url)
+
+    def test_root_and_relative(self):
+        """Test the root path and resolution against a base URL"""
+        self.assertEqual(canonicalize_url('http://example.com'), 'http://example.com/')
+        self.assertEqual(canonicalize_url('http://example.com/index.htm'), 'http://example.com/')
+        self.assertEqual(canonicalize_url('../b.html', 'http://example.com/a/c/'), 'http://example.com/a/b.html')
+        self.assertEqual(canonicalize_url('http://example.com:8080/'), 'http://example.com:8080/')
+
+    def test_non_http_untouched(self):
+        """Test that non-HTTP URLs are returned as-is"""
+        self.assertEqual(canonicalize_url('mailto:Someone@Example.com'), 'mailto:Someone@Example.com')
+
+    def test_normalize_keeps_fetchable_path(self):
+        """Test that normalize_url keeps the path and query as written"""
+        self.assertEqual(
+            normalize_url('HTTP://Example.com:80/docs/?b=2&a=1#top'),
+            'http://example.com/docs/?b=2&a=1'
+        )
+
+    def test_ipv6_host_keeps_brackets(self):
+        """Test that IPv6 literal hosts stay bracketed so the URL can be fetched"""
+        self.assertEqual(normalize_url('http://[::1]:8080/docs/'), 'http://[::1]:8080/docs/')
+        self.assertEqual(canonicalize_url('https://[2001:DB8::1]:443/docs/'), 'https://[2001:db8::1]/docs')
+
+class TestVisitedURLSet(unittest.TestCase):
+    """Tests for the BloomFilter and VisitedURLSet classes"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up after tests"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_bloom_filter_membership(self):
+        """Test that added items are found and the false-positive rate is low"""
+        bloom = BloomFilter(1000, error_rate=0.001)
+        for i in range(1000):
+            bloom.add(f'https://example.com/{i}')
+        self.assertTrue(all(f'https://example.com/{i}' in bloom for i in range(1000)))
+        false_positives = sum(f'https://other.example/{i}' in bloom for i in range(10000))
+        self.assertLess(false_positives, 50)
+
+    def test_add_reports_new_urls(self):
+        """Test that other spellings of a visited URL are recognized"""
+        visited = VisitedURLSet()
+        self.assertTrue(visited.add('https://example.com/docs/'))
+        self.assertFalse(visited.add('https://EXAMPLE.com/docs#install'))
+        self.assertIn('https://example.com/docs/index.html', visited)
+        self.assertEqual(len(visited), 1)
+
+    def test_spills_to_disk(self):
+        """Test that the set moves to memory-mapped Bloom filters past its exact limit"""
+        visited = VisitedURLSet(exact_limit=10, spill_dir=self.temp_dir)
+        urls = [f'https://example.com/page{i}' for i in range(100)]
+        visited.update(urls)
+        self.assertTrue(all(url in visited for url in urls))
+        self.assertEqual(len(visited), 100)
+        self.assertTrue(any(name.endswith('.bloom') for name in os.listdir(self.temp_dir)))
+
+        visited.close()
+        self.assertFalse(any(name.endswith('.bloom') for name in os.listdir(self.temp_dir)))
+
+    def test_link_extractor_dedup(self):
+        """Test that LinkExtractor keeps one link per canonical URL"""
+        links = LinkExtractor().make_links_absolute([
+            {'url': 'guide.html', 'text': 'Guide'},
+            {'url': 'guide.html#install', 'text': 'Install'},
+            {'url': 'https://Example.com/docs/guide.html', 'text': 'Guide again'}
+        ], 'https://example.com/docs/')
+        self.assertEqual(links, [{'url': 'https://example.com/docs/guide.html', 'text': 'Guide'}])
+
+if __name__ == '__main__':
+    unittest.main()
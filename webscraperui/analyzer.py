@@ -4,7 +4,7 @@ Content Analyzer module for the WebScraperUI application
 import re
 import logging
 from collections import Counter
-from bs4 import BeautifulSoup
+from webscraperui.document import parse_document
 
 logger = logging.getLogger(__name__)
 
@@ -119,11 +119,12 @@ class ContentAnalyzer:
         Returns:
             dict: Analysis results
         """
-        # Parse HTML
-        soup = BeautifulSoup(html, "html.parser")
+        # Parse HTML, reusing the tree if another stage already parsed this page
+        document = parse_document(html)
+        soup = document.soup
         
         # Extract text content
-        text = soup.get_text(separator=" ", strip=True)
+        text = document.text
         
         # Perform text analysis
         results = self.analyze_text(text)
@@ -5,14 +5,25 @@ import os
 import logging
 import datetime
 import json
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, send_file
 from werkzeug.utils import secure_filename
 
 from webscraperui.scraper import WebScraper
 from webscraperui.enhanced_scraper import EnhancedWebScraper
 from webscraperui.link_extractor import LinkExtractor
+from webscraperui.document import parse_document
 from webscraperui.doc_combiner import DocumentCombiner
+from webscraperui.hybrid import HybridScraper
+from webscraperui.checkpoint import CheckpointStore, CrawlCheckpoint
+from webscraperui.dedup import NearDuplicateIndex
+from webscraperui.politeness import configure_scheduler
+from webscraperui.resilience import configure_fault_handler
+from webscraperui.readiness import ReadinessPolicy
+from webscraperui.resource_policy import ResourcePolicy
+from webscraperui.selector_cache import SelectorCache
+from webscraperui.sitemap import SiteDiscovery
+from webscraperui.url_utils import normalize_url
 # Import the PDF Extractor
 from pdf_extractor import PDFExtractor
 
@@ -41,10 +52,100 @@ app.config['OUTPUT_FOLDER'] = output_folder
 if not os.path.exists(app.config['OUTPUT_FOLDER']):
     os.makedirs(app.config['OUTPUT_FOLDER'])
 
+# Per-host crawl pacing shared by both scrapers and the batch routes
+app.config['CRAWL_RATE'] = float(os.environ.get('CRAWL_RATE', 2.0))
+app.config['CRAWL_BURST'] = int(os.environ.get('CRAWL_BURST', 4))
+crawl_scheduler = configure_scheduler(
+    default_rate=app.config['CRAWL_RATE'],
+    burst=app.config['CRAWL_BURST']
+)
+
+# Retries and per-host circuit breakers shared by both scrapers and the batch routes
+app.config['CIRCUIT_FAILURE_THRESHOLD'] = int(os.environ.get('CIRCUIT_FAILURE_THRESHOLD', 3))
+app.config['CIRCUIT_RESET_TIMEOUT'] = float(os.environ.get('CIRCUIT_RESET_TIMEOUT', 60))
+fault_handler = configure_fault_handler(
+    failure_threshold=app.config['CIRCUIT_FAILURE_THRESHOLD'],
+    reset_timeout=app.config['CIRCUIT_RESET_TIMEOUT']
+)
+
+# robots.txt and sitemap discovery, cached per site
+site_discovery = SiteDiscovery(
+    os.path.join(app.config['OUTPUT_FOLDER'], '.sitemaps'),
+    scheduler=crawl_scheduler
+)
+
+# Fingerprints of scraped pages, shared so near-duplicates are skipped across scrapers
+page_index = NearDuplicateIndex()
+
+# Main content selectors learned per domain, shared by the scrapers and the combiner
+selector_cache = SelectorCache(os.path.join(app.config['OUTPUT_FOLDER'], '.selectors', 'selectors.json'))
+
+# Streamed downloads cap the body read per page (0: no cap)
+app.config['STREAM_FETCH'] = os.environ.get('STREAM_FETCH', '1') == '1'
+app.config['MAX_BODY_BYTES'] = int(os.environ.get('MAX_BODY_BYTES', 20 * 1024 * 1024))
+
+# When a rendered page counts as ready: document state, network and DOM quiet periods
+# (seconds) and an optional selector; the routes' wait times are the ceilings
+app.config['PAGE_READY_STATE'] = os.environ.get('PAGE_READY_STATE', 'interactive')
+app.config['PAGE_NETWORK_IDLE'] = float(os.environ.get('PAGE_NETWORK_IDLE', 0.5))
+app.config['PAGE_DOM_QUIET'] = float(os.environ.get('PAGE_DOM_QUIET', 0.3))
+app.config['PAGE_READY_SELECTOR'] = os.environ.get('PAGE_READY_SELECTOR') or None
+page_readiness = ReadinessPolicy(
+    ready_state=app.config['PAGE_READY_STATE'],
+    network_idle=app.config['PAGE_NETWORK_IDLE'],
+    dom_quiet=app.config['PAGE_DOM_QUIET'],
+    selector=app.config['PAGE_READY_SELECTOR']
+)
+
+# Pages the batch routes render at once, as tabs of one browser
+app.config['RENDER_TABS'] = int(os.environ.get('RENDER_TABS', 4))
+
+# Linked pages a deep crawl renders at once, spread over the pooled browser sessions
+app.config['CRAWL_CONCURRENCY'] = int(os.environ.get('CRAWL_CONCURRENCY', 4))
+
+# Requests blocked while rendering: a named profile (none, trackers, docs) plus
+# comma-separated hosts to block or to always allow
+app.config['RESOURCE_PROFILE'] = os.environ.get('RESOURCE_PROFILE', 'docs')
+app.config['RESOURCE_DENY_DOMAINS'] = [d for d in os.environ.get('RESOURCE_DENY_DOMAINS', '').split(',') if d]
+app.config['RESOURCE_ALLOW_DOMAINS'] = [d for d in os.environ.get('RESOURCE_ALLOW_DOMAINS', '').split(',') if d]
+resource_policy = ResourcePolicy.from_profile(
+    app.config['RESOURCE_PROFILE'],
+    deny_domains=app.config['RESOURCE_DENY_DOMAINS'],
+    allow_domains=app.config['RESOURCE_ALLOW_DOMAINS']
+)
+
 # Initialize scrapers
-scraper = WebScraper(output_folder=app.config['OUTPUT_FOLDER'])
+scraper = WebScraper(output_folder=app.config['OUTPUT_FOLDER'], crawl_mode='async',
+                     site_discovery=site_discovery, near_duplicates=page_index,
+                     stream=app.config['STREAM_FETCH'],
+                     max_body_bytes=app.config['MAX_BODY_BYTES'] or None,
+                     selector_cache=selector_cache)
 enhanced_scraper = None  # We'll initialize it on demand to avoid loading Selenium unnecessarily
 
+def get_enhanced_scraper():
+    """Get the enhanced scraper, creating it on first use"""
+    global enhanced_scraper
+    if enhanced_scraper is None:
+        enhanced_scraper = EnhancedWebScraper(output_folder=app.config['OUTPUT_FOLDER'], near_duplicates=page_index,
+                                              selector_cache=selector_cache, readiness=page_readiness,
+                                              resource_policy=resource_policy,
+                                              crawl_concurrency=app.config['CRAWL_CONCURRENCY'])
+    return enhanced_scraper
+
+# The documentation routes fetch pages with plain HTTP first and render only those
+# that need JavaScript ("hybrid"), or always render them ("browser"). Static pages
+# follow at most 10 same-site links without sitemap seeding, like the browser path
+app.config['FETCH_MODE'] = os.environ.get('FETCH_MODE', 'hybrid')
+doc_static_scraper = scraper.with_limits(max_pages=10, max_links_per_page=10, seed_sitemaps=False)
+hybrid_scraper = HybridScraper(doc_static_scraper, get_enhanced_scraper,
+                               os.path.join(app.config['OUTPUT_FOLDER'], '.fetch_modes', 'fetch_modes.json'))
+
+def get_doc_scraper():
+    """Get the scraper used by the documentation routes"""
+    if app.config['FETCH_MODE'] == 'browser':
+        return get_enhanced_scraper()
+    return hybrid_scraper
+
 @app.route('/')
 def index():
     """Render the merged main page with tabs for different scraping modes"""
@@ -105,13 +206,8 @@ def scrape():
             
             # If not a PDF, use the appropriate web scraper
             if scraper_type == 'enhanced':
-                # Initialize enhanced scraper if needed
-                global enhanced_scraper
-                if enhanced_scraper is None:
-                    enhanced_scraper = EnhancedWebScraper(output_folder=app.config['OUTPUT_FOLDER'])
-                
-                # Run the enhanced scraper
-                result = enhanced_scraper.scrape(
+                # Run the enhanced scraper (started on first use)
+                result = get_enhanced_scraper().scrape(
                     url, 
                     depth=depth, 
                     output_format=output_format,
@@ -125,7 +221,12 @@ def scrape():
             # Store the result in session for display
             session['result'] = result
             
-            flash('Scraping completed successfully', 'success')
+            # A near-duplicate is neither saved again nor crawled from
+            if result.get('status') == 'duplicate':
+                flash(f"{url} is a near-duplicate of {result['duplicate_of']}, so it was not saved again"
+                      + (" and its links were not crawled" if depth > 1 else ''), 'warning')
+            else:
+                flash('Scraping completed successfully', 'success')
             return render_template('results_enhanced.html', result=result)
             
         except Exception as e:
@@ -199,6 +300,9 @@ def history():
     try:
         files = []
         for filename in os.listdir(app.config['OUTPUT_FOLDER']):
+            # Dotfiles are scraper state, not scraped pages
+            if filename.startswith('.'):
+                continue
             if os.path.isfile(os.path.join(app.config['OUTPUT_FOLDER'], filename)):
                 files.append({
                     'name': filename,
@@ -246,26 +350,28 @@ def extract_doc_links():
             # Initialize the link extractor
             extractor = LinkExtractor()
             
-            # Initialize the appropriate scraper
-            global enhanced_scraper
-            if enhanced_scraper is None:
-                enhanced_scraper = EnhancedWebScraper(output_folder=app.config['OUTPUT_FOLDER'])
+            # Detect if this is a ReadTheDocs site or similar documentation platform
+            is_readthedocs = 'readthedocs.io' in url.lower()
             
-            # Get the HTML content from the URL
-            result = enhanced_scraper.get_html_content(url)
-            html_content = result.get('html', '')
+            # Get the HTML content from the URL, rendering it only if the static page is a JavaScript shell
+            try:
+                result = get_doc_scraper().get_html_content(url)
+                html_content = result.get('html', '')
+            except Exception as e:
+                logger.warning(f"Could not fetch {url}: {str(e)}")
+                html_content = ''
             
-            if not html_content:
+            # The site's sitemap lists pages the navigation may not link to
+            sitemap_links = site_discovery.doc_links(url)
+            
+            if not html_content and not sitemap_links:
                 flash('Failed to retrieve content from the URL', 'error')
                 return redirect(url_for('index', tab='doc-links'))
             
-            # Detect if this is a ReadTheDocs site or similar documentation platform
-            is_readthedocs = 'readthedocs.io' in url.lower()
-            
             links = []
             
             # Extract links with specialized handling for documentation sites
-            if is_readthedocs:
+            if html_content and is_readthedocs:
                 logger.info("Detected ReadTheDocs site, using specialized extraction")
                 # Get module links specifically for ReadTheDocs
                 module_links = extractor.extract_readthedocs_modules(url, html_content)
@@ -275,19 +381,14 @@ def extract_doc_links():
                 regular_links = extractor.make_links_absolute(regular_links, url)
                 
                 # Combine links, prioritizing the specialized module links
-                seen_urls = set(link['url'] for link in module_links)
-                for link in regular_links:
-                    if link['url'] not in seen_urls:
-                        module_links.append(link)
-                
-                links = module_links
-            else:
+                links = extractor.dedupe_links(module_links + regular_links)
+            elif html_content:
                 # Extract links normally for non-ReadTheDocs sites
                 links = extractor.extract_links_from_html(html_content)
                 links = extractor.make_links_absolute(links, url)
             
             # Filter links to the same domain (avoid external links)
-            base_domain = urlparse(url).netloc
+            base_domain = urlparse(normalize_url(url)).netloc
             links = [link for link in links if urlparse(link['url']).netloc == base_domain]
             
             # Filter links if a pattern is specified
@@ -300,11 +401,11 @@ def extract_doc_links():
             # If there are too few links categorized as modules or submodules,
             # check if we might have missed them and try harder
             total_modules = len(structure['modules']) + len(structure['submodules'])
-            if is_readthedocs and total_modules < 3:
+            if is_readthedocs and html_content and total_modules < 3:
                 logger.info("Few modules found, trying deeper extraction")
                 # Try to find module links in the sidebar or navigation
                 sidebar_links = []
-                soup = BeautifulSoup(html_content, 'html.parser')
+                soup = parse_document(html_content, url).soup
                 
                 # Check sidebar navigation (common in ReadTheDocs)
                 sidebar = soup.find('div', class_='sphinxsidebar') or soup.find('div', class_='sidebar')
@@ -322,13 +423,20 @@ def extract_doc_links():
                             })
                 
                 # Add these links to our collection
-                for link in sidebar_links:
-                    if link['url'] not in [l['url'] for l in links]:
-                        links.append(link)
+                links = extractor.dedupe_links(links + sidebar_links)
                 
                 # Recategorize
                 structure = extractor.get_doc_structure(links)
             
+            # Keep the navigation's order and link text, adding sitemap pages it missed at the end
+            if filter_pattern:
+                sitemap_links = extractor.filter_links_by_pattern(sitemap_links, filter_pattern)
+            if sitemap_links:
+                nav_count = len(links)
+                links = extractor.dedupe_links(links + sitemap_links)
+                logger.info(f"Added {len(links) - nav_count} sitemap entries to {nav_count} links found on {url}")
+                structure = extractor.get_doc_structure(links)
+            
             # Limit the number of links per category
             max_per_category = max(3, max_links // 4)  # At least 3 per category
             for category in structure:
@@ -391,10 +499,8 @@ def scrape_link():
         return redirect(url_for('index', tab='doc-links'))
     
     try:
-        # Use the enhanced scraper for better compatibility
-        global enhanced_scraper
-        if enhanced_scraper is None:
-            enhanced_scraper = EnhancedWebScraper(output_folder=app.config['OUTPUT_FOLDER'])
+        # Fetch statically first and render only JavaScript-built pages
+        doc_scraper = get_doc_scraper()
         
         # Detect if this is a ReadTheDocs site for specialized handling
         is_readthedocs = 'readthedocs.io' in url.lower()
@@ -406,7 +512,7 @@ def scrape_link():
         wait_time = 8 if is_readthedocs else 5
         
         # Scrape the URL with optimized parameters
-        result = enhanced_scraper.scrape(
+        result = doc_scraper.scrape(
             url, 
             depth=depth, 
             output_format=output_format,
@@ -414,7 +520,13 @@ def scrape_link():
             wait_time=wait_time
         )
         
-        flash(f'Successfully scraped: {url}', 'success')
+        if result.get('status') == 'duplicate':
+            flash(f"{url} is a near-duplicate of {result['duplicate_of']}, so it was not saved again", 'warning')
+        else:
+            flash(f'Successfully scraped: {url}', 'success')
+        crawl_stats = result.get('crawl_stats')
+        if crawl_stats and crawl_stats['pages']:
+            flash(f"Crawled {crawl_stats['pages']} linked pages at {crawl_stats['pages_per_second']} pages/sec", 'info')
         return render_template('results_improved.html', result=result)
         
     except Exception as e:
@@ -426,6 +538,7 @@ def scrape_link():
 def scrape_all_links():
     """Scrape all links extracted from documentation"""
     output_format = request.args.get('output_format', 'html')
+    resume = request.args.get('resume') == '1'
     
     # Get stored links from session
     doc_links_data = session.get('doc_links', {})
@@ -441,15 +554,16 @@ def scrape_all_links():
         return redirect(url_for('index', tab='doc-links'))
     
     try:
-        # Use the enhanced scraper for better compatibility
-        global enhanced_scraper
-        if enhanced_scraper is None:
-            enhanced_scraper = EnhancedWebScraper(output_folder=app.config['OUTPUT_FOLDER'])
+        # Fetch statically first and render only JavaScript-built pages
+        doc_scraper = get_doc_scraper()
         
         # Create a results summary
         results = []
         scrape_count = 0
         error_count = 0
+        duplicate_count = 0
+        crawl_pages = 0
+        crawl_seconds = 0.0
         
         # Check if this is a documentation site for specialized handling
         base_url = doc_links_data.get('base_url', '')
@@ -484,48 +598,95 @@ def scrape_all_links():
         # For ReadTheDocs sites, we want to get all module documentation
         max_links = min(len(links), 30) if is_readthedocs else min(len(links), 15)
         
-        # Show progress info to user
-        flash(f'Starting batch scrape of {max_links} links. This may take a few minutes...', 'info')
+        # Checkpoint progress after every page so an interrupted batch can be resumed
+        checkpoints = CheckpointStore(os.path.join(app.config['OUTPUT_FOLDER'], '.checkpoints'))
+        checkpoint = CrawlCheckpoint(checkpoints, f"batch:{base_url}:{output_format}", interval=1, resume=resume)
+        if checkpoint.resumed and checkpoint.frontier:
+            batch_links = checkpoint.frontier
+            results = list(checkpoint.results)
+            duplicate_count = sum(1 for item in results if item['status'] == 'duplicate')
+            scrape_count = len(results) - duplicate_count
+            flash(f'Resuming batch scrape: {len(results)} of {len(batch_links)} links already done', 'info')
+        else:
+            batch_links = links[:max_links]
+            checkpoint.set_frontier(batch_links)
+            # Show progress info to user
+            flash(f'Starting batch scrape of {max_links} links. This may take a few minutes...', 'info')
+        max_links = len(batch_links)
+        
+        # For ReadTheDocs, use specialized parameters
+        # Use higher depth for module pages to capture related content
+        depth = 2 if is_readthedocs else 1
         
-        # Scrape each link
-        for i, link in enumerate(links[:max_links]):
-            try:
-                logger.info(f"Scraping link {i+1}/{max_links}: {link['url']}")
-                
-                # For ReadTheDocs, use specialized parameters
-                # Use higher depth for module pages to capture related content
-                depth = 2 if is_readthedocs else 1
-                
-                # Longer wait time for documentation sites with complex JavaScript
-                wait_time = 10 if is_readthedocs else 5
-                
-                # Set scroll to True for all documentation pages to ensure complete content capture
-                scroll = True
-                
-                result = enhanced_scraper.scrape(
-                    link['url'], 
-                    depth=depth, 
-                    output_format=output_format,
-                    scroll=scroll,
-                    wait_time=wait_time
-                )
-                
-                results.append({
-                    'url': link['url'],
-                    'text': link['text'],
-                    'status': 'success',
-                    'file': result.get('output_path', '')
-                })
-                scrape_count += 1
-            except Exception as e:
-                logger.error(f"Error scraping {link['url']}: {str(e)}")
+        # Longer wait time for documentation sites with complex JavaScript
+        wait_time = 10 if is_readthedocs else 5
+        
+        # Set scroll to True for all documentation pages to ensure complete content capture
+        scroll = True
+        
+        link_texts = {}
+        for link in batch_links:
+            if not checkpoint.is_done(link['url']):
+                link_texts.setdefault(link['url'], link['text'])
+        
+        def record_result(url, result):
+            """Add one finished link to the results and the checkpoint"""
+            nonlocal scrape_count, error_count, duplicate_count, crawl_pages, crawl_seconds
+            if result.get('status') == 'error':
                 results.append({
-                    'url': link['url'],
-                    'text': link['text'],
+                    'url': url,
+                    'text': link_texts[url],
                     'status': 'error',
-                    'error': str(e)
+                    'error': result.get('error', '')
                 })
                 error_count += 1
+                checkpoint.update_summary(successful=scrape_count, failed=error_count, duplicates=duplicate_count)
+                return
+            
+            # Rendered deep crawls report how many linked pages they read and how long it took
+            if result.get('crawl_stats'):
+                crawl_pages += result['crawl_stats']['pages']
+                crawl_seconds += result['crawl_stats']['seconds']
+            
+            item = {
+                'url': url,
+                'text': link_texts[url],
+                'status': result.get('status', 'success'),
+                'file': result.get('output_path', '')
+            }
+            # Near-duplicates point at the page they repeat and are left out of combining
+            if item['status'] == 'duplicate':
+                item['duplicate_of'] = result.get('duplicate_of', '')
+                duplicate_count += 1
+            else:
+                scrape_count += 1
+            results.append(item)
+            checkpoint.update_summary(successful=scrape_count, failed=error_count, duplicates=duplicate_count)
+            checkpoint.mark_done(url, result=item, output_path=item['file'])
+        
+        # Fetch the links statically and render the rest in parallel tabs of one browser; page
+        # loads are paced per host by the shared crawl scheduler and hosts that keep failing are skipped
+        logger.info(f"Scraping {len(link_texts)} of {max_links} links, rendering in up to {app.config['RENDER_TABS']} tabs")
+        doc_scraper.scrape_many(
+            list(link_texts),
+            depth=depth,
+            output_format=output_format,
+            scroll=scroll,
+            wait_time=wait_time,
+            resume=resume,
+            tabs=app.config['RENDER_TABS'],
+            on_result=record_result
+        )
+        
+        # Per-host pacing and failure counts go to the log: they cover every host the process
+        # has contacted, which would bloat the cookie-backed session
+        batch_hosts = {urlparse(url).netloc for url in link_texts}
+        for host, stats in crawl_scheduler.host_stats().items():
+            if host in batch_hosts:
+                logger.info(f"Pacing of {host}: {stats}")
+        for host, stats in fault_handler.host_stats().items():
+            if host in batch_hosts:
+                logger.info(f"Failures of {host}: {stats}")
         
         # Create a summary result
         summary = {
@@ -533,16 +694,29 @@ def scrape_all_links():
             'processed_links': max_links,
             'successful': scrape_count,
             'failed': error_count,
+            'duplicates': duplicate_count,
             'results': results,
             'output_format': output_format,
-            'is_readthedocs': is_readthedocs
+            'is_readthedocs': is_readthedocs,
+            'crawl_stats': {
+                'pages': crawl_pages,
+                'seconds': round(crawl_seconds, 3),
+                'pages_per_second': round(crawl_pages / crawl_seconds, 2) if crawl_seconds else 0.0
+            }
         }
         
         # Store the summary in session
         session['scrape_summary'] = summary
         
+        # Keep the checkpoint while links failed so /resume_batch retries only those
+        if error_count:
+            checkpoint.save()
+        else:
+            checkpoint.finish()
+        
         # Show a success message
-        flash(f'Successfully scraped {scrape_count} out of {max_links} links', 'success')
+        flash(f'Successfully scraped {scrape_count} out of {max_links} links'
+              + (f' ({duplicate_count} near-duplicates skipped)' if duplicate_count else ''), 'success')
         
         # Render the batch results template
         return render_template('batch_results.html', result={
@@ -557,6 +731,12 @@ def scrape_all_links():
         flash(f'Error during batch scraping: {str(e)}', 'error')
         return redirect(url_for('index', tab='doc-links'))
 
+@app.route('/resume_batch')
+def resume_batch():
+    """Resume an interrupted batch scrape, skipping links that are already done"""
+    output_format = session.get('doc_links', {}).get('output_format', 'html')
+    return redirect(url_for('scrape_all_links', output_format=output_format, resume='1'))
+
 # Documentation Combination routes
 @app.route('/combine_docs', methods=['GET', 'POST'])
 def combine_docs_page():
@@ -576,7 +756,7 @@ def combine_docs_page():
             file_paths = [os.path.join(app.config['OUTPUT_FOLDER'], filename) for filename in selected_files]
             
             # Initialize the document combiner
-            combiner = DocumentCombiner(output_folder=app.config['OUTPUT_FOLDER'])
+            combiner = DocumentCombiner(output_folder=app.config['OUTPUT_FOLDER'], selector_cache=selector_cache)
             
             # Combine the files
             output_path = combiner.combine_files(file_paths, output_format, title)
@@ -656,7 +836,7 @@ def combine_batch():
             title = "Combined Documentation"
         
         # Initialize the document combiner
-        combiner = DocumentCombiner(output_folder=app.config['OUTPUT_FOLDER'])
+        combiner = DocumentCombiner(output_folder=app.config['OUTPUT_FOLDER'], selector_cache=selector_cache)
         
         # Combine the files
         output_path = combiner.combine_files(file_paths, output_format, title)
@@ -0,0 +1,104 @@
+"""
+Async Crawler module for the WebScraperUI application
+
+Runs many page fetches at once on an asyncio event loop while bounding the
+total number of in-flight requests and the number per host.
+"""
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCrawler:
+    """
+    Concurrent page fetcher with a global and a per-host concurrency limit.
+
+    The fetch callable is a regular blocking function (so it can reuse the
+    pooled requests session); it runs on a dedicated thread pool sized to the
+    global limit while asyncio semaphores decide which URLs may start.
+    """
+
+    def __init__(self, fetch, max_concurrency=8, per_host_concurrency=4, scheduler=None):
+        """
+        Initialize the AsyncCrawler
+
+        Args:
+            fetch: Callable taking a URL and returning the page result
+            max_concurrency: Maximum number of fetches in flight overall
+            per_host_concurrency: Maximum number of fetches in flight per host
+            scheduler: Optional PolitenessScheduler awaited before each fetch
+        """
+        self.fetch = fetch
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.scheduler = scheduler
+
+    async def crawl(self, urls):
+        """
+        Fetch all URLs concurrently
+
+        Args:
+            urls: List of URLs to fetch
+
+        Returns:
+            list: (url, result, error) tuples in the same order as urls
+        """
+        loop = asyncio.get_running_loop()
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits = {}
+
+        def host_limit(url):
+            host = urlparse(url).netloc
+            if host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(self.per_host_concurrency)
+            return host_limits[host]
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                thread_name_prefix="crawler") as executor:
+            async def fetch_one(url):
+                # Take the per-host slot first so one slow host cannot hold global slots
+                async with host_limit(url):
+                    if self.scheduler is not None:
+                        await self.scheduler.wait_async(url)
+                    async with global_limit:
+                        try:
+                            result = await loop.run_in_executor(executor, self.fetch, url)
+                            return url, result, None
+                        except Exception as e:
+                            logger.error(f"Error crawling {url}: {str(e)}")
+                            return url, None, e
+
+            return await asyncio.gather(*(fetch_one(url) for url in urls))
+
+    def run(self, urls):
+        """
+        Fetch all URLs concurrently from synchronous code
+
+        Args:
+            urls: List of URLs to fetch
+
+        Returns:
+            list: (url, result, error) tuples in the same order as urls
+        """
+        if not urls:
+            return []
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.crawl(urls))
+
+        # Called from inside a running loop: run ours on a separate thread
+        outcome = {}
+
+        def runner():
+            outcome["results"] = asyncio.run(self.crawl(urls))
+
+        thread = threading.Thread(target=runner, name="crawler-loop")
+        thread.start()
+        thread.join()
+        return outcome["results"]
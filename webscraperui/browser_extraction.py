@@ -0,0 +1,119 @@
+"""
+In-Browser Extraction module for the WebScraperUI application
+
+Collects a rendered page's title, meta description, links, headings,
+images, tables, code blocks and main content text with one injected
+script, so a page costs a single WebDriver round-trip instead of
+transferring and re-parsing its whole DOM. The main content comes from
+the domain's learned selector, leaving out the same non-text and
+structural tags as content_extractor.content_text.
+"""
+import logging
+
+from webscraperui.content_extractor import IGNORED_TAGS
+
+logger = logging.getLogger(__name__)
+
+# Arguments: learned selector (or null), least main content characters,
+# ignored tags, separator
+EXTRACT_SCRIPT = """
+var selector = arguments[0], minChars = arguments[1], ignored = arguments[2],
+    separator = arguments[3];
+
+function attr(node, name) {
+    var value = node.getAttribute(name);
+    return value === null ? '' : value;
+}
+
+function resolve(value) {
+    try { return new URL(value, document.baseURI).href; } catch (e) { return value; }
+}
+
+var result = {title: null, meta_description: null, links: [], headings: [], images: [],
+              tables: [], code_blocks: [], content: null};
+
+var nodes = document.getElementsByTagName('*');
+for (var i = 0; i < nodes.length; i++) {
+    var node = nodes[i], name = node.localName;
+    if (name === 'a') {
+        var href = node.getAttribute('href');
+        if (href && href.charAt(0) !== '#' && href.indexOf('javascript:') !== 0) {
+            result.links.push({text: node.textContent.trim(), href: resolve(href)});
+        }
+    } else if (/^h[1-6]$/.test(name)) {
+        result.headings.push({level: parseInt(name.charAt(1), 10), text: node.textContent.trim()});
+    } else if (name === 'img') {
+        var src = node.getAttribute('src');
+        if (src) {
+            result.images.push({src: resolve(src), alt: attr(node, 'alt'), title: attr(node, 'title')});
+        }
+    } else if (name === 'code' || name === 'pre') {
+        result.code_blocks.push(node.textContent.trim());
+    } else if (name === 'table') {
+        result.tables.push(node.outerHTML);
+    } else if (name === 'title') {
+        if (result.title === null) { result.title = node.textContent.trim(); }
+    } else if (name === 'meta') {
+        if (result.meta_description === null && node.getAttribute('name') === 'description') {
+            result.meta_description = attr(node, 'content');
+        }
+    }
+}
+
+function collect(node, pieces) {
+    for (var child = node.firstChild; child; child = child.nextSibling) {
+        if (child.nodeType === 1) {
+            if (ignored.indexOf(child.localName) === -1) { collect(child, pieces); }
+        } else if (child.nodeType === 3) {
+            var text = child.nodeValue.trim();
+            if (text) { pieces.push(text); }
+        }
+    }
+}
+
+var main = selector ? document.querySelector(selector) : null;
+if (main) {
+    var chars = 0, walker = document.createTreeWalker(main, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        var parent = walker.currentNode.parentNode.localName;
+        if (parent !== 'script' && parent !== 'style') { chars += walker.currentNode.nodeValue.trim().length; }
+    }
+    if (chars >= minChars) {
+        var pieces = [];
+        collect(main, pieces);
+        result.content = pieces.join(separator);
+    }
+}
+
+return result;
+"""
+
+ELEMENT_KEYS = ("title", "meta_description", "links", "headings", "images", "tables", "code_blocks")
+
+
+def extract_in_browser(driver, selector=None, min_chars=100, separator="\n"):
+    """
+    Extract a rendered page's elements and main content in one script call
+
+    Args:
+        driver: Selenium WebDriver showing the page
+        selector: Learned main content selector of the page's domain
+        min_chars: Least text the selector's element must hold to be used
+        separator: String joining the main content text pieces
+
+    Returns:
+        tuple: (elements, content) where elements has the keys of extraction.extract_elements
+            with tables and code blocks, and content is the main content text or None when the
+            selector is missing or missed; None if the script could not run
+    """
+    try:
+        payload = driver.execute_script(
+            EXTRACT_SCRIPT, selector, min_chars, sorted(IGNORED_TAGS), separator
+        )
+    except Exception as e:
+        logger.warning(f"In-browser extraction failed: {str(e)}")
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    return {key: payload.get(key) for key in ELEMENT_KEYS}, payload.get("content")
@@ -0,0 +1,194 @@
+"""
+Crawl Checkpoint module for the WebScraperUI application
+
+Periodically writes crawl progress to disk so an interrupted crawl or
+batch can be resumed without fetching finished pages again.
+"""
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointStore:
+    """Folder of JSON checkpoint files, one per crawl key"""
+
+    def __init__(self, folder):
+        """
+        Initialize the CheckpointStore
+
+        Args:
+            folder: Folder to keep checkpoint files in
+        """
+        self.folder = folder
+
+        # Create checkpoint folder if it doesn't exist
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+    def _path(self, key):
+        """Get the checkpoint file path for a key"""
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.folder, f"checkpoint_{digest}.json")
+
+    def load(self, key):
+        """
+        Load the checkpoint for a key
+
+        Args:
+            key: Crawl key
+
+        Returns:
+            dict: Saved state, or None if there is no usable checkpoint
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return state if state.get("key") == key else None
+
+    def save(self, key, state):
+        """
+        Atomically write the checkpoint for a key
+
+        Args:
+            key: Crawl key
+            state: JSON-serializable state
+        """
+        state = dict(state, key=key, saved_at=time.time())
+        path = self._path(key)
+        # A temp file per save, so concurrent saves never write into each other's file
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.folder, prefix="checkpoint_",
+                                         suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            try:
+                json.dump(state, f)
+            except Exception:
+                f.close()
+                os.remove(tmp_path)
+                raise
+        os.replace(tmp_path, path)
+
+    def delete(self, key):
+        """
+        Remove the checkpoint for a key
+
+        Args:
+            key: Crawl key
+        """
+        path = self._path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class CrawlCheckpoint:
+    """
+    Progress of one crawl: its frontier, the URLs already done, the output
+    file written for each URL and the partial summary.
+
+    Changes are flushed to the store every `interval` completed URLs.
+    """
+
+    def __init__(self, store, key, interval=5, resume=False):
+        """
+        Initialize the CrawlCheckpoint
+
+        Args:
+            store: CheckpointStore to persist to
+            key: Crawl key (for example the start URL and its parameters)
+            interval: Number of completed URLs between automatic saves
+            resume: Load existing progress for this key instead of starting fresh
+        """
+        self.store = store
+        self.key = key
+        self.interval = max(1, interval)
+        self._lock = threading.Lock()
+        self._unsaved = 0
+
+        state = store.load(key) if resume else None
+        state = state or {}
+        self.frontier = state.get("frontier", [])
+        self.visited = set(state.get("visited", []))
+        self.outputs = state.get("outputs", {})
+        self.results = state.get("results", [])
+        self.summary = state.get("summary", {})
+        self.resumed = bool(state)
+
+        if self.resumed:
+            logger.info(f"Resuming crawl {key} with {len(self.visited)} URLs already done")
+
+    def is_done(self, url):
+        """
+        Check whether a URL was completed before
+
+        Args:
+            url: URL to check
+
+        Returns:
+            bool: True if the URL is already done
+        """
+        return url in self.visited
+
+    def set_frontier(self, urls):
+        """
+        Record the URLs this crawl intends to visit
+
+        Args:
+            urls: List of URLs (or link dicts) still to crawl
+        """
+        with self._lock:
+            self.frontier = list(urls)
+        self.save()
+
+    def mark_done(self, url, result=None, output_path=None):
+        """
+        Record a completed URL and save if the interval is reached
+
+        Args:
+            url: Completed URL
+            result: Optional JSON-serializable per-URL result
+            output_path: Optional path of the file written for the URL
+        """
+        with self._lock:
+            self.visited.add(url)
+            if result is not None:
+                self.results.append(result)
+            if output_path:
+                self.outputs[url] = output_path
+            self._unsaved += 1
+            due = self._unsaved >= self.interval
+        if due:
+            self.save()
+
+    def update_summary(self, **values):
+        """
+        Update the partial summary
+
+        Args:
+            **values: Summary fields to set
+        """
+        with self._lock:
+            self.summary.update(values)
+
+    def save(self):
+        """Write the current progress to the store"""
+        with self._lock:
+            state = {
+                "frontier": list(self.frontier),
+                "visited": sorted(self.visited),
+                "outputs": dict(self.outputs),
+                "results": list(self.results),
+                "summary": dict(self.summary)
+            }
+            self._unsaved = 0
+        self.store.save(self.key, state)
+
+    def finish(self):
+        """Remove the checkpoint once the crawl completed"""
+        self.store.delete(self.key)
@@ -0,0 +1,289 @@
+"""
+Main Content Extraction module for the WebScraperUI application
+
+Finds a page's main content by scoring text blocks by length and link
+density in one pass over the tree, readability-style, so navigation,
+sidebars and footers are left out of the extracted text.
+"""
+import re
+import logging
+
+from bs4 import NavigableString, Tag
+from bs4.element import Comment, Declaration, Doctype, ProcessingInstruction, CData
+
+logger = logging.getLogger(__name__)
+
+# Subtrees that never hold main content
+IGNORED_TAGS = {
+    "script", "style", "noscript", "template", "svg", "canvas", "iframe",
+    "button", "select", "nav", "aside", "footer", "form", "head"
+}
+
+# Class words of boilerplate blocks, unless they also look like content. Ids are not
+# matched: documentation sections take their ids from headings like "Cookies"
+UNLIKELY_PATTERN = re.compile(
+    r"banner|breadcrumb|combx|comment|community|cookie|disqus|footer|header|menu|"
+    r"related|remark|replies|rss|share|shoutbox|sidebar|skyscraper|social|sponsor|"
+    r"popup|pagination|pager|navbar|wy-nav|md-nav|headerlink|skip-link|edit-link",
+    re.IGNORECASE
+)
+MAYBE_PATTERN = re.compile(r"and|article|body|column|content|main|shadow|document", re.IGNORECASE)
+
+# Landmark roles of boilerplate blocks
+UNLIKELY_ROLES = ("navigation", "complementary", "contentinfo", "banner", "search")
+
+# Class or id words that raise or lower a container's score
+POSITIVE_PATTERN = re.compile(
+    r"article|body|content|entry|hentry|main|page|post|text|blog|story|document|"
+    r"rst-content|markdown|docs?-?content",
+    re.IGNORECASE
+)
+NEGATIVE_PATTERN = re.compile(
+    r"hidden|banner|combx|comment|com-|contact|foot|footer|footnote|masthead|media|meta|"
+    r"outbrain|promo|related|scroll|share|shoutbox|sidebar|skyscraper|sponsor|shopping|"
+    r"tags|tool|widget|nav|menu",
+    re.IGNORECASE
+)
+
+# Elements whose text is scored as a block, and their starting weight as containers
+BLOCK_TAGS = {"p", "pre", "td", "blockquote", "li", "dd", "dt", "h2", "h3", "h4", "h5", "h6"}
+CONTAINER_WEIGHTS = {
+    "div": 5, "section": 5, "main": 10, "article": 10, "pre": 3, "td": 3, "blockquote": 3,
+    "address": -3, "ol": -3, "ul": -3, "dl": -3, "dd": -3, "dt": -3, "li": -3,
+    "h1": -5, "h2": -5, "h3": -5, "h4": -5, "h5": -5, "h6": -5, "th": -5
+}
+
+# Shortest text block that counts, and how far up a block's score is shared
+MIN_BLOCK_CHARS = 25
+SCORE_ANCESTORS = 5
+
+NON_TEXT_STRINGS = (Comment, Declaration, Doctype, ProcessingInstruction, CData)
+
+
+class NodeStats:
+    """Text measurements of one element"""
+
+    __slots__ = ("text_chars", "link_chars", "own_chars", "commas", "score")
+
+    def __init__(self):
+        self.text_chars = 0
+        self.link_chars = 0
+        self.own_chars = 0
+        self.commas = 0
+        self.score = None
+
+    def link_density(self):
+        """Fraction of the element's text that is link text"""
+        return self.link_chars / self.text_chars if self.text_chars else 0.0
+
+
+def _attribute_words(node):
+    """Class and id of an element as one string"""
+    classes = node.get("class") or ()
+    if isinstance(classes, str):
+        classes = (classes,)
+    return " ".join(classes) + " " + (node.get("id") or "")
+
+
+def _class_words(node):
+    """Class of an element as one string"""
+    classes = node.get("class") or ()
+    if isinstance(classes, str):
+        return classes
+    return " ".join(classes)
+
+
+def _is_unlikely(node):
+    """Check whether an element looks like boilerplate from its tag, class or role"""
+    if node.name in IGNORED_TAGS:
+        return True
+    if node.get("role") in UNLIKELY_ROLES:
+        return True
+    if node.name in ("body", "html", "main", "article"):
+        return False
+    words = _class_words(node)
+    return bool(UNLIKELY_PATTERN.search(words)) and not MAYBE_PATTERN.search(words)
+
+
+def _class_weight(node):
+    """Score adjustment from an element's class, id and role"""
+    words = _attribute_words(node)
+    weight = 0
+    if NEGATIVE_PATTERN.search(words):
+        weight -= 25
+    if POSITIVE_PATTERN.search(words):
+        weight += 25
+    if node.get("role") == "main":
+        weight += 25
+    return weight
+
+
+def _is_text(node):
+    """Check whether a string is visible text"""
+    return isinstance(node, NavigableString) and not isinstance(node, NON_TEXT_STRINGS)
+
+
+def score_tree(soup):
+    """
+    Measure and score every element in one post-order walk
+
+    Each text block adds a score (one point, plus one per comma and per
+    100 characters up to 3) to its parent in full and to further ancestors
+    in decreasing shares. Boilerplate subtrees are skipped.
+
+    Args:
+        soup: BeautifulSoup object
+
+    Returns:
+        tuple: (stats, candidates) with id(element) -> NodeStats for every
+            element walked and the scored elements in the order first scored
+    """
+    stats = {}
+    candidates = []
+    root = soup.body or soup
+    stack = [(root, iter(root.children), NodeStats())]
+    stats[id(root)] = stack[0][2]
+
+    while stack:
+        node, children, node_stats = stack[-1]
+        child = next(children, None)
+
+        if child is not None:
+            if isinstance(child, Tag):
+                if _is_unlikely(child):
+                    continue
+                child_stats = NodeStats()
+                stats[id(child)] = child_stats
+                stack.append((child, iter(child.children), child_stats))
+            elif _is_text(child):
+                text = child.strip()
+                if text:
+                    node_stats.text_chars += len(text)
+                    node_stats.own_chars += len(text)
+                    node_stats.commas += text.count(",")
+            continue
+
+        # All children are done: roll this element's counts up into its parent
+        stack.pop()
+        if node.name == "a":
+            node_stats.link_chars = node_stats.text_chars
+        if stack:
+            parent_stats = stack[-1][2]
+            parent_stats.text_chars += node_stats.text_chars
+            parent_stats.link_chars += node_stats.link_chars
+            parent_stats.commas += node_stats.commas
+
+        # Text blocks (and containers with enough loose text of their own) score their ancestors
+        if node.name in BLOCK_TAGS:
+            block_chars = node_stats.text_chars
+        elif node.name in ("div", "section", "article", "main"):
+            block_chars = node_stats.own_chars
+        else:
+            continue
+        if block_chars < MIN_BLOCK_CHARS:
+            continue
+
+        block_score = (1 + node_stats.commas + min(block_chars // 100, 3)) * (1 - node_stats.link_density())
+        for level, (ancestor, _, ancestor_stats) in enumerate(reversed(stack[-SCORE_ANCESTORS:])):
+            if ancestor_stats.score is None:
+                ancestor_stats.score = CONTAINER_WEIGHTS.get(ancestor.name, 0) + _class_weight(ancestor)
+                candidates.append(ancestor)
+            divider = 1 if level == 0 else (2 if level == 1 else level * 3)
+            ancestor_stats.score += block_score / divider
+
+    return stats, candidates
+
+
+def find_main_content(soup):
+    """
+    Find the element holding a page's main content
+
+    Args:
+        soup: BeautifulSoup object
+
+    Returns:
+        Tag: Main content element (the body if nothing scores)
+    """
+    stats, candidates = score_tree(soup)
+    root = soup.body or soup
+
+    def final_score(node):
+        node_stats = stats[id(node)]
+        return node_stats.score * (1 - node_stats.link_density())
+
+    def is_inside(node, ancestor):
+        return any(parent is ancestor for parent in node.parents)
+
+    ranked = sorted(((final_score(node), node) for node in candidates), key=lambda candidate: candidate[0], reverse=True)
+    if not ranked or ranked[0][0] <= 0:
+        return root
+    top_score, top = ranked[0]
+
+    # Content split into several sections: use the closest ancestor holding the strong candidates
+    alternatives = [node for score, node in ranked[1:6] if score >= top_score * 0.75]
+    if len(alternatives) >= 2:
+        for ancestor in top.parents:
+            if ancestor is root.parent:
+                break
+            if sum(1 for node in alternatives if is_inside(node, ancestor)) >= 2:
+                top = ancestor
+                break
+
+    # Climb while the parent scores about as well as the candidate (e.g. a wrapper around it)
+    last_score = final_score(top) if stats[id(top)].score is not None else top_score
+    for parent in top.parents:
+        if parent is root.parent or id(parent) not in stats or stats[id(parent)].score is None:
+            break
+        parent_score = final_score(parent)
+        if parent_score < last_score / 3:
+            break
+        if parent_score > last_score:
+            top = parent
+            break
+        last_score = parent_score
+
+    return top
+
+
+def content_text(node, separator=" "):
+    """
+    Get the text of a content element
+
+    Only non-text and structural subtrees (scripts, nav, aside, footer...)
+    are left out; everything else under the chosen element is content.
+
+    Args:
+        node: Element returned by find_main_content
+        separator: String joining the text pieces
+
+    Returns:
+        str: Extracted text
+    """
+    pieces = []
+    stack = [iter(node.children)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+        elif isinstance(child, Tag):
+            if child.name not in IGNORED_TAGS:
+                stack.append(iter(child.children))
+        elif _is_text(child):
+            text = child.strip()
+            if text:
+                pieces.append(text)
+    return separator.join(pieces)
+
+
+def extract_main_content(soup, separator=" "):
+    """
+    Extract a page's main content text
+
+    Args:
+        soup: BeautifulSoup object
+        separator: String joining the text pieces
+
+    Returns:
+        str: Main content text
+    """
+    return content_text(find_main_content(soup), separator=separator)
@@ -0,0 +1,206 @@
+"""
+Near-Duplicate Detection module for the WebScraperUI application
+
+Fingerprints extracted page text with SimHash so near-identical pages,
+such as the same documentation page under several versions, are only
+analyzed and saved once.
+"""
+import re
+import hashlib
+import logging
+import threading
+from collections import Counter
+
+from webscraperui.url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def simhash(text, shingle_size=3):
+    """
+    Compute the 64-bit SimHash of a text
+
+    Features are overlapping word shingles weighted by their count, so
+    small edits flip only a few bits of the fingerprint.
+
+    Args:
+        text: Text to fingerprint
+        shingle_size: Number of words per shingle
+
+    Returns:
+        int: Fingerprint
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) >= shingle_size:
+        features = Counter(" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1))
+    else:
+        features = Counter(words)
+
+    weights = [0] * FINGERPRINT_BITS
+    for feature, count in features.items():
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        for bit in range(FINGERPRINT_BITS):
+            if value >> bit & 1:
+                weights[bit] += count
+            else:
+                weights[bit] -= count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(first, second):
+    """
+    Count the differing bits of two fingerprints
+
+    Args:
+        first: Fingerprint
+        second: Fingerprint
+
+    Returns:
+        int: Number of differing bits
+    """
+    return bin(first ^ second).count("1")
+
+
+class NearDuplicateIndex:
+    """
+    Index of page fingerprints with banded near-duplicate lookup.
+
+    Fingerprints are split into max_distance + 1 bands; two fingerprints
+    within max_distance bits must agree on at least one whole band, so only
+    pages sharing a band are compared.
+    """
+
+    def __init__(self, max_distance=3, min_words=50):
+        """
+        Initialize the NearDuplicateIndex
+
+        Args:
+            max_distance: Largest Hamming distance still considered a duplicate
+            min_words: Pages with fewer words are never treated as duplicates
+        """
+        self.max_distance = max_distance
+        self.min_words = min_words
+        self.num_bands = max_distance + 1
+        self.band_bits = FINGERPRINT_BITS // self.num_bands
+        self._bands = [{} for _ in range(self.num_bands)]
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _band_values(self, fingerprint):
+        """Split a fingerprint into its band values"""
+        mask = (1 << self.band_bits) - 1
+        return [(fingerprint >> (band * self.band_bits)) & mask for band in range(self.num_bands)]
+
+    def fingerprint(self, text):
+        """
+        Fingerprint a page's text
+
+        Args:
+            text: Extracted page text
+
+        Returns:
+            int: Fingerprint, or None if the text is too short to compare
+        """
+        if not text or len(WORD_PATTERN.findall(text)) < self.min_words:
+            return None
+        return simhash(text)
+
+    def find(self, url, fingerprint):
+        """
+        Find an indexed page that is a near-duplicate of a fingerprint
+
+        Args:
+            url: URL of the page being checked (never reported as its own duplicate)
+            fingerprint: Fingerprint of the page
+
+        Returns:
+            tuple: (url, payload) of the closest indexed page, or None
+        """
+        if fingerprint is None:
+            return None
+
+        key = canonicalize_url(url)
+        best = None
+        with self._lock:
+            candidates = set()
+            for band, value in enumerate(self._band_values(fingerprint)):
+                candidates.update(self._bands[band].get(value, ()))
+            candidates.discard(key)
+
+            for candidate in candidates:
+                other_url, other_fingerprint, payload = self._entries[candidate]
+                distance = hamming_distance(fingerprint, other_fingerprint)
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, other_url, payload)
+
+        return (best[1], best[2]) if best else None
+
+    def add(self, url, fingerprint, payload=None):
+        """
+        Index a page's fingerprint
+
+        Args:
+            url: URL of the page
+            fingerprint: Fingerprint of the page (None is ignored)
+            payload: Optional value returned with matches, e.g. the output file
+        """
+        if fingerprint is None:
+            return
+
+        key = canonicalize_url(url)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (url, fingerprint, payload)
+            for band, value in enumerate(self._band_values(fingerprint)):
+                self._bands[band].setdefault(value, set()).add(key)
+
+    def _remove(self, key):
+        """Drop an indexed page (caller holds the lock)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band, value in enumerate(self._band_values(entry[1])):
+            keys = self._bands[band].get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._bands[band][value]
+
+    def check(self, url, text, payload=None):
+        """
+        Look a page up and index it if it is not a near-duplicate
+
+        Args:
+            url: URL of the page
+            text: Extracted page text
+            payload: Optional value stored with the page
+
+        Returns:
+            tuple: (url, payload) of the page it duplicates, or None
+        """
+        fingerprint = self.fingerprint(text)
+        match = self.find(url, fingerprint)
+        if match is None:
+            self.add(url, fingerprint, payload)
+        else:
+            logger.info(f"{url} is a near-duplicate of {match[0]}")
+        return match
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove every indexed page"""
+        with self._lock:
+            self._bands = [{} for _ in range(self.num_bands)]
+            self._entries = {}
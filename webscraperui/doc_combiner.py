@@ -9,7 +9,8 @@ import json
 import logging
 import re
 from datetime import datetime
-from bs4 import BeautifulSoup
+from webscraperui.parsing import make_soup
+from webscraperui.selector_cache import SelectorCache
 
 logger = logging.getLogger(__name__)
 
@@ -21,15 +22,18 @@ class DocumentCombiner:
     multiple separate module pages.
     """
     
-    def __init__(self, output_folder):
+    def __init__(self, output_folder, selector_cache=None):
         """
         Initialize the DocumentCombiner.
         
         Args:
             output_folder: Folder where scraped files are stored and where
                            the combined document will be saved
+            selector_cache: SelectorCache of learned content selectors
+                            (default: one under the output folder)
         """
         self.output_folder = output_folder
+        self.selector_cache = selector_cache or SelectorCache(os.path.join(output_folder, ".selectors", "selectors.json"))
     
     def combine_html_files(self, file_paths, title="Combined Documentation"):
         """
@@ -252,7 +256,7 @@ class DocumentCombiner:
                         html_content = f.read()
                     
                     # Parse HTML
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = make_soup(html_content)
                     
                     # Get the title or use filename as fallback
                     section_title = soup.find('title')
@@ -275,27 +279,9 @@ class DocumentCombiner:
                     # Add to navigation
                     combined_html += f'<li><a href="#{section_id}">{section_title}</a></li>\n'
                     
-                    # Extract main content
-                    content = None
-                    
-                    # Try to find the main content area - checking common content containers
-                    content_areas = [
-                        soup.find('div', class_='document'),
-                        soup.find('div', {'role': 'main'}),
-                        soup.find('article'),
-                        soup.find('div', class_='content'),
-                        soup.find('div', class_='section'),
-                        soup.body  # Fallback to body if no specific content area found
-                    ]
-                    
-                    for area in content_areas:
-                        if area:
-                            content = area
-                            break
-                    
-                    # If still no content, use the entire body
-                    if not content:
-                        content = soup.body
+                    # Extract the main content area, trying the selector learned for
+                    # files in this folder (they usually share one layout) first
+                    content = self.selector_cache.find(soup, f"file:{os.path.dirname(os.path.abspath(file_path))}")
                     
                     # Store the section data
                     sections.append({
@@ -0,0 +1,175 @@
+"""
+Parsed Document module for the WebScraperUI application
+
+Parses a page's HTML once and shares the tree, its text and its link table
+between scraping, analysis and crawling, with a small LRU cache keyed by
+content hash so no stage re-parses HTML another stage already parsed.
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+from webscraperui.parsing import resolve_parser, make_soup, make_link_soup
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(html):
+    """
+    Hash HTML content for use as a cache key
+
+    Args:
+        html: HTML string or bytes
+
+    Returns:
+        str: Hex digest of the content
+    """
+    if isinstance(html, str):
+        html = html.encode("utf-8", errors="surrogatepass")
+    return hashlib.blake2b(html, digest_size=16).hexdigest()
+
+
+class ParsedDocument:
+    """
+    HTML parsed once, with its text and link table computed on first use.
+
+    The tree is shared by every stage that reads the page, so consumers
+    must treat it as read-only: copy a subtree before modifying it.
+    """
+
+    def __init__(self, html, url=None, parser=None, digest=None):
+        """
+        Initialize the ParsedDocument
+
+        Args:
+            html: HTML content
+            url: Optional URL the content came from
+            parser: Optional parser name overriding the configured one
+            digest: Optional precomputed content_hash of html
+        """
+        self.html = html
+        self.url = url
+        self.parser = resolve_parser(parser)
+        self.content_hash = digest or content_hash(html)
+        self._soup = None
+        self._text = None
+        self._links = None
+        self._lock = threading.Lock()
+
+    @property
+    def soup(self):
+        """BeautifulSoup tree of the document, parsed on first access"""
+        if self._soup is None:
+            with self._lock:
+                if self._soup is None:
+                    self._soup = make_soup(self.html, parser=self.parser)
+        return self._soup
+
+    @property
+    def text(self):
+        """Visible text of the document, joined with spaces"""
+        if self._text is None:
+            self._text = self.soup.get_text(separator=" ", strip=True)
+        return self._text
+
+    @property
+    def links(self):
+        """
+        Link table of the document as {'url', 'text'} records in document order
+
+        Uses the full tree when it is already built and a link-only parse otherwise.
+        """
+        if self._links is None:
+            soup = self._soup if self._soup is not None else make_link_soup(self.html, parser=self.parser)
+            self._links = [
+                {'url': anchor['href'], 'text': anchor.get_text(strip=True)}
+                for anchor in soup.find_all('a', href=True)
+            ]
+        return self._links
+
+
+class DocumentCache:
+    """Thread-safe LRU cache of ParsedDocuments keyed by content hash and parser"""
+
+    def __init__(self, max_size=4):
+        """
+        Initialize the DocumentCache
+
+        Args:
+            max_size: Number of documents kept (each holds its HTML and tree in memory)
+        """
+        self.max_size = max_size
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, html, url=None, parser=None):
+        """
+        Get the parsed document for some HTML, parsing it only if it is not cached
+
+        Args:
+            html: HTML content
+            url: Optional URL the content came from
+            parser: Optional parser name overriding the configured one
+
+        Returns:
+            ParsedDocument: Parsed document
+        """
+        key = (content_hash(html), resolve_parser(parser))
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return document
+
+            self.misses += 1
+            document = ParsedDocument(html, url=url, parser=key[1], digest=key[0])
+            self._documents[key] = document
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+            return document
+
+    def __len__(self):
+        return len(self._documents)
+
+    def clear(self):
+        """Remove every cached document"""
+        with self._lock:
+            self._documents.clear()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_document_cache():
+    """
+    Get the process-wide shared DocumentCache
+
+    Returns:
+        DocumentCache: Shared document cache
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = DocumentCache()
+    return _default_cache
+
+
+def parse_document(html, url=None, parser=None):
+    """
+    Parse HTML through the shared document cache
+
+    Args:
+        html: HTML content
+        url: Optional URL the content came from
+        parser: Optional parser name overriding the configured one
+
+    Returns:
+        ParsedDocument: Parsed document
+    """
+    return get_document_cache().get(html, url=url, parser=parser)
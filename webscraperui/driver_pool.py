@@ -0,0 +1,241 @@
+"""
+WebDriver Pool module for the WebScraperUI application
+
+Keeps a bounded set of warm browser sessions that are health-checked
+before use, cleaned between uses and recycled after a number of pages,
+so pages do not pay for a browser start each.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def chromedriver_path():
+    """
+    Get the chromedriver executable, resolving and downloading it once per process
+
+    Returns:
+        str: Path of the chromedriver executable
+    """
+    global _driver_path
+    if _driver_path is None:
+        with _driver_path_lock:
+            if _driver_path is None:
+                _driver_path = ChromeDriverManager().install()
+    return _driver_path
+
+
+class DriverPoolTimeout(Exception):
+    """Raised when no browser session becomes free in time"""
+
+
+def _origin(url):
+    """Get the scheme://host[:port] origin of a web page URL, or None for other pages"""
+    parts = urlparse(url or "")
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class DriverPool:
+    """
+    Bounded pool of reusable WebDriver sessions.
+
+    A session is checked with a cheap command before it is handed out,
+    reset (extra tabs closed, cookies and storage cleared, blank page) when
+    it is returned, and quit after max_uses pages or when it fails.
+    """
+
+    def __init__(self, factory, max_size=2, max_uses=50, acquire_timeout=120):
+        """
+        Initialize the DriverPool
+
+        Args:
+            factory: Callable creating a new WebDriver
+            max_size: Largest number of sessions alive at once
+            max_uses: Pages a session serves before it is recycled
+            acquire_timeout: Seconds acquire() waits for a free session
+        """
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+        self._idle = []
+        self._uses = {}
+        self._alive = 0
+        self._created = 0
+        self._recycled = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Get a healthy session, reusing an idle one when possible
+
+        Returns:
+            WebDriver: Session reserved for the caller until release()
+
+        Raises:
+            DriverPoolTimeout: If no session became free within acquire_timeout
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                elif self._alive < self.max_size:
+                    # Take the slot now and start the browser outside the lock
+                    self._alive += 1
+                    driver = None
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DriverPoolTimeout(f"No browser session free after {self.acquire_timeout}s")
+                    self._condition.wait(remaining)
+                    continue
+
+            if driver is None:
+                return self._create()
+            if self._healthy(driver):
+                return driver
+            logger.info("Discarding unresponsive browser session")
+            self._discard(driver)
+
+    def _create(self):
+        """Start a new session in a slot already counted as alive"""
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._condition:
+                self._alive -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._uses[id(driver)] = 0
+            self._created += 1
+        return driver
+
+    def _healthy(self, driver):
+        """Check that a session still answers commands"""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        """Return a session to a clean state for its next user"""
+        # Note the origins the tabs show, so their storage can be cleared too
+        origins = set()
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            origins.add(_origin(driver.current_url))
+            driver.close()
+        driver.switch_to.window(handles[0])
+        origins.add(_origin(driver.current_url))
+        origins.discard(None)
+
+        try:
+            # delete_all_cookies only reaches the current document's domain; DevTools clears every host's
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        except Exception as e:
+            logger.debug(f"Could not clear browser data through DevTools: {str(e)}")
+            try:
+                driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+            except Exception:
+                pass
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def _discard(self, driver):
+        """Quit a session and free its slot"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting browser session: {str(e)}")
+        with self._condition:
+            self._uses.pop(id(driver), None)
+            self._alive -= 1
+            self._condition.notify()
+
+    def release(self, driver, pages=1):
+        """
+        Return a session to the pool
+
+        Args:
+            driver: Session from acquire()
+            pages: Number of pages the session loaded while it was out
+        """
+        with self._condition:
+            uses = self._uses.get(id(driver), 0) + pages
+            self._uses[id(driver)] = uses
+            recycle = self._closed or uses >= self.max_uses
+            if recycle and not self._closed:
+                self._recycled += 1
+
+        if not recycle:
+            try:
+                self._reset(driver)
+            except Exception as e:
+                logger.info(f"Discarding browser session that failed to reset: {str(e)}")
+                recycle = True
+
+        if recycle:
+            self._discard(driver)
+            return
+
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self):
+        """
+        Borrow a session for the duration of a with block
+
+        Yields:
+            WebDriver: Session reserved for the block
+        """
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def stats(self):
+        """
+        Get pool statistics
+
+        Returns:
+            dict: Sessions alive, idle, started and recycled
+        """
+        with self._condition:
+            return {
+                "alive": self._alive,
+                "idle": len(self._idle),
+                "created": self._created,
+                "recycled": self._recycled
+            }
+
+    def close(self):
+        """Quit idle sessions; sessions in use are quit when they are released"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver in idle:
+            self._discard(driver)
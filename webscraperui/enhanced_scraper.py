@@ -3,50 +3,99 @@ Enhanced Web Scraper module for the WebScraperUI application
 Uses Selenium for JavaScript-rendered content
 """
 import os
+import atexit
 import json
 import logging
 import re
-import time
 import io
 import tempfile
-from collections import defaultdict
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import PyPDF2
 
 from webscraperui.analyzer import ContentAnalyzer
+from webscraperui.browser_extraction import extract_in_browser
+from webscraperui.checkpoint import CheckpointStore, CrawlCheckpoint
+from webscraperui.content_extractor import content_text
+from webscraperui.dedup import NearDuplicateIndex
+from webscraperui.driver_pool import DriverPool, chromedriver_path
+from webscraperui.extraction import extract_elements
+from webscraperui.http_session import get_session_manager
+from webscraperui.document import parse_document
+from webscraperui.politeness import get_scheduler
+from webscraperui.readiness import NAVIGATE_SCRIPT, PageWait, ReadinessPolicy, install_probe, wait_until_ready
+from webscraperui.resilience import get_fault_handler
+from webscraperui.resource_policy import ResourcePolicy
+from webscraperui.scrolling import AdaptiveScroller
+from webscraperui.selector_cache import SelectorCache
+from webscraperui.url_utils import canonicalize_url, normalize_url, VisitedURLSet
 
 logger = logging.getLogger(__name__)
 
 class EnhancedWebScraper:
     """Enhanced Web Scraper class for fetching and processing web content with JavaScript support"""
     
-    def __init__(self, output_folder="./scraped_data", headless=True):
+    def __init__(self, output_folder="./scraped_data", headless=True, session_manager=None,
+                 scheduler=None, near_duplicates=None, fault_handler=None, page_load_timeout=30,
+                 selector_cache=None, pool_size=2, pages_per_driver=50, readiness=None,
+                 scroller=None, resource_policy=None, crawl_concurrency=4):
         """
         Initialize the EnhancedWebScraper
         
         Args:
             output_folder: Folder to save scraped data
             headless: Whether to run browser in headless mode
+            session_manager: HTTPSessionManager for non-browser requests (default: shared pool)
+            scheduler: PolitenessScheduler pacing page loads per host (default: shared scheduler)
+            near_duplicates: NearDuplicateIndex of pages already scraped (default: a new index)
+            fault_handler: FaultHandler retrying page loads and tripping per-host circuits (default: shared handler)
+            page_load_timeout: Seconds before a page load is abandoned
+            selector_cache: SelectorCache of learned per-domain content selectors (default: one under the output folder)
+            pool_size: Largest number of browser sessions kept warm
+            pages_per_driver: Pages a browser session serves before it is restarted
+            readiness: ReadinessPolicy deciding when a rendered page is read (default: interactive, network and DOM quiet)
+            scroller: AdaptiveScroller loading lazy content (default: a new scroller)
+            resource_policy: ResourcePolicy of requests blocked while rendering (default: the docs profile)
+            crawl_concurrency: Most linked pages rendered at once in a deep crawl, spread over pooled sessions
         """
         self.output_folder = output_folder
         self.analyzer = ContentAnalyzer()
-        self.visited_urls = set()
+        self.visited_urls = VisitedURLSet()
         self.headless = headless
+        self.session_manager = session_manager or get_session_manager()
+        self.scheduler = scheduler or get_scheduler()
+        self.near_duplicates = near_duplicates or NearDuplicateIndex()
+        self.fault_handler = fault_handler or get_fault_handler()
+        self.page_load_timeout = page_load_timeout
+        self.readiness = readiness or ReadinessPolicy()
+        self.scroller = scroller or AdaptiveScroller()
+        self.resource_policy = resource_policy or ResourcePolicy.from_profile("docs")
+        self.crawl_concurrency = crawl_concurrency
         
         # Create output folder if it doesn't exist
         if not os.path.exists(output_folder):
             os.makedirs(output_folder)
+        
+        # Checkpoints let interrupted deep crawls resume
+        self.checkpoints = CheckpointStore(os.path.join(output_folder, ".checkpoints"))
+        
+        # Content selectors learned per domain
+        self.selector_cache = selector_cache or SelectorCache(os.path.join(output_folder, ".selectors", "selectors.json"))
+        
+        # Warm browser sessions reused across pages, quit when the process exits
+        self.driver_pool = DriverPool(self._setup_driver, max_size=pool_size, max_uses=pages_per_driver)
+        atexit.register(self.close)
             
     def get_html_content(self, url, scroll=True, wait_time=5):
         """
@@ -55,7 +104,7 @@ class EnhancedWebScraper:
         Args:
             url: URL to fetch content from
             scroll: Whether to scroll the page to load lazy content
-            wait_time: How many seconds to wait for the page to load
+            wait_time: Most seconds to wait for the page to become ready
             
         Returns:
             dict: HTML content and metadata
@@ -63,51 +112,34 @@ class EnhancedWebScraper:
         try:
             logger.info(f"Fetching HTML content from {url}")
             
-            # Set up the driver
-            driver = self._setup_driver()
+            # Borrow a warm browser session
+            driver = self.driver_pool.acquire()
             
-            # Fetch the page
-            driver.get(url)
-            
-            # Wait for the page to load
-            logger.info(f"Waiting {wait_time} seconds for page to load...")
-            time.sleep(wait_time)
+            # Fetch the page once the host's politeness budget allows
+            self._load_page(driver, url)
             
-            # Check if we're on a Cloudflare challenge page
-            if "Just a moment" in driver.title and "Cloudflare" in driver.page_source:
-                logger.info("Detected Cloudflare challenge, waiting additional time...")
-                # Wait longer for Cloudflare challenge
-                cloudflare_wait = 10
-                time.sleep(cloudflare_wait)
+            # Wait until the page is ready (or a Cloudflare challenge has cleared), at most wait_time
+            wait_until_ready(driver, self.readiness, wait_time)
             
             # Scroll to load lazy content if needed
             if scroll:
-                self._scroll_page(driver)
+                self._scroll_page(driver, url)
             
             # Get the page source after JavaScript execution
             html_content = driver.page_source
             
-            # Parse the content with BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
-            
-            # Extract basic metadata
-            title = soup.find("title")
-            title_text = title.text.strip() if title else "No title found"
+            # Parse the content (cached, so link extraction from this HTML reuses the tree)
+            soup = parse_document(html_content, url).soup
             
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            meta_description = meta_desc.get("content", "") if meta_desc else ""
+            # Extract basic metadata and headings for context in one walk
+            elements = extract_elements(soup, url, links=False, images=False)
+            title_text = elements["title"] if elements["title"] is not None else "No title found"
+            meta_description = elements["meta_description"] or ""
+            headings = elements["headings"]
             
-            # Extract headings for context
-            headings = []
-            for heading_level in range(1, 7):
-                for heading in soup.find_all(f"h{heading_level}"):
-                    headings.append({
-                        "level": heading_level,
-                        "text": heading.text.strip()
-                    })
-            
-            # Close the driver
-            driver.quit()
+            # Return the browser session to the pool
+            self.driver_pool.release(driver)
+            driver = None
             
             # Return the content and metadata
             return {
@@ -120,10 +152,14 @@ class EnhancedWebScraper:
             
         except Exception as e:
             logger.error(f"Error fetching HTML from {url}: {str(e)}")
-            if 'driver' in locals():
-                driver.quit()
+            if locals().get('driver') is not None:
+                self.driver_pool.release(driver)
             raise
     
+    def close(self):
+        """Quit the pooled browser sessions"""
+        self.driver_pool.close()
+    
     def _setup_driver(self):
         """Set up the Selenium WebDriver"""
         chrome_options = Options()
@@ -139,17 +175,60 @@ class EnhancedWebScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
         
-        # Initialize the driver
+        # Keep background tabs rendering at full speed for scrape_many
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        
+        # Return from navigation at DOMContentLoaded; readiness is decided by wait_until_ready
+        chrome_options.page_load_strategy = "eager"
+        
+        # Skip downloading images the pages only need the src of
+        prefs = self.resource_policy.chrome_prefs()
+        if prefs:
+            chrome_options.add_experimental_option("prefs", prefs)
+        
+        # Initialize the driver (the chromedriver download is resolved once per process)
         driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(chromedriver_path()),
             options=chrome_options
         )
         
         # Set navigator webdriver property to undefined
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        # Track network and DOM activity and block unneeded requests from the start of every page
+        self._prepare_tab(driver)
+        
+        # Bound page loads so an unresponsive host fails instead of hanging
+        driver.set_page_load_timeout(self.page_load_timeout)
+        
         return driver
     
+    def _prepare_tab(self, driver):
+        """
+        Set up the driver's current tab for rendering: the readiness probe and resource blocking
+        
+        Args:
+            driver: Selenium WebDriver
+        """
+        install_probe(driver)
+        self.resource_policy.apply(driver)
+    
+    def _load_page(self, driver, url):
+        """
+        Navigate the browser to a URL with retries and the host's circuit breaker
+        
+        Args:
+            driver: Selenium WebDriver
+            url: URL to load
+        """
+        def navigate():
+            self.scheduler.wait(url)
+            driver.get(url)
+        
+        self.fault_handler.call(url, navigate)
+    
     def _is_pdf_url(self, url):
         """
         Check if a URL points to a PDF file
@@ -172,7 +251,9 @@ class EnhancedWebScraper:
             
         # If the extension doesn't clearly indicate, make a HEAD request to check Content-Type
         try:
-            response = requests.head(url, allow_redirects=True, timeout=10)
+            response = self.fault_handler.call(
+                url, self.session_manager.head, url, allow_redirects=True, timeout=10, retry=False
+            )
             content_type = response.headers.get('Content-Type', '').lower()
             
             # Check for various PDF content type formats
@@ -205,7 +286,7 @@ class EnhancedWebScraper:
             logger.info(f"Extracting content from PDF: {url}")
             
             # Download the PDF file
-            response = requests.get(url, timeout=30)
+            response = self.session_manager.get(url)
             response.raise_for_status()
             
             # Basic PDF info even if we can't extract text
@@ -312,7 +393,7 @@ class EnhancedWebScraper:
                 "error": str(e)
             }
     
-    def scrape(self, url, depth=1, output_format="txt", scroll=True, wait_time=5):
+    def scrape(self, url, depth=1, output_format="txt", scroll=True, wait_time=5, resume=False):
         """
         Scrape a website starting from the given URL using Selenium for JavaScript rendering
         
@@ -321,7 +402,8 @@ class EnhancedWebScraper:
             depth: How many levels deep to scrape (default: 1)
             output_format: Format for saving output (txt, json, html)
             scroll: Whether to scroll the page to load lazy content
-            wait_time: How many seconds to wait for the page to load
+            wait_time: Most seconds to wait for each page to become ready
+            resume: Skip linked pages already done by an interrupted crawl of this URL
             
         Returns:
             dict: Scraped data and status
@@ -330,94 +412,350 @@ class EnhancedWebScraper:
             logger.info(f"Starting enhanced scrape of {url} with depth {depth}")
             
             # Reset visited URLs
-            self.visited_urls = set()
+            self.visited_urls.close()
+            self.visited_urls = VisitedURLSet()
+            self.visited_urls.add(url)
             
             # Check if the URL is a PDF
-            if self._is_pdf_url(url):
+            is_pdf = self._is_pdf_url(url)
+            if is_pdf:
                 logger.info(f"Detected PDF URL: {url}")
                 data = self._extract_pdf_content(url)
             else:
-                # Set up the driver for HTML content
-                driver = self._setup_driver()
-                
-                # Fetch and parse the content
-                driver.get(url)
+                # Borrow a warm browser session for HTML content
+                driver = self.driver_pool.acquire()
                 
-                # Wait for the page to load - with special handling for Cloudflare
-                logger.info(f"Waiting {wait_time} seconds for page to load (including possible Cloudflare challenge)...")
-                time.sleep(wait_time)
-
-                # Check if we're on a Cloudflare challenge page
-                if "Just a moment" in driver.title and "Cloudflare" in driver.page_source:
-                    logger.info("Detected Cloudflare challenge, waiting additional time...")
-                    # Wait longer for Cloudflare challenge
-                    cloudflare_wait = 10
-                    time.sleep(cloudflare_wait)
-                
-                # Scroll to load lazy content if needed
-                if scroll:
-                    self._scroll_page(driver)
+                # Fetch and parse the content once the host's politeness budget allows
+                self._load_page(driver, url)
                 
-                # Get the page source after JavaScript execution
-                html_content = driver.page_source
-                soup = BeautifulSoup(html_content, "html.parser")
+                # Wait until the page is ready (or a Cloudflare challenge has cleared), at most wait_time
+                wait_until_ready(driver, self.readiness, wait_time)
                 
-                # Extract data from the page
-                data = self._extract_data(soup, url, driver)
+                # Scroll if needed, then extract data from the rendered page
+                data = self._read_page(driver, url, scroll)
                 
-                # Close the driver
-                driver.quit()
+                # Return the browser session to the pool
+                self.driver_pool.release(driver)
+                driver = None
+            
+            return self._finish_scrape(url, data, depth, output_format, wait_time, resume, is_pdf)
             
-            # Add timestamp and parameters
-            data["timestamp"] = datetime.now().isoformat()
-            data["scrape_depth"] = depth
-            data["url"] = url
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {str(e)}")
+            if locals().get('driver') is not None:
+                self.driver_pool.release(driver)
+            raise
+    
+    def scrape_many(self, urls, depth=1, output_format="txt", scroll=True, wait_time=5, resume=False,
+                    tabs=4, on_result=None):
+        """
+        Scrape several URLs, rendering them in parallel tabs of one browser session
+        
+        Args:
+            urls: URLs to scrape
+            depth: How many levels deep to scrape from each URL (default: 1)
+            output_format: Format for saving output (txt, json, html)
+            scroll: Whether to scroll the pages to load lazy content
+            wait_time: Most seconds to wait for each page to become ready
+            resume: Skip linked pages already done by interrupted crawls of these URLs
+            tabs: Most pages rendered at once
+            on_result: Optional callback(url, result) called as each URL is finished
             
-            # Analyze the content
-            data = self._analyze_content(data)
+        Returns:
+            dict: URL -> result in the shape returned by scrape(), or
+                  {"url", "status": "error", "error"} for a URL that failed
+        """
+        logger.info(f"Starting enhanced scrape of {len(urls)} URLs in up to {tabs} tabs")
+        
+        # Reset visited URLs for the batch
+        self.visited_urls.close()
+        self.visited_urls = VisitedURLSet()
+        for url in urls:
+            self.visited_urls.add(url)
+        
+        pdf_urls = set(url for url in urls if self._is_pdf_url(url))
+        html_urls = [url for url in urls if url not in pdf_urls]
+        
+        # Render the HTML pages first; a failed browser session fails only the pages not yet read
+        rendered = {}
+        render_error = None
+        if html_urls:
+            try:
+                self._render_in_tabs(html_urls, scroll, wait_time, tabs, rendered)
+            except Exception as e:
+                logger.error(f"Error rendering pages in tabs: {str(e)}")
+                render_error = e
+        
+        # Analyze, crawl and save each page
+        results = {}
+        for url in urls:
+            try:
+                if url in pdf_urls:
+                    logger.info(f"Detected PDF URL: {url}")
+                    data = self._extract_pdf_content(url)
+                else:
+                    data = rendered.get(url, render_error)
+                    if isinstance(data, Exception):
+                        raise data
+                result = self._finish_scrape(url, data, depth, output_format, wait_time, resume,
+                                             is_pdf=url in pdf_urls)
+            except Exception as e:
+                logger.error(f"Error scraping {url}: {str(e)}")
+                result = {"url": url, "status": "error", "error": str(e)}
+            results[url] = result
+            if on_result is not None:
+                on_result(url, result)
+        
+        return results
+    
+    def _render_in_tabs(self, urls, scroll, wait_time, tabs, rendered, on_rendered=None):
+        """
+        Load URLs in parallel tabs of one pooled session and extract each once it is ready
+        
+        Args:
+            urls: URLs of HTML pages
+            scroll: Whether to scroll the pages to load lazy content
+            wait_time: Most seconds to wait for each page to become ready
+            tabs: Most tabs open at once
+            rendered: dict filled with URL -> extracted data, or the exception that page raised
+            on_rendered: Optional callback(url, data) called as each page is extracted
+        """
+        pending = deque(urls)
+        attempts = defaultdict(int)
+        # URLs waiting out their retry backoff, as (time they may start, URL)
+        delayed = []
+        driver = self.driver_pool.acquire()
+        pages = 0
+        try:
+            # The session's own tab plus new ones, each tracking its page's readiness
+            handles = [driver.current_window_handle]
+            for _ in range(min(tabs, len(urls)) - 1):
+                driver.switch_to.new_window("tab")
+                self._prepare_tab(driver)
+                handles.append(driver.current_window_handle)
             
-            # Crawl additional pages if depth > 1 and not a PDF
-            if depth > 1 and not self._is_pdf_url(url):
-                data["linked_pages"] = self._crawl_links(url, soup, driver, depth - 1, wait_time)
+            active = {}
+            for handle in handles:
+                self._next_tab_page(driver, handle, pending, active, wait_time, rendered)
             
-            # Save the results
-            output_path = self._save_output(data, output_format)
+            while active or delayed:
+                # Start retries whose backoff has passed in idle tabs
+                now = time.monotonic()
+                due = [url for ready_at, url in delayed if ready_at <= now]
+                if due:
+                    delayed = [(ready_at, url) for ready_at, url in delayed if ready_at > now]
+                    pending.extendleft(reversed(due))
+                    for handle in handles:
+                        if handle not in active:
+                            self._next_tab_page(driver, handle, pending, active, wait_time, rendered)
+                
+                finished = False
+                for handle in list(active):
+                    url, page_wait = active[handle]
+                    driver.switch_to.window(handle)
+                    try:
+                        if not page_wait.poll(driver):
+                            continue
+                        page_wait.result()
+                        # A tab whose navigation never committed still shows its previous page
+                        if not page_wait.navigated:
+                            raise TimeoutException(f"{url} did not start loading within {wait_time}s")
+                        if driver.current_url.startswith("chrome-error://"):
+                            raise WebDriverException(f"Failed to load {url}")
+                        self.fault_handler.record_success(url)
+                        rendered[url] = self._read_page(driver, url, scroll)
+                        if on_rendered is not None:
+                            on_rendered(url, rendered[url])
+                    except Exception as e:
+                        # Report the load to the host's circuit breaker, retrying transient failures
+                        attempts[url] += 1
+                        if self.fault_handler.record_failure(url, e, attempts[url]):
+                            # Back off like fault_handler.call, without holding up the other tabs
+                            delay = self.fault_handler.policy.delay(attempts[url])
+                            logger.info(f"Retrying {url} in {delay:.2f}s after error: {str(e)}")
+                            delayed.append((time.monotonic() + delay, url))
+                        else:
+                            logger.error(f"Error rendering {url}: {str(e)}")
+                            rendered[url] = e
+                    pages += 1
+                    finished = True
+                    del active[handle]
+                    self._next_tab_page(driver, handle, pending, active, wait_time, rendered)
+                
+                if not finished:
+                    time.sleep(self.readiness.poll_interval)
+        finally:
+            # Releasing the session closes the extra tabs
+            self.driver_pool.release(driver, pages=max(1, pages))
+    
+    def _next_tab_page(self, driver, handle, pending, active, wait_time, rendered):
+        """
+        Start loading the next pending URL in a tab without waiting for it
+        
+        Args:
+            driver: Selenium WebDriver
+            handle: Window handle of the tab
+            pending: deque of URLs not started yet
+            active: dict of handle -> (URL, PageWait) for tabs loading a page
+            wait_time: Most seconds to wait for the page to become ready
+            rendered: dict receiving the exception of a URL that cannot be started
+        """
+        while pending:
+            url = pending.popleft()
+            try:
+                # Skip hosts whose circuit is open, and keep to the host's politeness budget
+                self.fault_handler.check(url)
+                self.scheduler.wait(url)
+            except Exception as e:
+                logger.error(f"Error loading {url}: {str(e)}")
+                rendered[url] = e
+                continue
+            try:
+                driver.switch_to.window(handle)
+                driver.execute_script(NAVIGATE_SCRIPT, url)
+            except Exception as e:
+                logger.error(f"Error loading {url}: {str(e)}")
+                self.fault_handler.record_failure(url, e)
+                rendered[url] = e
+                continue
+            active[handle] = (url, PageWait(self.readiness, wait_time))
+            return
+    
+    def _read_page(self, driver, url, scroll):
+        """
+        Scroll a ready page if needed and extract its data
+        
+        Args:
+            driver: Selenium WebDriver showing the page
+            url: URL of the page
+            scroll: Whether to scroll the page to load lazy content
             
+        Returns:
+            dict: Extracted data
+        """
+        # Scroll to load lazy content if needed
+        if scroll:
+            self._scroll_page(driver, url)
+        
+        # Collect everything in one script call, with the main content from the domain's learned selector
+        domain = urlparse(url).netloc
+        extracted = extract_in_browser(driver, self.selector_cache.selector(domain), self.selector_cache.min_chars)
+        if extracted is None:
+            # Fall back to parsing the page source
+            return self._extract_data(parse_document(driver.page_source, url).soup, url)
+        
+        elements, content = extracted
+        if content is None:
+            # No selector learned yet, or it stopped matching: score the page source and learn one
+            soup = parse_document(driver.page_source, url).soup
+            content = content_text(self.selector_cache.find(soup, domain), separator="\n")
+        else:
+            self.selector_cache.record_hit(domain)
+        
+        return self._page_data(url, elements, content)
+    
+    def _finish_scrape(self, url, data, depth, output_format, wait_time, resume, is_pdf=False):
+        """
+        Analyze, crawl from and save a page whose data has been extracted
+        
+        Args:
+            url: URL of the page
+            data: Data extracted from the page
+            depth: How many levels deep to scrape
+            output_format: Format for saving output (txt, json, html)
+            wait_time: Most seconds to wait for each linked page to become ready
+            resume: Skip linked pages already done by an interrupted crawl of this URL
+            is_pdf: Whether the page is a PDF
+            
+        Returns:
+            dict: Scraped data and status
+        """
+        # Link near-duplicates to the page already scraped instead of analyzing and saving them
+        fingerprint = self.near_duplicates.fingerprint(data.get("content", ""))
+        match = self.near_duplicates.find(url, fingerprint)
+        if match is not None:
+            logger.info(f"Skipping {url}: near-duplicate of {match[0]}")
             return {
                 "url": url,
                 "title": data.get("title", ""),
                 "content": data.get("content", ""),
-                "output_path": output_path,
-                "status": "success"
+                "output_path": match[1] or "",
+                "status": "duplicate",
+                "duplicate_of": match[0]
             }
-            
-        except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
-            if 'driver' in locals():
-                driver.quit()
-            raise
+        
+        # Add timestamp and parameters
+        data["timestamp"] = datetime.now().isoformat()
+        data["scrape_depth"] = depth
+        data["url"] = url
+        
+        # Analyze the content
+        data = self._analyze_content(data)
+        
+        # Crawl additional pages if depth > 1 and not a PDF
+        checkpoint = None
+        if depth > 1 and not is_pdf:
+            checkpoint = CrawlCheckpoint(self.checkpoints, f"enhanced:{url}:{depth}", resume=resume)
+            data["linked_pages"], data["crawl_stats"] = self._crawl_links(url, data["links"], depth - 1,
+                                                                          wait_time, checkpoint)
+        
+        # Save the results
+        output_path = self._save_output(data, output_format)
+        self.near_duplicates.add(url, fingerprint, output_path)
+        
+        # The crawl is complete, so its checkpoint is no longer needed
+        if checkpoint is not None:
+            checkpoint.finish()
+        
+        result = {
+            "url": url,
+            "title": data.get("title", ""),
+            "content": data.get("content", ""),
+            "output_path": output_path,
+            "status": "success"
+        }
+        if "crawl_stats" in data:
+            result["crawl_stats"] = data["crawl_stats"]
+        return result
     
-    def _scroll_page(self, driver, max_scrolls=10):
+    def _scroll_page(self, driver, url):
         """
-        Scroll the page to load lazy content
+        Scroll the page to load lazy content, stopping once it stops growing
         
         Args:
             driver: Selenium WebDriver
-            max_scrolls: Maximum number of scrolls
+            url: URL of the page, whose domain the scroll count is recorded under
         """
-        for _ in range(max_scrolls):
-            # Scroll down
-            driver.execute_script("window.scrollBy(0, window.innerHeight);")
-            time.sleep(1)
+        self.scroller.scroll(driver, urlparse(url).netloc)
     
-    def _extract_data(self, soup, url, driver):
+    def _extract_data(self, soup, url):
         """
         Extract data from parsed HTML
         
         Args:
             soup: BeautifulSoup object
             url: URL being scraped
-            driver: Selenium WebDriver
+            
+        Returns:
+            dict: Extracted data
+        """
+        # Collect title, meta description, links, headings, images, tables and code in one walk
+        elements = extract_elements(soup, url, tables=True, code_blocks=True)
+        
+        # Main content from the domain's learned selector, or scored by text
+        # and link density, without navigation and footers
+        content = content_text(self.selector_cache.find(soup, urlparse(url).netloc), separator="\n")
+        
+        return self._page_data(url, elements, content)
+    
+    def _page_data(self, url, elements, content):
+        """
+        Assemble the data of a page from its elements and main content
+        
+        Args:
+            url: URL being scraped
+            elements: Page elements in the shape of extraction.extract_elements
+            content: Main content text
             
         Returns:
             dict: Extracted data
@@ -429,157 +767,158 @@ class EnhancedWebScraper:
             "path": urlparse(url).path,
         }
         
-        # Extract title
-        title_tag = soup.find("title")
-        if title_tag:
-            data["title"] = title_tag.text.strip()
-        else:
-            data["title"] = "No title found"
-        
-        # Extract meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc:
-            data["meta_description"] = meta_desc.get("content", "")
-        
-        # Extract main content - try to find specific content containers first
-        content_selectors = [
-            "main", "article", "#content", ".content", 
-            "#main", ".main", ".post", ".entry", 
-            "[role='main']", "[role='article']", ".document-content",
-            ".docContent", "#documentation", ".documentation"
-        ]
-        
-        content = ""
-        for selector in content_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    # Get text from all matching elements
-                    content = "\n".join([elem.text for elem in elements])
-                    break
-            except:
-                continue
+        data["title"] = elements["title"] if elements["title"] is not None else "No title found"
+        if elements["meta_description"] is not None:
+            data["meta_description"] = elements["meta_description"]
         
-        # If no content found with selectors, use the body
-        if not content:
-            content = soup.body.get_text(separator="\n", strip=True) if soup.body else ""
-            
         data["content"] = content
-        
-        # Extract links
-        links = []
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if href and not href.startswith("#") and not href.startswith("javascript:"):
-                links.append({
-                    "text": link.text.strip(),
-                    "href": urljoin(url, href)
-                })
-        
-        data["links"] = links
-        
-        # Extract headings - Include level and text for all h1-h6 tags
-        headings = []
-        for heading_level in range(1, 7):
-            for heading in soup.find_all(f"h{heading_level}"):
-                headings.append({
-                    "level": heading_level,
-                    "text": heading.text.strip()
-                })
-        
-        data["headings"] = headings
-        
-        # Extract images
-        images = []
-        for img in soup.find_all("img", src=True):
-            src = img.get("src", "")
-            if src:
-                images.append({
-                    "src": urljoin(url, src),
-                    "alt": img.get("alt", ""),
-                    "title": img.get("title", "")
-                })
-        
-        data["images"] = images
-        
-        # Extract tables
-        tables = []
-        for table in soup.find_all("table"):
-            tables.append(str(table))
-        
-        data["tables"] = tables
-        
-        # Extract code blocks
-        code_blocks = []
-        for code in soup.find_all(["code", "pre"]):
-            code_blocks.append(code.text.strip())
-        
-        data["code_blocks"] = code_blocks
+        data["links"] = elements["links"]
+        data["headings"] = elements["headings"]
+        data["images"] = elements["images"]
+        data["tables"] = elements["tables"]
+        data["code_blocks"] = elements["code_blocks"]
         
         return data
     
-    def _crawl_links(self, base_url, soup, driver, depth, wait_time):
+    def _crawl_links(self, base_url, page_links, depth, wait_time, checkpoint=None):
         """
         Crawl links from the page using Selenium
         
         Args:
             base_url: Base URL for resolving relative links
-            soup: BeautifulSoup object
-            driver: Selenium WebDriver
+            page_links: Link records of the page ({"text", "href"}) from _extract_data
             depth: Remaining crawl depth
-            wait_time: How many seconds to wait for each page
-            
+            wait_time: Most seconds to wait for each page to become ready
+            checkpoint: Optional CrawlCheckpoint recording progress
+        
         Returns:
-            list: Data from linked pages
+            tuple: (data from linked pages, crawl stats as returned by _crawl_link_list)
         """
         if depth <= 0:
-            return []
+            return self._crawl_link_list([], wait_time)
         
-        # Extract links from the page
+        # Continue an interrupted crawl from its checkpoint
+        if checkpoint is not None and checkpoint.resumed and checkpoint.frontier:
+            return self._crawl_link_list(checkpoint.frontier, wait_time, checkpoint)
+        
+        # Follow the links already collected by _extract_data
         links = []
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if href and not href.startswith("#") and not href.startswith("javascript:"):
-                absolute_url = urljoin(base_url, href)
-                # Only include links from the same domain
-                if urlparse(absolute_url).netloc == urlparse(base_url).netloc:
-                    links.append(absolute_url)
+        seen = set()
+        base_netloc = urlparse(normalize_url(base_url)).netloc
+        for link in page_links:
+            absolute_url = normalize_url(link["href"], base_url)
+            key = canonicalize_url(absolute_url)
+            # Only include links from the same domain
+            if urlparse(absolute_url).netloc == base_netloc and key not in seen:
+                seen.add(key)
+                links.append(absolute_url)
         
-        # Remove duplicate links and already visited URLs
-        links = [link for link in set(links) if link not in self.visited_urls]
+        # Remove already visited URLs
+        links = [link for link in links if link not in self.visited_urls]
         
         # Limit to 10 links per page to avoid excessive crawling
         links = links[:10]
         
-        # Crawl each link
-        linked_data = []
-        for link in links:
-            try:
-                # Mark URL as visited
-                self.visited_urls.add(link)
-                
-                # Navigate to the link
-                driver.get(link)
-                time.sleep(wait_time)
-                
-                # Parse the page
-                link_soup = BeautifulSoup(driver.page_source, "html.parser")
-                
-                # Extract data from the page
-                data = self._extract_data(link_soup, link, driver)
+        if checkpoint is not None:
+            checkpoint.set_frontier(links)
+        
+        return self._crawl_link_list(links, wait_time, checkpoint)
+    
+    def _crawl_link_list(self, links, wait_time, checkpoint=None):
+        """
+        Render and summarize a list of links in parallel, skipping ones already visited or checkpointed
+        
+        Args:
+            links: List of absolute URLs
+            wait_time: Most seconds to wait for each page to become ready
+            checkpoint: Optional CrawlCheckpoint recording progress
+        
+        Returns:
+            tuple: (data from linked pages, crawl stats: pages rendered, pages failed, seconds
+                    and pages per second)
+        """
+        linked_data = list(checkpoint.results) if checkpoint is not None else []
+        
+        # Mark URLs as visited, skipping other spellings of pages already crawled in this scrape or batch
+        pending = [link for link in links
+                   if (checkpoint is None or not checkpoint.is_done(link)) and self.visited_urls.add(link)]
+        
+        started = time.monotonic()
+        rendered = {}
+        summaries = {}
+        lock = threading.Lock()
+        
+        def on_rendered(link, data):
+            # Runs in the rendering threads, so each page is checkpointed as soon as it is read
+            with lock:
+                # Leave near-duplicates out of the results
+                if self.near_duplicates.check(link, data.get("content", "")) is not None:
+                    if checkpoint is not None:
+                        checkpoint.mark_done(link)
+                    return
                 
-                # Add to the results
-                linked_data.append({
+                summaries[link] = {
                     "url": link,
                     "title": data.get("title", ""),
                     "content_summary": data.get("content", "")[:300] + "...",
                     "headings": data.get("headings", [])[:5]  # Include first 5 headings for context
-                })
-                
+                }
+                if checkpoint is not None:
+                    checkpoint.mark_done(link, result=summaries[link])
+        
+        if pending:
+            self._render_in_sessions(pending, wait_time, rendered, on_rendered)
+        
+        # Add to the results in link order
+        linked_data.extend(summaries[link] for link in pending if link in summaries)
+        
+        if checkpoint is not None:
+            checkpoint.save()
+        
+        seconds = time.monotonic() - started
+        pages = sum(1 for data in rendered.values() if not isinstance(data, Exception))
+        stats = {
+            "pages": pages,
+            "failed": len(pending) - pages,
+            "seconds": round(seconds, 3),
+            "pages_per_second": round(pages / seconds, 2) if seconds > 0 else 0.0
+        }
+        if pending:
+            logger.info(f"Crawled {pages} of {len(pending)} linked pages in {seconds:.1f}s "
+                        f"({stats['pages_per_second']} pages/sec)")
+        
+        return linked_data, stats
+    
+    def _render_in_sessions(self, urls, wait_time, rendered, on_rendered=None):
+        """
+        Render URLs in tabs of several pooled sessions at once, at most crawl_concurrency pages in flight
+        
+        Args:
+            urls: URLs of HTML pages
+            wait_time: Most seconds to wait for each page to become ready
+            rendered: dict filled with URL -> extracted data, or the exception that page raised
+            on_rendered: Optional callback(url, data) called from the rendering threads as each page is extracted
+        """
+        concurrency = max(1, min(self.crawl_concurrency, len(urls)))
+        sessions = min(self.driver_pool.max_size, concurrency)
+        tabs = (concurrency + sessions - 1) // sessions
+        
+        def render(chunk):
+            try:
+                self._render_in_tabs(chunk, False, wait_time, tabs, rendered, on_rendered)
             except Exception as e:
-                logger.error(f"Error crawling {link}: {str(e)}")
+                # A failed session fails only the pages it had not read yet
+                logger.error(f"Error rendering linked pages: {str(e)}")
+                for url in chunk:
+                    rendered.setdefault(url, e)
+        
+        if sessions == 1:
+            render(urls)
+            return
         
-        return linked_data
+        # Each worker leases its own session from the pool
+        with ThreadPoolExecutor(max_workers=sessions) as executor:
+            list(executor.map(render, [urls[i::sessions] for i in range(sessions)]))
     
     def _analyze_content(self, data):
         """
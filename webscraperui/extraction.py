@@ -0,0 +1,87 @@
+"""
+Page Element Extraction module for the WebScraperUI application
+
+Collects a page's title, meta description, links, headings, images,
+tables and code blocks in a single walk over the parsed tree.
+"""
+import logging
+from urllib.parse import urljoin
+
+from bs4 import Tag
+
+logger = logging.getLogger(__name__)
+
+HEADING_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+
+
+def extract_elements(soup, url, links=True, headings=True, images=True, tables=False, code_blocks=False):
+    """
+    Extract page elements in one traversal of the tree
+
+    Args:
+        soup: BeautifulSoup object
+        url: URL of the page, for resolving relative links and images
+        links: Collect <a href> links
+        headings: Collect h1-h6 headings in document order
+        images: Collect <img src> images
+        tables: Collect the HTML of <table> elements
+        code_blocks: Collect the text of <code> and <pre> elements
+
+    Returns:
+        dict: "title" and "meta_description" (None when missing) and a list for
+            each requested element kind
+    """
+    result = {"title": None, "meta_description": None}
+    for key, wanted in (("links", links), ("headings", headings), ("images", images),
+                        ("tables", tables), ("code_blocks", code_blocks)):
+        if wanted:
+            result[key] = []
+
+    found_links = result.get("links")
+    found_headings = result.get("headings")
+    found_images = result.get("images")
+    found_tables = result.get("tables")
+    found_code = result.get("code_blocks")
+
+    for node in soup.descendants:
+        if not isinstance(node, Tag):
+            continue
+        name = node.name
+
+        if name == "a":
+            if found_links is not None:
+                href = node.get("href")
+                if href and not href.startswith("#") and not href.startswith("javascript:"):
+                    found_links.append({
+                        "text": node.text.strip(),
+                        "href": urljoin(url, href)
+                    })
+        elif name in HEADING_LEVELS:
+            if found_headings is not None:
+                found_headings.append({
+                    "level": HEADING_LEVELS[name],
+                    "text": node.text.strip()
+                })
+        elif name == "img":
+            if found_images is not None:
+                src = node.get("src")
+                if src:
+                    found_images.append({
+                        "src": urljoin(url, src),
+                        "alt": node.get("alt", ""),
+                        "title": node.get("title", "")
+                    })
+        elif name == "code" or name == "pre":
+            if found_code is not None:
+                found_code.append(node.text.strip())
+        elif name == "table":
+            if found_tables is not None:
+                found_tables.append(str(node))
+        elif name == "title":
+            if result["title"] is None:
+                result["title"] = node.text.strip()
+        elif name == "meta":
+            if result["meta_description"] is None and node.get("name") == "description":
+                result["meta_description"] = node.get("content", "")
+
+    return result
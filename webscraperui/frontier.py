@@ -0,0 +1,261 @@
+"""
+URL Frontier module for the WebScraperUI application
+
+Keeps the crawl queue in SQLite so multi-level crawls can grow to tens of
+thousands of pages with bounded memory and resume after a crash.
+"""
+import os
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+VISITED = "visited"
+FAILED = "failed"
+
+
+class URLFrontier:
+    """
+    Persistent breadth-first URL frontier.
+
+    URLs are handed out shallowest depth first, then by descending
+    priority, then in discovery order. Every URL is stored once under its
+    key, so the table doubles as the crawl's visited set.
+    """
+
+    def __init__(self, db_path, key_func=None):
+        """
+        Initialize the URLFrontier
+
+        Args:
+            db_path: Path of the SQLite database file
+            key_func: Maps a URL to its identity (e.g. canonicalize_url); URLs
+                with the same key are stored once, under the first URL seen
+        """
+        self.db_path = db_path
+        self.key_func = key_func or (lambda url: url)
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(db_path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS urls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL UNIQUE,
+                url TEXT NOT NULL,
+                depth INTEGER NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                state TEXT NOT NULL,
+                parent TEXT,
+                result TEXT,
+                error TEXT,
+                updated_at REAL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_urls_queue ON urls (state, depth, priority DESC, id)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_urls_url ON urls (url)")
+
+    def add(self, url, depth, priority=0, parent=None, state=PENDING):
+        """
+        Add a URL to the frontier unless it is already known
+
+        Args:
+            url: URL to add
+            depth: Crawl depth of the URL
+            priority: Higher values are crawled first within a depth
+            parent: URL the link was found on
+            state: Initial state (default: pending)
+
+        Returns:
+            bool: True if the URL was new
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO urls (key, url, depth, priority, state, parent, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.key_func(url), url, depth, priority, state, parent, time.time())
+            )
+            return cursor.rowcount > 0
+
+    def add_many(self, urls, depth, priority=0, parent=None):
+        """
+        Add several URLs at the same depth in one transaction
+
+        Args:
+            urls: Iterable of URLs
+            depth: Crawl depth of the URLs
+            priority: Higher values are crawled first within a depth
+            parent: URL the links were found on
+
+        Returns:
+            int: Number of URLs that were new
+        """
+        now = time.time()
+        rows = [(self.key_func(url), url, depth, priority, PENDING, parent, now) for url in urls]
+        if not rows:
+            return 0
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO urls (key, url, depth, priority, state, parent, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute("COMMIT")
+            return self._conn.total_changes - before
+
+    def next_batch(self, limit, max_depth=None):
+        """
+        Claim the next pending URLs in breadth-first order
+
+        Args:
+            limit: Maximum number of URLs to claim
+            max_depth: Optional maximum depth to hand out
+
+        Returns:
+            list: (url, depth) tuples now marked in progress
+        """
+        query = "SELECT id, url, depth FROM urls WHERE state = ?"
+        params = [PENDING]
+        if max_depth is not None:
+            query += " AND depth <= ?"
+            params.append(max_depth)
+        query += " ORDER BY depth, priority DESC, id LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(query, params).fetchall()
+            self._conn.executemany(
+                "UPDATE urls SET state = ?, updated_at = ? WHERE id = ?",
+                [(IN_PROGRESS, time.time(), row[0]) for row in rows]
+            )
+            self._conn.execute("COMMIT")
+        return [(row[1], row[2]) for row in rows]
+
+    def mark_visited(self, url, result=None):
+        """
+        Mark a URL as successfully crawled
+
+        Args:
+            url: Crawled URL
+            result: Optional JSON-serializable page summary to keep
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE urls SET state = ?, result = ?, error = NULL, updated_at = ? WHERE url = ?",
+                (VISITED, json.dumps(result) if result is not None else None, time.time(), url)
+            )
+
+    def mark_failed(self, url, error=""):
+        """
+        Mark a URL as failed
+
+        Args:
+            url: URL that failed
+            error: Error message
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE urls SET state = ?, error = ?, updated_at = ? WHERE url = ?",
+                (FAILED, str(error), time.time(), url)
+            )
+
+    def reset_in_progress(self):
+        """
+        Return URLs claimed by a crawl that died back to the queue
+
+        Returns:
+            int: Number of URLs requeued
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE urls SET state = ?, updated_at = ? WHERE state = ?",
+                (PENDING, time.time(), IN_PROGRESS)
+            )
+            return cursor.rowcount
+
+    def is_known(self, url):
+        """
+        Check whether a URL has already been added
+
+        Args:
+            url: URL to check
+
+        Returns:
+            bool: True if the URL is in the frontier in any state
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM urls WHERE key = ?", (self.key_func(url),)).fetchone()
+        return row is not None
+
+    def state_of(self, url):
+        """
+        Get the state of a URL
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            str: State name, or None if the URL is unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM urls WHERE key = ?", (self.key_func(url),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def results(self, min_depth=1):
+        """
+        Iterate over stored summaries of visited URLs in crawl order
+
+        Args:
+            min_depth: Smallest depth to include
+
+        Yields:
+            dict: Stored page summaries
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT result FROM urls WHERE state = ? AND depth >= ? AND result IS NOT NULL "
+                "ORDER BY depth, id",
+                (VISITED, min_depth)
+            ).fetchall()
+        for row in rows:
+            yield json.loads(row[0])
+
+    def counts(self):
+        """
+        Count URLs per state
+
+        Returns:
+            dict: state -> number of URLs
+        """
+        counts = {PENDING: 0, IN_PROGRESS: 0, VISITED: 0, FAILED: 0}
+        with self._lock:
+            for state, count in self._conn.execute("SELECT state, COUNT(*) FROM urls GROUP BY state"):
+                counts[state] = count
+        return counts
+
+    def clear(self):
+        """Remove every URL from the frontier"""
+        with self._lock:
+            self._conn.execute("DELETE FROM urls")
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,227 @@
+"""
+HTTP Cache module for the WebScraperUI application
+
+Stores response bodies on disk together with their ETag/Last-Modified
+validators so recrawls can send conditional GETs and serve 304s from disk.
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPCache:
+    """
+    On-disk HTTP response cache with size-based LRU eviction.
+
+    Each URL is stored as a body file plus a small JSON metadata file.
+    The body file's modification time is bumped on every hit, so eviction
+    removes the least recently used entries first.
+    """
+
+    def __init__(self, cache_dir, max_size_bytes=256 * 1024 * 1024, ttl=None):
+        """
+        Initialize the HTTPCache
+
+        Args:
+            cache_dir: Folder to store cached responses in
+            max_size_bytes: Maximum total size of cached bodies
+            ttl: Seconds an entry is served without revalidation (None: always revalidate)
+        """
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._total_size = None
+
+        # Create cache folder if it doesn't exist
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+    def _paths(self, url):
+        """
+        Get the metadata and body paths for a URL
+
+        Args:
+            url: Cached URL
+
+        Returns:
+            tuple: (metadata path, body path)
+        """
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.json", f"{base}.body"
+
+    def get(self, url):
+        """
+        Look up the cache entry for a URL
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            dict: Entry metadata, or None if the URL is not cached
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("url") != url or not os.path.exists(body_path):
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        """
+        Check whether an entry may be served without revalidation
+
+        Args:
+            entry: Entry metadata
+
+        Returns:
+            bool: True if the entry is within the TTL override
+        """
+        return self.ttl is not None and time.time() - entry.get("stored_at", 0) < self.ttl
+
+    def conditional_headers(self, entry):
+        """
+        Build conditional request headers from an entry's validators
+
+        Args:
+            entry: Entry metadata
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def read_body(self, entry):
+        """
+        Read a cached body and mark the entry as recently used
+
+        Args:
+            entry: Entry metadata
+
+        Returns:
+            str: Decoded response body
+        """
+        _, body_path = self._paths(entry["url"])
+        with open(body_path, "rb") as f:
+            body = f.read()
+        os.utime(body_path)
+        return body.decode(entry.get("encoding") or "utf-8", errors="replace")
+
+    def revalidated(self, entry):
+        """
+        Record that the server confirmed an entry is still current (304)
+
+        Args:
+            entry: Entry metadata
+        """
+        entry["stored_at"] = time.time()
+        meta_path, _ = self._paths(entry["url"])
+        self._write_atomic(meta_path, json.dumps(entry).encode("utf-8"))
+
+    def store(self, url, response, body=None):
+        """
+        Store a response if it can be revalidated or a TTL is configured
+
+        Args:
+            url: Requested URL
+            response: requests.Response with status 200
+            body: Body bytes, for streamed responses whose content was already read
+
+        Returns:
+            bool: True if the response was cached
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        cache_control = response.headers.get("Cache-Control", "").lower()
+
+        if response.status_code != 200 or "no-store" in cache_control:
+            return False
+        if not etag and not last_modified and self.ttl is None:
+            return False
+
+        if body is None:
+            body = response.content
+        if len(body) > self.max_size_bytes:
+            return False
+
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": response.encoding or response.apparent_encoding,
+            "content_type": response.headers.get("Content-Type", ""),
+            "stored_at": time.time(),
+            "size": len(body)
+        }
+
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            self._ensure_size()
+            old_size = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps(entry).encode("utf-8"))
+            self._total_size += len(body) - old_size
+        self.evict()
+        return True
+
+    def _write_atomic(self, path, data):
+        """Write bytes to a file via a temporary file and rename"""
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _ensure_size(self):
+        """Compute the total cached size on first use (caller holds the lock)"""
+        if self._total_size is None:
+            self._total_size = sum(
+                entry.stat().st_size for entry in os.scandir(self.cache_dir)
+                if entry.name.endswith(".body")
+            )
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits its size limit"""
+        with self._lock:
+            self._ensure_size()
+            if self._total_size <= self.max_size_bytes:
+                return
+
+            bodies = [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith(".body")]
+            bodies.sort(key=lambda entry: entry.stat().st_mtime)
+
+            for entry in bodies:
+                if self._total_size <= self.max_size_bytes:
+                    break
+                size = entry.stat().st_size
+                meta_path = entry.path[:-len(".body")] + ".json"
+                for path in (entry.path, meta_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                self._total_size -= size
+
+            logger.info(f"Evicted HTTP cache entries, cache size now {self._total_size} bytes")
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith((".body", ".json")):
+                    os.remove(entry.path)
+            self._total_size = 0
@@ -0,0 +1,177 @@
+"""
+HTTP Session module for the WebScraperUI application
+
+Provides a shared, pooled keep-alive HTTP session so that repeated requests
+to the same host reuse TCP/TLS connections instead of opening new ones.
+"""
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) WebScraperUI/1.0.0"
+}
+
+
+class HTTPSessionManager:
+    """
+    Manages a requests.Session with per-host connection pooling.
+
+    The underlying urllib3 pool manager keeps one connection pool per host,
+    so every scraper sharing a manager reuses warm keep-alive connections.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=20, max_retries=2,
+                 backoff_factor=0.3, headers=None, timeout=(10, 30)):
+        """
+        Initialize the HTTPSessionManager
+
+        Args:
+            pool_connections: Number of per-host pools to keep alive
+            pool_maxsize: Maximum connections kept alive per host
+            max_retries: Retries for connection errors and transient statuses
+            backoff_factor: Backoff factor between retries
+            headers: Default headers sent with every request
+            timeout: Default (connect, read) timeout in seconds
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self.timeout = timeout
+        self._session = None
+        self._single_attempt_session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """Return the managed session, creating it on first use"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session(self.max_retries)
+        return self._session
+
+    @property
+    def single_attempt_session(self):
+        """Return the pooled session without adapter retries, for callers that retry themselves"""
+        if self._single_attempt_session is None:
+            with self._lock:
+                if self._single_attempt_session is None:
+                    self._single_attempt_session = self._build_session(0)
+        return self._single_attempt_session
+
+    def _build_session(self, max_retries):
+        """
+        Build a requests.Session with pooled adapters mounted
+
+        Args:
+            max_retries: Retries for connection errors and transient statuses
+
+        Returns:
+            requests.Session: Configured session
+        """
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(502, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry
+        )
+
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        logger.info(f"Created pooled HTTP session (pool_connections={self.pool_connections}, "
+                    f"pool_maxsize={self.pool_maxsize}, max_retries={max_retries})")
+        return session
+
+    def request(self, method, url, retry=True, **kwargs):
+        """
+        Send a request through the pooled session
+
+        Args:
+            method: HTTP method
+            url: URL to request
+            retry: Whether the adapter retries failed attempts; calls wrapped in a
+                FaultHandler pass False so its retries are not multiplied by the adapter's
+            **kwargs: Extra arguments passed to requests
+
+        Returns:
+            requests.Response: The response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.session if retry else self.single_attempt_session
+        return session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        """Send a GET request through the pooled session"""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        """Send a HEAD request through the pooled session"""
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self):
+        """Close the sessions and release all pooled connections"""
+        with self._lock:
+            for session in (self._session, self._single_attempt_session):
+                if session is not None:
+                    session.close()
+            self._session = None
+            self._single_attempt_session = None
+
+
+_default_manager = None
+_default_lock = threading.Lock()
+
+
+def get_session_manager():
+    """
+    Get the process-wide shared HTTPSessionManager
+
+    Returns:
+        HTTPSessionManager: Shared session manager
+    """
+    global _default_manager
+    if _default_manager is None:
+        with _default_lock:
+            if _default_manager is None:
+                _default_manager = HTTPSessionManager()
+    return _default_manager
+
+
+def configure_session_manager(**kwargs):
+    """
+    Replace the shared HTTPSessionManager with a newly configured one
+
+    Args:
+        **kwargs: Arguments for HTTPSessionManager
+
+    Returns:
+        HTTPSessionManager: The new shared session manager
+    """
+    global _default_manager
+    with _default_lock:
+        if _default_manager is not None:
+            _default_manager.close()
+        _default_manager = HTTPSessionManager(**kwargs)
+    return _default_manager
@@ -0,0 +1,302 @@
+"""
+Hybrid Fetch module for the WebScraperUI application
+
+Fetches pages with plain HTTP first and renders them in the browser only
+when the static HTML looks like a JavaScript shell: an empty framework
+root, a noscript warning, an empty main container or very little text.
+The decision is remembered per domain, so sites that need the browser
+skip the static attempt (re-checking it now and then) and sites that do
+not never start one.
+"""
+import os
+import re
+import json
+import time
+import logging
+import threading
+from urllib.parse import urlparse
+
+from webscraperui.content_extractor import content_text, find_main_content
+from webscraperui.document import parse_document
+from webscraperui.extraction import extract_elements
+
+logger = logging.getLogger(__name__)
+
+# Mount points of client-side frameworks; empty ones mean the page is built by scripts
+FRAMEWORK_ROOTS = ("#root", "#app", "#__next", "#__nuxt", "#___gatsby", "[ng-app]", "[data-reactroot]", "app-root")
+
+NOSCRIPT_WARNING = re.compile(
+    r"(enable|turn on|activate)\s+javascript|javascript\s+(is\s+)?(required|disabled|needed)|requires?\s+javascript",
+    re.IGNORECASE
+)
+
+
+def rendering_reasons(html, url=None, min_main_chars=200, min_root_chars=200, min_density=0.02):
+    """
+    Find signs that a page's static HTML needs JavaScript to show its content
+
+    Args:
+        html: Static HTML of the page
+        url: URL of the page
+        min_main_chars: Least text the main content container must hold
+        min_root_chars: Least text a framework mount point must hold
+        min_density: Least share of the HTML that must be visible text
+
+    Returns:
+        list: Reasons to render the page (empty if the static HTML is enough)
+    """
+    soup = parse_document(html, url).soup
+    reasons = []
+
+    # Without scripts nothing could add content later, however short the page
+    if soup.find("script") is None:
+        return reasons
+
+    for selector in FRAMEWORK_ROOTS:
+        root = soup.select_one(selector)
+        if root is not None and len(root.get_text(strip=True)) < min_root_chars:
+            reasons.append(f"empty framework root {selector}")
+            break
+
+    for noscript in soup.find_all("noscript"):
+        if NOSCRIPT_WARNING.search(noscript.get_text(" ")):
+            reasons.append("noscript warning")
+            break
+
+    main_text = content_text(find_main_content(soup)) if soup.body is not None else ""
+    if len(main_text) < min_main_chars:
+        reasons.append(f"main content has {len(main_text)} characters")
+    elif html and len(main_text) / len(html) < min_density:
+        reasons.append(f"text density {len(main_text) / len(html):.3f}")
+
+    return reasons
+
+
+class HybridScraper:
+    """
+    Static-first scraper that escalates JavaScript-rendered pages to the browser.
+
+    Offers get_html_content, scrape and scrape_many like EnhancedWebScraper,
+    with results marked by "fetch_mode" ("static" or "browser").
+    """
+
+    def __init__(self, static_scraper, browser_factory, path, recheck_every=20):
+        """
+        Initialize the HybridScraper
+
+        Args:
+            static_scraper: WebScraper used for plain HTTP fetches, with crawl limits matching the
+                browser's (see WebScraper.with_limits)
+            browser_factory: Callable returning the EnhancedWebScraper to escalate to (started on first use)
+            path: JSON file the per-domain decisions are kept in
+            recheck_every: Pages of a browser domain after which plain HTTP is tried again
+        """
+        self.static_scraper = static_scraper
+        self.browser_factory = browser_factory
+        self.path = path
+        self.recheck_every = recheck_every
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._domains = json.load(f)
+        except (OSError, ValueError):
+            self._domains = {}
+
+    def get_html_content(self, url, scroll=True, wait_time=5):
+        """
+        Fetch HTML content from a URL without saving to a file
+
+        Args:
+            url: URL to fetch content from
+            scroll: Whether to scroll a rendered page to load lazy content
+            wait_time: Most seconds to wait for a rendered page to become ready
+
+        Returns:
+            dict: HTML content and metadata, as EnhancedWebScraper.get_html_content
+        """
+        html = self._static_html(url)
+        if html is None:
+            result = self.browser_factory().get_html_content(url, scroll=scroll, wait_time=wait_time)
+            result["fetch_mode"] = "browser"
+            return result
+
+        soup = parse_document(html, url).soup
+        elements = extract_elements(soup, url, links=False, images=False)
+        return {
+            "html": html,
+            "title": elements["title"] if elements["title"] is not None else "No title found",
+            "meta_description": elements["meta_description"] or "",
+            "url": url,
+            "headings": elements["headings"][:10],
+            "fetch_mode": "static"
+        }
+
+    def scrape(self, url, depth=1, output_format="txt", scroll=True, wait_time=5, resume=False):
+        """
+        Scrape a URL, rendering it only if its static HTML is not enough
+
+        Args:
+            url: Starting URL to scrape
+            depth: How many levels deep to scrape (default: 1)
+            output_format: Format for saving output (txt, json, html)
+            scroll: Whether to scroll a rendered page to load lazy content
+            wait_time: Most seconds to wait for each rendered page to become ready
+            resume: Skip linked pages already done by an interrupted crawl of this URL
+
+        Returns:
+            dict: Scraped data and status
+        """
+        html = self._static_html(url)
+        if html is None:
+            result = self.browser_factory().scrape(url, depth=depth, output_format=output_format,
+                                                   scroll=scroll, wait_time=wait_time, resume=resume)
+            result["fetch_mode"] = "browser"
+            return result
+
+        result = self.static_scraper.scrape(url, depth=depth, output_format=output_format, resume=resume, html=html)
+        result["fetch_mode"] = "static"
+        return result
+
+    def scrape_many(self, urls, depth=1, output_format="txt", scroll=True, wait_time=5, resume=False,
+                    tabs=4, on_result=None):
+        """
+        Scrape several URLs, rendering those whose static HTML is not enough in parallel tabs
+
+        Args:
+            urls: URLs to scrape
+            depth: How many levels deep to scrape from each URL (default: 1)
+            output_format: Format for saving output (txt, json, html)
+            scroll: Whether to scroll rendered pages to load lazy content
+            wait_time: Most seconds to wait for each rendered page to become ready
+            resume: Skip linked pages already done by interrupted crawls of these URLs
+            tabs: Most pages rendered at once
+            on_result: Optional callback(url, result) called as each URL is finished
+
+        Returns:
+            dict: URL -> result, as EnhancedWebScraper.scrape_many
+        """
+        results = {}
+        browser_urls = []
+        for url in urls:
+            html = self._static_html(url)
+            if html is None:
+                browser_urls.append(url)
+                continue
+            try:
+                result = self.static_scraper.scrape(url, depth=depth, output_format=output_format,
+                                                    resume=resume, html=html)
+                result["fetch_mode"] = "static"
+            except Exception as e:
+                logger.error(f"Error scraping {url}: {str(e)}")
+                result = {"url": url, "status": "error", "error": str(e)}
+            results[url] = result
+            if on_result is not None:
+                on_result(url, result)
+
+        if browser_urls:
+            logger.info(f"Rendering {len(browser_urls)} of {len(urls)} pages in the browser")
+
+            def on_rendered(url, result):
+                if result.get("status") != "error":
+                    result["fetch_mode"] = "browser"
+                results[url] = result
+                if on_result is not None:
+                    on_result(url, result)
+
+            self.browser_factory().scrape_many(browser_urls, depth=depth, output_format=output_format,
+                                               scroll=scroll, wait_time=wait_time, resume=resume,
+                                               tabs=tabs, on_result=on_rendered)
+        return results
+
+    def _static_html(self, url):
+        """
+        Fetch a page with plain HTTP unless its domain needs the browser
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            str: Static HTML, or None if the page should be rendered
+        """
+        # PDFs are extracted by the enhanced scraper without a browser
+        if urlparse(url).path.lower().endswith(".pdf"):
+            return None
+
+        domain = urlparse(url).netloc
+        if self._skip_static(domain):
+            return None
+
+        try:
+            html = self.static_scraper.fetch_html(url)
+        except Exception as e:
+            # Bot protection often refuses plain clients; the decision is left
+            # alone since the failure may have nothing to do with rendering
+            logger.info(f"Static fetch of {url} failed, rendering instead: {str(e)}")
+            return None
+
+        reasons = rendering_reasons(html, url)
+        self._record(domain, reasons)
+        if reasons:
+            logger.info(f"Rendering {url} in the browser: {', '.join(reasons)}")
+            return None
+        return html
+
+    def _skip_static(self, domain):
+        """Check whether a domain goes straight to the browser, counting towards its next re-check"""
+        with self._lock:
+            entry = self._domains.get(domain)
+            if entry is None or entry["mode"] != "browser":
+                return False
+            entry["since_check"] += 1
+            if entry["since_check"] > self.recheck_every:
+                return False
+            entry["browser"] += 1
+            return True
+
+    def _record(self, domain, reasons):
+        """Store the outcome of a static check and save if the domain's decision changed"""
+        mode = "browser" if reasons else "static"
+        with self._lock:
+            entry = self._domains.get(domain)
+            if entry is None:
+                entry = self._domains[domain] = {"mode": None, "static": 0, "browser": 0, "since_check": 0}
+            entry[mode] += 1
+            entry["since_check"] = 0
+            if entry["mode"] == mode:
+                return
+            logger.info(f"Fetching {domain} with {'the browser' if reasons else 'plain HTTP'}")
+            entry["mode"] = mode
+            entry["reasons"] = reasons
+            entry["updated_at"] = time.time()
+            self._save()
+
+    def stats(self, domain=None):
+        """
+        Get the per-domain fetch decisions
+
+        Args:
+            domain: Optional domain to report on
+
+        Returns:
+            dict: domain -> mode, pages fetched statically and in the browser, and the last reasons
+                  (or one domain's entry)
+        """
+        with self._lock:
+            if domain is not None:
+                return dict(self._domains.get(domain) or {})
+            return {name: dict(entry) for name, entry in self._domains.items()}
+
+    def _save(self):
+        """Atomically write the decisions (caller holds the lock)"""
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._domains, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Error saving fetch decisions to {self.path}: {str(e)}")
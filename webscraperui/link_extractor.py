@@ -6,8 +6,10 @@ particularly targeting documentation sites with similar structures.
 """
 import os
 import re
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from urllib.parse import urljoin
+from webscraperui.document import parse_document
+
+from webscraperui.url_utils import canonicalize_url, normalize_url
 
 class LinkExtractor:
     """
@@ -31,18 +33,9 @@ class LinkExtractor:
         Returns:
             list: List of dictionaries containing URL and text for each link
         """
-        links = []
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Find all anchor tags
-        for anchor in soup.find_all('a', href=True):
-            link = {
-                'url': anchor['href'],
-                'text': anchor.get_text(strip=True)
-            }
-            links.append(link)
-            
-        return links
+        # The shared document reuses an existing parse of this page, or
+        # parses only its anchors if no other stage has needed the tree
+        return [dict(link) for link in parse_document(html_content).links]
     
     def extract_links_from_file(self, file_path):
         """
@@ -64,7 +57,10 @@ class LinkExtractor:
     
     def make_links_absolute(self, links, base_url):
         """
-        Convert relative URLs to absolute URLs.
+        Convert relative URLs to absolute, normalized URLs.
+        
+        Fragments, default ports and scheme/host case are normalized away
+        and links that point at the same canonical URL are kept once.
         
         Args:
             links (list): List of link dictionaries
@@ -76,19 +72,34 @@ class LinkExtractor:
         absolute_links = []
         
         for link in links:
-            # Skip links that are already absolute
-            if bool(urlparse(link['url']).netloc):
-                absolute_links.append(link)
-            else:
-                # Convert relative link to absolute
-                absolute_url = urljoin(base_url, link['url'])
-                absolute_link = {
-                    'url': absolute_url,
-                    'text': link['text']
-                }
-                absolute_links.append(absolute_link)
+            absolute_link = {
+                'url': normalize_url(link['url'], base_url),
+                'text': link['text']
+            }
+            absolute_links.append(absolute_link)
+                
+        return self.dedupe_links(absolute_links)
+    
+    def dedupe_links(self, links):
+        """
+        Remove links whose URLs are canonically equal, keeping the first.
+        
+        Args:
+            links (list): List of link dictionaries
+            
+        Returns:
+            list: List of link dictionaries with unique canonical URLs
+        """
+        unique_links = []
+        seen_urls = set()
+        
+        for link in links:
+            key = canonicalize_url(link['url'])
+            if key not in seen_urls:
+                seen_urls.add(key)
+                unique_links.append(link)
                 
-        return absolute_links
+        return unique_links
     
     def filter_links_by_pattern(self, links, pattern):
         """
@@ -212,7 +223,7 @@ class LinkExtractor:
         Returns:
             list: Links to module pages with absolute URLs
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = parse_document(html_content, url).soup
         links = []
         
         # First, try to find links in the toctree structure which contains 
@@ -301,11 +312,4 @@ class LinkExtractor:
                             })
         
         # Remove duplicates while preserving order
-        unique_links = []
-        seen_urls = set()
-        for link in links:
-            if link['url'] not in seen_urls:
-                seen_urls.add(link['url'])
-                unique_links.append(link)
-        
-        return unique_links
+        return self.dedupe_links(links)
@@ -0,0 +1,110 @@
+"""
+HTML Parsing module for the WebScraperUI application
+
+Single factory for BeautifulSoup trees so every component uses the fastest
+installed parser backend: lxml when available, Python's html.parser
+otherwise. html5lib is only used when asked for explicitly.
+"""
+import os
+import logging
+import importlib.util
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# Environment variable that selects the parser ("auto", "lxml", "html5lib" or "html.parser")
+PARSER_ENV_VAR = "WEBSCRAPER_HTML_PARSER"
+
+# Parsers tried in order when the choice is "auto"; html5lib is correct but much slower
+AUTO_PARSERS = ("lxml", "html.parser")
+
+# Python module each optional parser backend needs
+PARSER_MODULES = {
+    "lxml": "lxml",
+    "html5lib": "html5lib",
+    "html.parser": None
+}
+
+# Only <a href> elements are built when a page is parsed for its links
+LINK_STRAINER = SoupStrainer("a", href=True)
+
+_available = None
+_warned = set()
+
+
+def available_parsers():
+    """
+    List the parser backends that can be used here
+
+    Returns:
+        list: Parser names, e.g. ["lxml", "html.parser"]
+    """
+    global _available
+    if _available is None:
+        _available = [
+            name for name, module in PARSER_MODULES.items()
+            if module is None or importlib.util.find_spec(module) is not None
+        ]
+    return _available
+
+
+def resolve_parser(parser=None):
+    """
+    Pick the parser backend to use
+
+    Args:
+        parser: Requested parser, or None to use the environment setting (default: "auto")
+
+    Returns:
+        str: Name of an installed parser backend
+    """
+    requested = (parser or os.environ.get(PARSER_ENV_VAR) or "auto").strip().lower()
+    available = available_parsers()
+
+    if requested == "auto":
+        return next(name for name in AUTO_PARSERS if name in available)
+
+    if requested in available:
+        return requested
+
+    if requested not in _warned:
+        _warned.add(requested)
+        logger.warning(f"HTML parser '{requested}' is not available, falling back to html.parser")
+    return "html.parser"
+
+
+def make_soup(markup, parser=None, parse_only=None):
+    """
+    Parse HTML into a BeautifulSoup tree
+
+    Args:
+        markup: HTML string or bytes (or an open file)
+        parser: Optional parser name overriding the configured one
+        parse_only: Optional SoupStrainer limiting which elements are built
+            (ignored by html5lib, which always builds the whole tree)
+
+    Returns:
+        BeautifulSoup: Parsed document
+    """
+    parser = resolve_parser(parser)
+    if parser == "html5lib":
+        parse_only = None
+    return BeautifulSoup(markup, parser, parse_only=parse_only)
+
+
+def make_link_soup(markup, parser=None):
+    """
+    Parse only the <a href> elements of an HTML document
+
+    The rest of the document is tokenized but never built into a tree,
+    which makes link discovery on large pages much cheaper than a full parse.
+
+    Args:
+        markup: HTML string or bytes (or an open file)
+        parser: Optional parser name overriding the configured one
+
+    Returns:
+        BeautifulSoup: Document holding just the links
+    """
+    return make_soup(markup, parser=parser, parse_only=LINK_STRAINER)
@@ -0,0 +1,262 @@
+"""
+Politeness Scheduler module for the WebScraperUI application
+
+Paces requests per host with a token bucket so crawls run at the highest
+rate each host accepts, backing off when a host answers 429 or 503.
+"""
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Status codes that mean "slow down"
+BACKOFF_STATUS_CODES = (429, 503)
+
+
+class TokenBucket:
+    """Token bucket for a single host"""
+
+    def __init__(self, rate, burst):
+        """
+        Initialize the TokenBucket
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.backoff = 1.0
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+
+    @property
+    def effective_rate(self):
+        """Current rate after adaptive backoff is applied"""
+        return self.rate / self.backoff
+
+    def reserve(self, now):
+        """
+        Take one token, possibly going into debt
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            float: Seconds the caller must wait before sending its request
+        """
+        elapsed = now - self.updated
+        self.tokens = min(self.burst, self.tokens + elapsed * self.effective_rate)
+        self.updated = now
+        self.tokens -= 1
+        self.requests += 1
+
+        delay = 0.0
+        if self.tokens < 0:
+            delay = -self.tokens / self.effective_rate
+        return max(delay, self.blocked_until - now)
+
+
+class PolitenessScheduler:
+    """
+    Shared per-host request scheduler.
+
+    Each host gets its own token bucket. A 429/503 response multiplies the
+    host's delay by backoff_factor (honouring Retry-After); successful
+    responses gradually restore the configured rate.
+    """
+
+    def __init__(self, default_rate=2.0, burst=4, host_rates=None,
+                 backoff_factor=2.0, max_backoff=32.0, recovery=0.8):
+        """
+        Initialize the PolitenessScheduler
+
+        Args:
+            default_rate: Requests per second allowed for hosts without an override
+            burst: Number of requests a host may receive back-to-back
+            host_rates: Optional dict of host -> requests per second
+            backoff_factor: Multiplier applied to a host's delay on 429/503
+            max_backoff: Upper bound for the backoff multiplier
+            recovery: Multiplier applied to the backoff on each successful response
+        """
+        self.default_rate = default_rate
+        self.burst = burst
+        self.host_rates = dict(host_rates or {})
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.recovery = recovery
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        """Get or create the token bucket for a host (caller holds the lock)"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate = self.host_rates.get(host, self.default_rate)
+            bucket = TokenBucket(rate, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def set_host_rate(self, host, rate, burst=None):
+        """
+        Override the request rate for a host
+
+        Args:
+            host: Host name (netloc)
+            rate: Requests per second
+            burst: Optional burst size for this host
+        """
+        with self._lock:
+            self.host_rates[host] = rate
+            bucket = self._bucket(host)
+            bucket.rate = rate
+            if burst is not None:
+                bucket.burst = burst
+                bucket.tokens = min(bucket.tokens, burst)
+
+    def reserve(self, url):
+        """
+        Reserve a request slot for a URL
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._bucket(host)
+            delay = bucket.reserve(time.monotonic())
+            if delay > 0:
+                bucket.throttled += 1
+        return delay
+
+    def wait(self, url):
+        """
+        Block until a request to the URL's host is allowed
+
+        Args:
+            url: URL about to be requested
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            logger.debug(f"Politeness delay of {delay:.2f}s for {url}")
+            time.sleep(delay)
+
+    async def wait_async(self, url):
+        """
+        Wait without blocking the event loop until a request is allowed
+
+        Args:
+            url: URL about to be requested
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record_response(self, url, status_code, retry_after=None):
+        """
+        Adapt a host's rate to the response it returned
+
+        Args:
+            url: URL that was requested
+            status_code: HTTP status code of the response
+            retry_after: Value of the Retry-After header, if any
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._bucket(host)
+            if status_code in BACKOFF_STATUS_CODES:
+                bucket.backoff = min(self.max_backoff, bucket.backoff * self.backoff_factor)
+                pause = self._parse_retry_after(retry_after)
+                if pause is None:
+                    pause = 1.0 / bucket.effective_rate
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + pause)
+                logger.warning(f"{host} answered {status_code}, backing off "
+                               f"to {bucket.effective_rate:.2f} req/s for at least {pause:.1f}s")
+            elif status_code < 400 and bucket.backoff > 1.0:
+                bucket.backoff = max(1.0, bucket.backoff * self.recovery)
+
+    def _parse_retry_after(self, value):
+        """
+        Parse a Retry-After header value
+
+        Args:
+            value: Header value (seconds or HTTP date)
+
+        Returns:
+            float: Seconds to pause, or None if absent or unparseable
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def host_stats(self):
+        """
+        Get pacing statistics for every host seen so far
+
+        Returns:
+            dict: host -> stats
+        """
+        with self._lock:
+            return {
+                host: {
+                    "rate": bucket.rate,
+                    "effective_rate": round(bucket.effective_rate, 3),
+                    "burst": bucket.burst,
+                    "requests": bucket.requests,
+                    "throttled": bucket.throttled
+                }
+                for host, bucket in self._buckets.items()
+            }
+
+
+_default_scheduler = None
+_default_lock = threading.Lock()
+
+
+def get_scheduler():
+    """
+    Get the process-wide shared PolitenessScheduler
+
+    Returns:
+        PolitenessScheduler: Shared scheduler
+    """
+    global _default_scheduler
+    if _default_scheduler is None:
+        with _default_lock:
+            if _default_scheduler is None:
+                _default_scheduler = PolitenessScheduler()
+    return _default_scheduler
+
+
+def configure_scheduler(**kwargs):
+    """
+    Replace the shared PolitenessScheduler with a newly configured one
+
+    Args:
+        **kwargs: Arguments for PolitenessScheduler
+
+    Returns:
+        PolitenessScheduler: The new shared scheduler
+    """
+    global _default_scheduler
+    with _default_lock:
+        _default_scheduler = PolitenessScheduler(**kwargs)
+    return _default_scheduler
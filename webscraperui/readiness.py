@@ -0,0 +1,239 @@
+"""
+Page Readiness module for the WebScraperUI application
+
+Waits for a rendered page to be ready instead of sleeping a fixed time:
+the document has reached a ready state, the network has been idle and
+the DOM has stopped changing for a short quiet period, and an optional
+content selector is present. Every wait is bounded by a ceiling timeout.
+Waits can be polled one check at a time, so several tabs can be watched
+from one driver.
+"""
+import time
+import logging
+
+from selenium.common.exceptions import JavascriptException
+
+logger = logging.getLogger(__name__)
+
+# Installed before page scripts run (and again late if that was not possible);
+# counts in-flight fetch/XHR requests and records the time of the last
+# network activity and DOM mutation
+PROBE_SCRIPT = """
+(function () {
+    if (window.__webscraperReady) { return; }
+    var state = window.__webscraperReady = {pending: 0, resources: 0, lastActivity: Date.now(), lastMutation: Date.now()};
+    function start() { state.pending++; state.lastActivity = Date.now(); }
+    function done() { state.pending = Math.max(0, state.pending - 1); state.lastActivity = Date.now(); }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        start();
+        this.addEventListener('loadend', done);
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            start();
+            return fetch.apply(this, arguments).finally(done);
+        };
+    }
+    new MutationObserver(function () { state.lastMutation = Date.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+})();
+"""
+
+# One round-trip reporting everything the readiness conditions look at
+STATUS_SCRIPT = PROBE_SCRIPT + """
+var state = window.__webscraperReady, now = Date.now();
+var resources = window.performance ? performance.getEntriesByType('resource').length : 0;
+if (resources !== state.resources) { state.resources = resources; state.lastActivity = now; }
+return {
+    readyState: document.readyState,
+    pending: state.pending,
+    networkQuiet: (now - state.lastActivity) / 1000,
+    domQuiet: (now - state.lastMutation) / 1000,
+    selector: arguments[0] ? document.querySelector(arguments[0]) !== null : true,
+    stale: window.__webscraperStale === true,
+    challenge: document.title.indexOf('Just a moment') !== -1 &&
+        document.documentElement.innerHTML.indexOf('Cloudflare') !== -1
+};
+"""
+
+# Starts a navigation without waiting for it, marking the old document so
+# it is not mistaken for the new page
+NAVIGATE_SCRIPT = "window.__webscraperStale = true; window.location.href = arguments[0];"
+
+READY_STATES = ("loading", "interactive", "complete")
+
+
+class ReadinessPolicy:
+    """
+    Conditions a rendered page must meet before it is read.
+
+    Each condition can be switched off with None. A page that has not met
+    them all within the ceiling timeout is read as it is.
+    """
+
+    def __init__(self, ready_state="interactive", network_idle=0.5, max_inflight=0,
+                 dom_quiet=0.3, selector=None, poll_interval=0.1, challenge_timeout=15):
+        """
+        Initialize the ReadinessPolicy
+
+        Args:
+            ready_state: Least document.readyState to reach ("interactive" or "complete")
+            network_idle: Seconds without new requests or responses
+            max_inflight: fetch/XHR requests allowed to stay open while the network counts as idle
+            dom_quiet: Seconds without DOM mutations
+            selector: CSS selector of an element that must be present
+            poll_interval: Seconds between checks
+            challenge_timeout: Extra seconds allowed for a Cloudflare challenge page to clear
+        """
+        if ready_state is not None and ready_state not in READY_STATES:
+            raise ValueError(f"Unknown ready state: {ready_state}")
+        self.ready_state = ready_state
+        self.network_idle = network_idle
+        self.max_inflight = max_inflight
+        self.dom_quiet = dom_quiet
+        self.selector = selector
+        self.poll_interval = poll_interval
+        self.challenge_timeout = challenge_timeout
+
+    def is_met(self, status):
+        """
+        Check a status report from the page against the conditions
+
+        Args:
+            status: dict returned by STATUS_SCRIPT
+
+        Returns:
+            bool: True if the page is ready
+        """
+        if status.get("stale") or status["challenge"]:
+            return False
+        if self.ready_state is not None and \
+                READY_STATES.index(status["readyState"]) < READY_STATES.index(self.ready_state):
+            return False
+        if self.network_idle is not None and \
+                (status["pending"] > self.max_inflight or status["networkQuiet"] < self.network_idle):
+            return False
+        if self.dom_quiet is not None and status["domQuiet"] < self.dom_quiet:
+            return False
+        return status["selector"]
+
+
+def install_probe(driver):
+    """
+    Have the browser install the readiness probe in every new document before its scripts run
+
+    Args:
+        driver: Chrome WebDriver
+
+    Returns:
+        bool: True if the probe was registered, False if the driver has no DevTools access
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": PROBE_SCRIPT})
+        return True
+    except Exception as e:
+        # The probe is then installed on the first status check, missing
+        # requests started before it
+        logger.debug(f"Could not register the readiness probe: {str(e)}")
+        return False
+
+
+class PageWait:
+    """
+    Readiness wait of one page that is advanced one check at a time.
+
+    The wait ends when the page meets the policy or its deadline passes;
+    a page showing a Cloudflare challenge gets one extension of
+    policy.challenge_timeout.
+    """
+
+    def __init__(self, policy, timeout):
+        """
+        Initialize the PageWait
+
+        Args:
+            policy: ReadinessPolicy to apply
+            timeout: Ceiling in seconds
+        """
+        self.policy = policy
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout
+        self.ready = False
+        self.challenge = False
+        self.status = None
+        self._extended = False
+
+    def poll(self, driver):
+        """
+        Check the page once
+
+        Args:
+            driver: Selenium WebDriver showing the page
+
+        Returns:
+            bool: True once the wait is over (ready or timed out)
+        """
+        try:
+            status = driver.execute_script(STATUS_SCRIPT, self.policy.selector)
+        except JavascriptException:
+            # A script interrupted by a navigation is simply checked again
+            status = None
+
+        if status is not None:
+            self.status = status
+            self.challenge = self.challenge or status["challenge"]
+            if self.policy.is_met(status):
+                self.ready = True
+                return True
+
+        now = time.monotonic()
+        if now < self.deadline:
+            return False
+        if self.challenge and not self._extended and self.policy.challenge_timeout:
+            logger.info("Detected Cloudflare challenge, waiting for it to clear...")
+            self._extended = True
+            self.deadline = now + self.policy.challenge_timeout
+            return False
+        return True
+
+    @property
+    def navigated(self):
+        """Whether the page has replaced the tab's previous document (as far as the last check saw)"""
+        return self.ready or (self.status is not None and not self.status.get("stale"))
+
+    def result(self):
+        """
+        Get the outcome of the wait
+
+        Returns:
+            dict: Seconds waited, whether the page became ready and whether a challenge was seen
+        """
+        result = {
+            "ready": self.ready,
+            "challenge": self.challenge,
+            "waited": round(time.monotonic() - self.started, 3)
+        }
+        if not self.ready:
+            logger.info(f"Page not ready after {result['waited']}s, reading it as it is (last status: {self.status})")
+        return result
+
+
+def wait_until_ready(driver, policy, timeout):
+    """
+    Wait until the loaded page meets the policy's conditions or the timeout passes
+
+    Args:
+        driver: Selenium WebDriver that has navigated to the page
+        policy: ReadinessPolicy to apply
+        timeout: Ceiling in seconds; a Cloudflare challenge adds policy.challenge_timeout
+
+    Returns:
+        dict: Seconds waited, whether the page became ready and whether a challenge was seen
+    """
+    page_wait = PageWait(policy, timeout)
+    while not page_wait.poll(driver):
+        time.sleep(policy.poll_interval)
+    return page_wait.result()
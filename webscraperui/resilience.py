@@ -0,0 +1,406 @@
+"""
+Fault Handling module for the WebScraperUI application
+
+Retries transient failures with jittered exponential backoff within a
+per-host retry budget, and stops sending requests to a host that keeps
+failing with a per-host circuit breaker.
+"""
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Transport failures worth another attempt: no connection, no answer in time,
+# or a browser that could not load the page (TimeoutException is a WebDriverException)
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout, WebDriverException)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+    def __init__(self, host, retry_in):
+        """
+        Initialize the CircuitOpenError
+
+        Args:
+            host: Host whose circuit is open
+            retry_in: Seconds until the circuit lets a trial request through
+        """
+        super().__init__(f"Circuit open for {host}, retrying in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class RetryPolicy:
+    """Number of attempts and jittered exponential backoff between them"""
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=8.0):
+        """
+        Initialize the RetryPolicy
+
+        Args:
+            max_attempts: Attempts per call, including the first
+            base_delay: Backoff ceiling before the first retry, doubled for each further retry
+            max_delay: Largest backoff ceiling
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        """
+        Get the backoff before a retry ("full jitter")
+
+        Args:
+            attempt: Number of attempts made so far
+
+        Returns:
+            float: Seconds to wait
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def is_retryable(self, error):
+        """
+        Decide whether an error is worth retrying
+
+        Connection errors, timeouts, browser errors and 429/5xx responses
+        are retried; other HTTP errors are answers from a healthy host, and
+        anything else (a malformed URL, a parsing bug) would fail again.
+
+        Args:
+            error: Exception raised by the call
+
+        Returns:
+            bool: True if the call should be retried
+        """
+        if isinstance(error, CircuitOpenError):
+            return False
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+        if status_code is not None:
+            return status_code == 429 or status_code >= 500
+        return isinstance(error, TRANSIENT_ERRORS)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single host.
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    fail fast. Once reset_timeout has passed one trial call is let through:
+    success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=3, reset_timeout=30.0):
+        """
+        Initialize the CircuitBreaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+
+    def retry_in(self):
+        """Seconds until an open circuit lets a trial call through"""
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self):
+        """
+        Check whether a call may be sent
+
+        Returns:
+            bool: True if the call may proceed
+        """
+        if self.state == OPEN and self.retry_in() <= 0:
+            self.state = HALF_OPEN
+            self.trial_in_flight = False
+
+        if self.state == HALF_OPEN:
+            if self.trial_in_flight:
+                return False
+            self.trial_in_flight = True
+            return True
+
+        return self.state == CLOSED
+
+    def release_trial(self):
+        """Let another trial call through after one that said nothing about the host"""
+        self.trial_in_flight = False
+
+    def record_success(self):
+        """Record a successful call"""
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        """
+        Record a failed call
+
+        Returns:
+            bool: True if this failure opened the circuit
+        """
+        self.consecutive_failures += 1
+        self.trial_in_flight = False
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            opened = self.state != OPEN
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            return opened
+        return False
+
+
+class HostHealth:
+    """Circuit breaker, retry budget and failure statistics for one host"""
+
+    def __init__(self, breaker):
+        """
+        Initialize the HostHealth
+
+        Args:
+            breaker: CircuitBreaker for the host
+        """
+        self.breaker = breaker
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.fast_failures = 0
+        self.last_error = None
+
+
+class FaultHandler:
+    """
+    Shared fault-handling layer for HTTP requests and browser page loads.
+
+    Retries are limited by a per-host budget (a fraction of the host's
+    requests plus a small allowance), so a struggling host does not get
+    flooded with retries, and every host has its own circuit breaker.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=8.0, retry_budget=0.2,
+                 min_retries=3, failure_threshold=3, reset_timeout=30.0):
+        """
+        Initialize the FaultHandler
+
+        Args:
+            max_attempts: Attempts per call, including the first
+            base_delay: Backoff ceiling before the first retry
+            max_delay: Largest backoff ceiling
+            retry_budget: Retries allowed per host as a fraction of its requests
+            min_retries: Retries always allowed per host on top of the budget
+            failure_threshold: Consecutive failures that open a host's circuit
+            reset_timeout: Seconds a circuit stays open before a trial call
+        """
+        self.policy = RetryPolicy(max_attempts, base_delay, max_delay)
+        self.retry_budget = retry_budget
+        self.min_retries = min_retries
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _health(self, host):
+        """Get or create the health record for a host (caller holds the lock)"""
+        health = self._hosts.get(host)
+        if health is None:
+            health = HostHealth(CircuitBreaker(self.failure_threshold, self.reset_timeout))
+            self._hosts[host] = health
+        return health
+
+    def check(self, url):
+        """
+        Fail fast if a URL's host circuit is open
+
+        Args:
+            url: URL about to be requested
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            health = self._health(host)
+            if health.breaker.state == OPEN and health.breaker.retry_in() > 0:
+                health.fast_failures += 1
+                raise CircuitOpenError(host, health.breaker.retry_in())
+
+    def call(self, url, func, *args, **kwargs):
+        """
+        Call func for a URL with retries and the host's circuit breaker
+
+        Args:
+            url: URL the call requests (selects the host)
+            func: Callable performing the request
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+            Exception: The last error once retries are exhausted
+        """
+        host = urlparse(url).netloc
+        attempt = 0
+        while True:
+            with self._lock:
+                health = self._health(host)
+                if not health.breaker.allow():
+                    health.fast_failures += 1
+                    raise CircuitOpenError(host, health.breaker.retry_in())
+                health.requests += 1
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                attempt += 1
+                with self._lock:
+                    if not self._failed(host, health, e, attempt):
+                        raise
+
+                delay = self.policy.delay(attempt)
+                logger.info(f"Retrying {url} in {delay:.2f}s after error: {str(e)}")
+                time.sleep(delay)
+                continue
+
+            with self._lock:
+                health.breaker.record_success()
+            return result
+
+    def _failed(self, host, health, error, attempt):
+        """
+        Record a failed attempt and decide whether it may be retried (caller holds the lock)
+
+        Args:
+            host: Host of the request
+            health: HostHealth of the host
+            error: Exception the attempt raised
+            attempt: Number of attempts made so far
+
+        Returns:
+            bool: True if the error is transient and the attempts and the host's retry budget allow
+                  another try (which is then counted as a retry)
+        """
+        if not self.policy.is_retryable(error):
+            if getattr(error, "response", None) is not None:
+                # The host answered, it just answered with an error
+                health.breaker.record_success()
+            else:
+                # The request failed before reaching the host
+                health.breaker.release_trial()
+            return False
+
+        health.failures += 1
+        health.last_error = str(error)
+        if health.breaker.record_failure():
+            logger.warning(f"Circuit opened for {host} after "
+                           f"{health.breaker.consecutive_failures} consecutive failures")
+        allowed = (attempt < self.policy.max_attempts
+                   and health.breaker.state == CLOSED
+                   and health.retries < self.min_retries + self.retry_budget * health.requests)
+        if allowed:
+            health.retries += 1
+        return allowed
+
+    def record_success(self, url):
+        """
+        Record a request made outside call() that succeeded, e.g. a page loaded in a browser tab
+
+        Args:
+            url: URL that was requested
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            health = self._health(host)
+            health.requests += 1
+            health.breaker.record_success()
+
+    def record_failure(self, url, error, attempt=1):
+        """
+        Record a request made outside call() that failed, e.g. a page that never loaded in a browser tab
+
+        Args:
+            url: URL that was requested
+            error: Exception describing the failure
+            attempt: Number of attempts made at the URL so far
+
+        Returns:
+            bool: True if the caller should retry the URL (counted as a retry of its host)
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            health = self._health(host)
+            health.requests += 1
+            return self._failed(host, health, error, attempt)
+
+    def host_stats(self):
+        """
+        Get per-host failure statistics
+
+        Returns:
+            dict: host -> requests, failures, retries, fast failures, circuit state and last error
+        """
+        with self._lock:
+            return {
+                host: {
+                    "requests": health.requests,
+                    "failures": health.failures,
+                    "retries": health.retries,
+                    "fast_failures": health.fast_failures,
+                    "circuit": health.breaker.state,
+                    "last_error": health.last_error
+                }
+                for host, health in self._hosts.items()
+            }
+
+
+_default_handler = None
+_default_lock = threading.Lock()
+
+
+def get_fault_handler():
+    """
+    Get the process-wide shared FaultHandler
+
+    Returns:
+        FaultHandler: Shared fault handler
+    """
+    global _default_handler
+    if _default_handler is None:
+        with _default_lock:
+            if _default_handler is None:
+                _default_handler = FaultHandler()
+    return _default_handler
+
+
+def configure_fault_handler(**kwargs):
+    """
+    Replace the shared FaultHandler with a newly configured one
+
+    Args:
+        **kwargs: Arguments for FaultHandler
+
+    Returns:
+        FaultHandler: The new shared fault handler
+    """
+    global _default_handler
+    with _default_lock:
+        _default_handler = FaultHandler(**kwargs)
+    return _default_handler
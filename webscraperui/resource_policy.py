@@ -0,0 +1,152 @@
+"""
+Resource Blocking module for the WebScraperUI application
+
+Keeps rendered pages from downloading what extraction never reads:
+images, fonts and media (the DOM keeps their src attributes) and
+third-party trackers, ads and widgets. Blocking uses a Chrome content
+setting for images and DevTools Network.setBlockedURLs patterns for the
+rest, with domain deny lists and allow-list exceptions.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# File extensions of the resource types that can be blocked by URL
+RESOURCE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "ogg", "ogv", "mp3", "wav", "m4a", "mov"),
+    "stylesheet": ("css",)
+}
+
+# Analytics, ad and widget hosts that never carry page content
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "connect.facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "optimizely.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "nr-data.net",
+    "ethicalads.io",
+    "carbonads.net",
+    "buysellads.com",
+    "disqus.com",
+    "intercom.io"
+)
+
+# Named policies; "docs" suits documentation sites, whose text and
+# structure do not depend on images, fonts, media or scripts from other hosts
+PROFILES = {
+    "none": {"block_types": (), "deny_domains": ()},
+    "trackers": {"block_types": (), "deny_domains": TRACKER_DOMAINS},
+    "docs": {"block_types": ("image", "font", "media"), "deny_domains": TRACKER_DOMAINS}
+}
+
+
+def _matches_domain(host, domains):
+    """Check whether host is one of domains or a subdomain of one"""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+class ResourcePolicy:
+    """
+    Which requests a rendered page may make.
+
+    Resource types are blocked by file extension (and images also by a
+    Chrome content setting); hosts in deny_domains are blocked unless they
+    are in allow_domains.
+    """
+
+    def __init__(self, block_types=(), deny_domains=(), allow_domains=()):
+        """
+        Initialize the ResourcePolicy
+
+        Args:
+            block_types: Resource types to block (image, font, media, stylesheet)
+            deny_domains: Hosts (and their subdomains) to block
+            allow_domains: Hosts never blocked by deny_domains
+        """
+        unknown = set(block_types) - set(RESOURCE_EXTENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+        self.block_types = tuple(block_types)
+        self.allow_domains = tuple(domain.lower() for domain in allow_domains)
+        self.deny_domains = tuple(domain.lower() for domain in deny_domains
+                                  if not _matches_domain(domain.lower(), self.allow_domains))
+
+    @classmethod
+    def from_profile(cls, name, deny_domains=(), allow_domains=()):
+        """
+        Build a policy from a named profile
+
+        Args:
+            name: Profile name (none, trackers or docs)
+            deny_domains: Hosts to block in addition to the profile's
+            allow_domains: Hosts never blocked by the deny lists
+
+        Returns:
+            ResourcePolicy: The policy
+        """
+        if name not in PROFILES:
+            raise ValueError(f"Unknown resource profile: {name}")
+        profile = PROFILES[name]
+        return cls(
+            block_types=profile["block_types"],
+            deny_domains=tuple(profile["deny_domains"]) + tuple(deny_domains),
+            allow_domains=allow_domains
+        )
+
+    def blocked_patterns(self):
+        """
+        Get the URL patterns passed to Network.setBlockedURLs
+
+        Returns:
+            list: Wildcard URL patterns
+        """
+        patterns = []
+        for resource_type in self.block_types:
+            for extension in RESOURCE_EXTENSIONS[resource_type]:
+                patterns.extend([f"*.{extension}", f"*.{extension}?*"])
+        for domain in self.deny_domains:
+            patterns.extend([f"*://{domain}/*", f"*://*.{domain}/*"])
+        return patterns
+
+    def chrome_prefs(self):
+        """
+        Get Chrome preferences implementing the policy at startup
+
+        Returns:
+            dict: Preferences for the "prefs" experimental option
+        """
+        if "image" in self.block_types:
+            return {"profile.managed_default_content_settings.images": 2}
+        return {}
+
+    def apply(self, driver):
+        """
+        Install the URL blocking in the driver's current tab
+
+        Args:
+            driver: Chrome WebDriver
+
+        Returns:
+            bool: True if blocking is active, False if there was nothing to block or no DevTools access
+        """
+        patterns = self.blocked_patterns()
+        if not patterns:
+            return False
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            return True
+        except Exception as e:
+            logger.debug(f"Could not install resource blocking: {str(e)}")
+            return False
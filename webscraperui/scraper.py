@@ -2,40 +2,114 @@
 Web Scraper module for the WebScraperUI application
 """
 import os
+import copy
 import json
+import hashlib
 import logging
 import re
-import time
 from collections import defaultdict
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
-
 from webscraperui.analyzer import ContentAnalyzer
+from webscraperui.async_crawler import AsyncCrawler
+from webscraperui.content_extractor import content_text
+from webscraperui.dedup import NearDuplicateIndex
+from webscraperui.extraction import extract_elements
+from webscraperui.frontier import URLFrontier, VISITED
+from webscraperui.http_cache import HTTPCache
+from webscraperui.http_session import get_session_manager
+from webscraperui.document import parse_document
+from webscraperui.politeness import get_scheduler
+from webscraperui.resilience import get_fault_handler
+from webscraperui.selector_cache import SelectorCache
+from webscraperui.streaming import stream_html
+from webscraperui.url_utils import canonicalize_url, normalize_url, VisitedURLSet
 
 logger = logging.getLogger(__name__)
 
 class WebScraper:
     """Web Scraper class for fetching and processing web content"""
     
-    def __init__(self, output_folder="./scraped_data"):
+    def __init__(self, output_folder="./scraped_data", session_manager=None,
+                 crawl_mode="sequential", max_concurrency=8, per_host_concurrency=4,
+                 scheduler=None, use_cache=True, cache_ttl=None, cache_max_bytes=256 * 1024 * 1024,
+                 max_pages=100, max_links_per_page=None, site_discovery=None, near_duplicates=None,
+                 fault_handler=None, stream=False, max_body_bytes=None, selector_cache=None, seed_sitemaps=True):
         """
         Initialize the WebScraper
         
         Args:
             output_folder: Folder to save scraped data
+            session_manager: HTTPSessionManager to fetch with (default: shared pool)
+            crawl_mode: How linked pages are fetched ("sequential" or "async")
+            max_concurrency: Maximum concurrent fetches in async crawl mode
+            per_host_concurrency: Maximum concurrent fetches per host in async crawl mode
+            scheduler: PolitenessScheduler pacing requests per host (default: shared scheduler)
+            use_cache: Whether to keep an on-disk HTTP cache under the output folder
+            cache_ttl: Seconds a cached page is reused without revalidation (None: always revalidate)
+            cache_max_bytes: Maximum size of the HTTP cache before LRU eviction
+            max_pages: Maximum number of linked pages fetched per crawl
+            max_links_per_page: Optional cap on links followed from each page
+            site_discovery: Optional SiteDiscovery to seed crawls from sitemaps and honour robots.txt
+            near_duplicates: NearDuplicateIndex of pages already scraped (default: a new index)
+            fault_handler: FaultHandler retrying requests and tripping per-host circuits (default: shared handler)
+            stream: Whether to read page bodies in chunks, so max_body_bytes can stop long downloads early
+            max_body_bytes: Optional largest body read per page in streaming mode (longer pages are cut off)
+            selector_cache: SelectorCache of learned per-domain content selectors (default: one under the output folder)
+            seed_sitemaps: Whether crawls also queue the site's sitemap entries (with site_discovery)
         """
         self.output_folder = output_folder
         self.analyzer = ContentAnalyzer()
-        self.visited_urls = set()
+        self.session_manager = session_manager or get_session_manager()
+        self.crawl_mode = crawl_mode
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.scheduler = scheduler or get_scheduler()
+        self.max_pages = max_pages
+        self.max_links_per_page = max_links_per_page
+        self.site_discovery = site_discovery
+        self.seed_sitemaps = seed_sitemaps
+        self.near_duplicates = near_duplicates or NearDuplicateIndex()
+        self.fault_handler = fault_handler or get_fault_handler()
+        self.stream = stream
+        self.max_body_bytes = max_body_bytes
+        self.selector_cache = selector_cache or SelectorCache(os.path.join(output_folder, ".selectors", "selectors.json"))
         
         # Create output folder if it doesn't exist
         if not os.path.exists(output_folder):
             os.makedirs(output_folder)
+        
+        self.http_cache = None
+        if use_cache:
+            self.http_cache = HTTPCache(
+                os.path.join(output_folder, ".http_cache"),
+                max_size_bytes=cache_max_bytes,
+                ttl=cache_ttl
+            )
     
-    def scrape(self, url, depth=1, output_format="txt"):
+    def with_limits(self, max_pages=None, max_links_per_page=None, seed_sitemaps=None):
+        """
+        Get a scraper with other crawl limits that shares this one's sessions, cache and indexes
+        
+        Args:
+            max_pages: Maximum number of linked pages fetched per crawl (default: unchanged)
+            max_links_per_page: Cap on links followed from each page (default: unchanged)
+            seed_sitemaps: Whether crawls also queue sitemap entries (default: unchanged)
+            
+        Returns:
+            WebScraper: The limited scraper
+        """
+        limited = copy.copy(self)
+        if max_pages is not None:
+            limited.max_pages = max_pages
+        if max_links_per_page is not None:
+            limited.max_links_per_page = max_links_per_page
+        if seed_sitemaps is not None:
+            limited.seed_sitemaps = seed_sitemaps
+        return limited
+    
+    def scrape(self, url, depth=1, output_format="txt", crawl_mode=None, resume=False, html=None):
         """
         Scrape a website starting from the given URL
         
@@ -43,6 +117,9 @@ class WebScraper:
             url: Starting URL to scrape
             depth: How many levels deep to scrape (default: 1)
             output_format: Format for saving output (txt, json, html)
+            crawl_mode: Override the crawl mode for this scrape ("sequential" or "async")
+            resume: Continue an interrupted crawl of this URL instead of starting over
+            html: Content of the page if it was already fetched
             
         Returns:
             dict: Scraped data and status
@@ -50,16 +127,27 @@ class WebScraper:
         try:
             logger.info(f"Starting scrape of {url} with depth {depth}")
             
-            # Reset visited URLs
-            self.visited_urls = set()
-            
             # Fetch and parse the content
-            html_content = self._fetch_content(url)
+            html_content = html if html is not None else self._fetch_content(url)
             soup = self._parse_html(html_content)
             
             # Extract data from the page
             data = self._extract_data(soup, url)
             
+            # Link near-duplicates to the page already scraped instead of analyzing and saving them
+            fingerprint = self.near_duplicates.fingerprint(data.get("content", ""))
+            match = self.near_duplicates.find(url, fingerprint)
+            if match is not None:
+                logger.info(f"Skipping {url}: near-duplicate of {match[0]}")
+                return {
+                    "url": url,
+                    "title": data.get("title", ""),
+                    "content": data.get("content", ""),
+                    "output_path": match[1] or "",
+                    "status": "duplicate",
+                    "duplicate_of": match[0]
+                }
+            
             # Add timestamp and parameters
             data["timestamp"] = datetime.now().isoformat()
             data["scrape_depth"] = depth
@@ -70,10 +158,13 @@ class WebScraper:
             
             # Crawl additional pages if depth > 1
             if depth > 1:
-                data["linked_pages"] = self._crawl_links(url, soup, depth - 1)
+                data["linked_pages"] = self._crawl_links(
+                    url, data["links"], depth - 1, crawl_mode or self.crawl_mode, resume=resume
+                )
             
             # Save the results
             output_path = self._save_output(data, output_format)
+            self.near_duplicates.add(url, fingerprint, output_path)
             
             return {
                 "url": url,
@@ -87,38 +178,102 @@ class WebScraper:
             logger.error(f"Error scraping {url}: {str(e)}")
             raise
     
-    def _fetch_content(self, url):
+    def fetch_html(self, url):
+        """
+        Fetch a page through the HTTP cache, politeness scheduler and fault handler
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            str: HTML content
+        """
+        return self._fetch_content(url)
+    
+    def _fetch_content(self, url, throttle=True):
         """
         Fetch content from a URL
         
         Args:
             url: URL to fetch
+            throttle: Whether to wait for the per-host politeness scheduler first
             
         Returns:
             str: HTML content
         """
         logger.info(f"Fetching content from {url}")
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) WebScraperUI/1.0.0"
-        }
+        # Serve from the HTTP cache when the TTL allows, otherwise revalidate
+        entry = self.http_cache.get(url) if self.http_cache else None
+        if entry and self.http_cache.is_fresh(entry):
+            logger.info(f"Serving {url} from HTTP cache")
+            return self.http_cache.read_body(entry)
+        
+        headers = self.http_cache.conditional_headers(entry) if entry else {}
+        
+        # Retry transient failures; fail fast while the host's circuit is open.
+        # Retries always wait for the scheduler, even if the caller already did for the first attempt
+        throttles = iter([throttle])
+        response = self.fault_handler.call(url, lambda: self._request(url, headers, next(throttles, True)))
+        
+        if response.status_code == 304 and entry:
+            logger.info(f"{url} not modified, serving from HTTP cache")
+            # Release the connection of the unread (streamed) response
+            response.close()
+            self.http_cache.revalidated(entry)
+            return self.http_cache.read_body(entry)
+        
+        if self.stream:
+            html, truncated, _ = stream_html(response, url, max_bytes=self.max_body_bytes)
+            # A cut-off body is not the page, so it is never cached
+            if self.http_cache and not truncated:
+                self.http_cache.store(url, response, body=html.encode(response.encoding, errors="replace"))
+            return html
         
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        if self.http_cache:
+            self.http_cache.store(url, response)
         
         return response.text
     
+    def _request(self, url, headers, throttle):
+        """
+        Send one GET request for a URL
+        
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            throttle: Whether to wait for the per-host politeness scheduler first
+            
+        Returns:
+            requests.Response: Response with a 2xx or 304 status
+        """
+        if throttle:
+            self.scheduler.wait(url)
+        
+        # Reuse pooled keep-alive connections to the same host; the fault handler does the retrying
+        response = self.session_manager.get(url, headers=headers, stream=self.stream, retry=False)
+        self.scheduler.record_response(url, response.status_code, response.headers.get("Retry-After"))
+        
+        if response.status_code != 304:
+            try:
+                response.raise_for_status()
+            except Exception:
+                # Release the connection of an unread streamed body
+                response.close()
+                raise
+        return response
+    
     def _parse_html(self, html):
         """
-        Parse HTML content using BeautifulSoup
+        Parse HTML content with the configured parser backend
         
         Args:
             html: HTML content as string
             
         Returns:
-            BeautifulSoup: Parsed HTML
+            BeautifulSoup: Parsed HTML, shared through the document cache (read-only)
         """
-        return BeautifulSoup(html, "html.parser")
+        return parse_document(html).soup
     
     def _extract_data(self, soup, url):
         """
@@ -138,84 +293,75 @@ class WebScraper:
             "path": urlparse(url).path,
         }
         
-        # Extract title
-        title_tag = soup.find("title")
-        if title_tag:
-            data["title"] = title_tag.text.strip()
-        else:
-            data["title"] = "No title found"
-        
-        # Extract meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc:
-            data["meta_description"] = meta_desc.get("content", "")
-        
-        # Extract main content
-        # Try to find main content using common content containers
-        content_selectors = [
-            "main", "article", "#content", ".content", 
-            "#main", ".main", ".post", ".entry", "body"
-        ]
-        
-        content = ""
-        for selector in content_selectors:
-            content_tag = soup.select_one(selector)
-            if content_tag:
-                content = content_tag.get_text(separator=" ", strip=True)
-                break
-        
-        # If no content found with selectors, use the body
-        if not content and soup.body:
-            content = soup.body.get_text(separator=" ", strip=True)
-            
-        data["content"] = content
+        # Collect title, meta description, links, headings and images in one walk
+        elements = extract_elements(soup, url)
+        data["title"] = elements["title"] if elements["title"] is not None else "No title found"
+        if elements["meta_description"] is not None:
+            data["meta_description"] = elements["meta_description"]
         
-        # Extract links
-        links = []
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if href and not href.startswith("#") and not href.startswith("javascript:"):
-                links.append({
-                    "text": link.text.strip(),
-                    "href": urljoin(url, href)
-                })
-        
-        data["links"] = links
-        
-        # Extract headings
-        headings = []
-        for heading_level in range(1, 7):
-            for heading in soup.find_all(f"h{heading_level}"):
-                headings.append({
-                    "level": heading_level,
-                    "text": heading.text.strip()
-                })
-        
-        data["headings"] = headings
-        
-        # Extract images
-        images = []
-        for img in soup.find_all("img", src=True):
-            src = img.get("src", "")
-            if src:
-                images.append({
-                    "src": urljoin(url, src),
-                    "alt": img.get("alt", ""),
-                    "title": img.get("title", "")
-                })
-        
-        data["images"] = images
+        # Main content from the domain's learned selector, or scored by text
+        # and link density, without navigation and footers
+        data["content"] = content_text(self.selector_cache.find(soup, data["domain"]))
+        
+        data["links"] = elements["links"]
+        data["headings"] = elements["headings"]
+        data["images"] = elements["images"]
         
         return data
     
-    def _crawl_links(self, base_url, soup, depth):
+    def _frontier_path(self, base_url):
+        """
+        Get the frontier database path for a crawl
+        
+        Args:
+            base_url: Starting URL of the crawl
+            
+        Returns:
+            str: Path of the SQLite frontier file
+        """
+        crawl_id = hashlib.sha1(canonicalize_url(base_url).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.output_folder, ".crawl", f"{crawl_id}.sqlite")
+    
+    def _page_links(self, base_url, page_links):
+        """
+        Get the same-domain links to follow from a page
+        
+        Args:
+            base_url: URL of the page
+            page_links: The page's link records ({"text", "href"}) from _extract_data
+            
+        Returns:
+            list: Absolute URLs in document order, unique by canonical form
+        """
+        links = []
+        seen = set()
+        base_netloc = urlparse(normalize_url(base_url)).netloc
+        for link in page_links:
+            absolute_url = normalize_url(link["href"], base_url)
+            key = canonicalize_url(absolute_url)
+            # Only include links from the same domain
+            if urlparse(absolute_url).netloc == base_netloc and key not in seen:
+                seen.add(key)
+                links.append(absolute_url)
+        
+        if self.site_discovery is not None:
+            links = [link for link in links if self.site_discovery.can_fetch(link)]
+        
+        if self.max_links_per_page:
+            links = links[:self.max_links_per_page]
+        
+        return links
+    
+    def _crawl_links(self, base_url, page_links, depth, crawl_mode="sequential", resume=False):
         """
-        Crawl links from the page
+        Crawl links breadth-first through a persistent URL frontier
         
         Args:
             base_url: Base URL for resolving relative links
-            soup: BeautifulSoup object
+            page_links: Link records of the start page from _extract_data
             depth: Remaining crawl depth
+            crawl_mode: "sequential" or "async"
+            resume: Continue an interrupted crawl from its frontier
             
         Returns:
             list: Data from linked pages
@@ -223,50 +369,147 @@ class WebScraper:
         if depth <= 0:
             return []
         
-        # Extract links from the page
-        links = []
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if href and not href.startswith("#") and not href.startswith("javascript:"):
-                absolute_url = urljoin(base_url, href)
-                # Only include links from the same domain
-                if urlparse(absolute_url).netloc == urlparse(base_url).netloc:
-                    links.append(absolute_url)
-        
-        # Remove duplicate links and already visited URLs
-        links = [link for link in set(links) if link not in self.visited_urls]
-        
-        # Limit to 5 links per page to avoid excessive crawling
-        links = links[:5]
-        
-        # Crawl each link
-        linked_data = []
-        for link in links:
-            try:
-                # Mark URL as visited
-                self.visited_urls.add(link)
-                
-                # Fetch and parse the page
-                html_content = self._fetch_content(link)
-                link_soup = self._parse_html(html_content)
-                
-                # Extract data from the page
-                data = self._extract_data(link_soup, link)
-                
-                # Add to the results
-                linked_data.append({
-                    "url": link,
-                    "title": data.get("title", ""),
-                    "content_summary": data.get("content", "")[:200] + "..."
-                })
+        frontier = URLFrontier(self._frontier_path(base_url), key_func=canonicalize_url)
+        # Links already queued this run skip the frontier round trip
+        seen = VisitedURLSet(spill_dir=os.path.join(self.output_folder, ".crawl"))
+        seen.add(base_url)
+        try:
+            if resume:
+                requeued = frontier.reset_in_progress()
+                logger.info(f"Resuming crawl of {base_url}: {frontier.counts()} ({requeued} requeued)")
+            else:
+                frontier.clear()
+            
+            # Sitemap entries reach pages the start page does not link to
+            # (discovering the site also loads its robots.txt rules)
+            sitemap_links = []
+            if self.site_discovery is not None:
+                if self.seed_sitemaps:
+                    sitemap_links = self.site_discovery.seed_urls(base_url, limit=self.max_pages)
+                else:
+                    self.site_discovery.discover(base_url)
+            
+            frontier.add(base_url, depth=0, state=VISITED)
+            frontier.add_many(
+                [link for link in self._page_links(base_url, page_links) + sitemap_links if seen.add(link)],
+                depth=1, parent=base_url
+            )
+            
+            batch_size = self.max_concurrency * 4 if crawl_mode == "async" else 1
+            
+            while True:
+                remaining = self.max_pages - frontier.counts()[VISITED] + 1
+                if remaining <= 0:
+                    break
                 
-                # Respect crawl delay
-                time.sleep(1)
+                batch = frontier.next_batch(min(batch_size, remaining), max_depth=depth)
+                if not batch:
+                    break
                 
+                depths = dict(batch)
+                for link, page, error in self._crawl_batch([link for link, _ in batch], crawl_mode):
+                    if error is not None:
+                        frontier.mark_failed(link, error)
+                        continue
+                    
+                    summary, child_links = page
+                    frontier.mark_visited(link, summary)
+                    
+                    # Queue the next level
+                    if depths[link] < depth:
+                        frontier.add_many(
+                            [child for child in child_links if seen.add(child)],
+                            depth=depths[link] + 1, parent=link
+                        )
+            
+            linked_data = list(frontier.results())
+            logger.info(f"Crawl of {base_url} finished: {frontier.counts()}")
+        finally:
+            frontier.close()
+            seen.close()
+        
+        # The crawl completed, so its frontier is no longer needed for resuming
+        for suffix in ("", "-wal", "-shm"):
+            path = self._frontier_path(base_url) + suffix
+            if os.path.exists(path):
+                os.remove(path)
+        
+        return linked_data
+    
+    def _crawl_batch(self, links, crawl_mode):
+        """
+        Crawl a batch of links
+        
+        Args:
+            links: List of absolute URLs to crawl
+            crawl_mode: "sequential" or "async"
+            
+        Returns:
+            list: (url, (summary, child_links), error) tuples in the order of links
+        """
+        if crawl_mode == "async":
+            return self._crawl_pages_async(links)
+        
+        # Crawl each link (the scheduler paces requests per host)
+        results = []
+        for link in links:
+            try:
+                results.append((link, self._crawl_page(link), None))
             except Exception as e:
                 logger.error(f"Error crawling {link}: {str(e)}")
+                results.append((link, None, e))
         
-        return linked_data
+        return results
+    
+    def _crawl_pages_async(self, links):
+        """
+        Crawl a list of links concurrently on an asyncio event loop
+        
+        Args:
+            links: List of absolute URLs to crawl
+            
+        Returns:
+            list: (url, (summary, child_links), error) tuples in the order of links
+        """
+        # The crawler waits on the scheduler itself, so fetches skip the blocking wait
+        crawler = AsyncCrawler(
+            lambda link: self._crawl_page(link, throttle=False),
+            max_concurrency=self.max_concurrency,
+            per_host_concurrency=self.per_host_concurrency,
+            scheduler=self.scheduler
+        )
+        
+        return crawler.run(links)
+    
+    def _crawl_page(self, link, throttle=True):
+        """
+        Fetch a linked page and summarize it
+        
+        Args:
+            link: URL of the linked page
+            throttle: Whether to wait for the politeness scheduler before fetching
+            
+        Returns:
+            tuple: (linked page summary or None for a near-duplicate, same-domain links found on the page)
+        """
+        # Fetch and parse the page
+        html_content = self._fetch_content(link, throttle=throttle)
+        link_soup = self._parse_html(html_content)
+        
+        # Extract data from the page
+        data = self._extract_data(link_soup, link)
+        
+        # Near-duplicates are left out of the results and their links are not followed
+        if self.near_duplicates.check(link, data.get("content", "")) is not None:
+            return None, []
+        
+        summary = {
+            "url": link,
+            "title": data.get("title", ""),
+            "content_summary": data.get("content", "")[:200] + "..."
+        }
+        
+        return summary, self._page_links(link, data["links"])
     
     def _analyze_content(self, data):
         """
@@ -0,0 +1,124 @@
+"""
+Adaptive Scrolling module for the WebScraperUI application
+
+Scrolls rendered pages to load lazy content only while they keep growing:
+after each scroll the page gets a short time (longer while its requests
+are still in flight) to add height or elements, and scrolling stops at
+the first scroll that adds nothing or when the scroll or time budget runs
+out. The number of scrolls each domain needed is recorded.
+"""
+import time
+import logging
+import threading
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+# Scroll to the bottom (optional) and report the page size in one round-trip
+MEASURE_SCRIPT = """
+if (arguments[0]) { window.scrollTo(0, document.documentElement.scrollHeight); }
+var state = window.__webscraperReady;
+return {
+    height: document.documentElement.scrollHeight,
+    elements: document.getElementsByTagName('*').length,
+    pending: state ? state.pending : 0
+};
+"""
+
+
+class AdaptiveScroller:
+    """
+    Scrolls a page until it stops growing and keeps per-domain scroll statistics.
+    """
+
+    def __init__(self, max_scrolls=30, budget=20, settle=0.5, max_settle=3, poll_interval=0.1):
+        """
+        Initialize the AdaptiveScroller
+
+        Args:
+            max_scrolls: Most scrolls per page
+            budget: Most seconds spent scrolling one page
+            settle: Seconds to wait for growth after a scroll
+            max_settle: Most seconds to wait for growth while the page has requests in flight
+            poll_interval: Seconds between size checks
+        """
+        self.max_scrolls = max_scrolls
+        self.budget = budget
+        self.settle = settle
+        self.max_settle = max_settle
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._domains = defaultdict(lambda: {"pages": 0, "scrolls": 0, "max_scrolls": 0, "grown": 0})
+
+    def scroll(self, driver, domain=None):
+        """
+        Scroll a loaded page until it stops growing
+
+        Args:
+            driver: Selenium WebDriver showing the page
+            domain: Domain to record the scrolls under
+
+        Returns:
+            int: Number of scrolls that made the page grow
+        """
+        deadline = time.monotonic() + self.budget
+        size = driver.execute_script(MEASURE_SCRIPT, False)
+        grown = 0
+        for _ in range(self.max_scrolls):
+            if time.monotonic() >= deadline:
+                logger.info(f"Scroll budget of {self.budget}s used up after {grown} scrolls")
+                break
+            after = self._wait_for_growth(driver, size, deadline)
+            if after is None:
+                break
+            size = after
+            grown += 1
+
+        if domain is not None:
+            self._record(domain, grown)
+        return grown
+
+    def _wait_for_growth(self, driver, size, deadline):
+        """
+        Scroll to the bottom and wait for the page to add height or elements
+
+        Returns:
+            dict: New page size, or None if the page did not grow
+        """
+        started = time.monotonic()
+        current = driver.execute_script(MEASURE_SCRIPT, True)
+        while True:
+            if current["height"] > size["height"] or current["elements"] > size["elements"]:
+                return current
+            waited = time.monotonic() - started
+            limit = self.max_settle if current["pending"] else self.settle
+            if waited >= limit or time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_interval)
+            current = driver.execute_script(MEASURE_SCRIPT, False)
+
+    def _record(self, domain, grown):
+        """Add one page's scroll count to its domain's statistics"""
+        with self._lock:
+            entry = self._domains[domain]
+            entry["pages"] += 1
+            entry["scrolls"] += grown
+            entry["max_scrolls"] = max(entry["max_scrolls"], grown)
+            if grown:
+                entry["grown"] += 1
+
+    def stats(self, domain=None):
+        """
+        Get the scroll statistics
+
+        Args:
+            domain: Optional domain to report on
+
+        Returns:
+            dict: domain -> pages scrolled, total and most scrolls needed, and pages that grew
+                  (or one domain's entry)
+        """
+        with self._lock:
+            if domain is not None:
+                return dict(self._domains[domain]) if domain in self._domains else {}
+            return {name: dict(entry) for name, entry in self._domains.items()}
@@ -0,0 +1,180 @@
+"""
+Learned Selector module for the WebScraperUI application
+
+Remembers, per domain, the CSS selector of the element that held the main
+content, so later pages of the same site are located with one lookup
+instead of scoring the whole tree. A selector that stops matching is
+forgotten and learned again.
+"""
+import os
+import re
+import json
+import time
+import logging
+import threading
+
+from webscraperui.content_extractor import find_main_content
+
+logger = logging.getLogger(__name__)
+
+# Class and id values that can be used in a selector without escaping
+SAFE_NAME = re.compile(r"^[A-Za-z_][\w-]*$")
+
+
+def selector_for(soup, node):
+    """
+    Build a simple CSS selector that finds node as the first match in soup
+
+    Args:
+        soup: BeautifulSoup object containing node
+        node: Element to describe
+
+    Returns:
+        str: Selector, or None if no id, role, class or tag selector is unique enough
+    """
+    candidates = []
+    node_id = node.get("id")
+    if node_id and SAFE_NAME.match(node_id):
+        candidates.append(f"#{node_id}")
+    role = node.get("role")
+    if role and SAFE_NAME.match(role):
+        candidates.append(f"{node.name}[role='{role}']")
+    classes = [name for name in node.get("class") or () if SAFE_NAME.match(name)]
+    if classes:
+        candidates.append(node.name + "".join(f".{name}" for name in classes))
+    if node.name in ("main", "article"):
+        candidates.append(node.name)
+
+    for selector in candidates:
+        if soup.select_one(selector) is node:
+            return selector
+    return None
+
+
+class SelectorCache:
+    """
+    Persisted map of domain -> learned main-content selector with hit statistics.
+
+    Learning and forgetting a selector are saved at once; hit counts are
+    saved every save_interval lookups.
+    """
+
+    def __init__(self, path, min_chars=100, save_interval=20):
+        """
+        Initialize the SelectorCache
+
+        Args:
+            path: JSON file the map is kept in
+            min_chars: Least text a learned selector's element must hold to count as a hit
+            save_interval: Lookups between saves of the hit statistics
+        """
+        self.path = path
+        self.min_chars = min_chars
+        self.save_interval = save_interval
+        self._lock = threading.Lock()
+        self._unsaved = 0
+
+        folder = os.path.dirname(path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._domains = json.load(f)
+        except (OSError, ValueError):
+            self._domains = {}
+
+    def find(self, soup, domain):
+        """
+        Find a page's main content element, trying the domain's learned selector first
+
+        Args:
+            soup: BeautifulSoup object of the page
+            domain: Key of the site the page belongs to (usually its host)
+
+        Returns:
+            Tag: Main content element
+        """
+        selector = self.selector(domain)
+        if selector:
+            node = soup.select_one(selector)
+            if node is not None and len(node.get_text(strip=True)) >= self.min_chars:
+                self.record_hit(domain)
+                return node
+            logger.info(f"Learned selector {selector} missed on {domain}, learning again")
+
+        node = find_main_content(soup)
+        self._learn(domain, selector_for(soup, node) if node is not soup.body else None, missed=bool(selector))
+        return node
+
+    def selector(self, domain):
+        """
+        Get a domain's learned selector
+
+        Args:
+            domain: Key of the site
+
+        Returns:
+            str: Selector, or None if none has been learned
+        """
+        with self._lock:
+            entry = self._domains.get(domain)
+            return entry.get("selector") if entry else None
+
+    def record_hit(self, domain):
+        """Count a hit of the domain's selector and save the statistics every save_interval lookups"""
+        with self._lock:
+            entry = self._domains[domain]
+            entry["hits"] += 1
+            self._unsaved += 1
+            if self._unsaved >= self.save_interval:
+                self._save()
+
+    def _learn(self, domain, selector, missed):
+        """Store a newly learned selector (or forget a missing one) and save if anything changed"""
+        with self._lock:
+            entry = self._domains.get(domain)
+            if entry is None:
+                entry = self._domains[domain] = {"selector": None, "hits": 0, "misses": 0, "learned": 0}
+            elif not missed and selector == entry["selector"]:
+                return
+            if missed:
+                entry["misses"] += 1
+            if selector != entry["selector"]:
+                entry["selector"] = selector
+                if selector:
+                    entry["learned"] += 1
+                    logger.info(f"Learned main content selector {selector} for {domain}")
+            entry["updated_at"] = time.time()
+            self._save()
+
+    def stats(self, domain=None):
+        """
+        Get the learned selectors and their statistics
+
+        Args:
+            domain: Optional domain to report on
+
+        Returns:
+            dict: domain -> selector, hits, misses and times learned (or one domain's entry)
+        """
+        with self._lock:
+            if domain is not None:
+                return dict(self._domains.get(domain) or {})
+            return {name: dict(entry) for name, entry in self._domains.items()}
+
+    def save(self):
+        """Write the map to disk"""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        """Atomically write the map (caller holds the lock)"""
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._domains, f)
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
+        except OSError as e:
+            logger.error(f"Error saving learned selectors to {self.path}: {str(e)}")
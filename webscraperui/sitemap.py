@@ -0,0 +1,334 @@
+"""
+Site Discovery module for the WebScraperUI application
+
+Reads robots.txt and sitemap.xml files to list a site's pages without
+rendering them, and caches the parsed result per site.
+"""
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+import time
+import zlib
+import xml.etree.ElementTree as ET
+from urllib.parse import urljoin, urlsplit, unquote
+from urllib.robotparser import RobotFileParser
+
+from webscraperui.http_session import get_session_manager
+from webscraperui.politeness import get_scheduler
+from webscraperui.url_utils import canonicalize_url, normalize_url
+
+logger = logging.getLogger(__name__)
+
+ROBOTS_USER_AGENT = "WebScraperUI"
+
+
+def _sitemap_chunks(response):
+    """
+    Read a sitemap response body, decompressing gzipped sitemaps
+
+    Args:
+        response: Streaming requests.Response of the sitemap
+
+    Yields:
+        bytes: XML data
+    """
+    decompressor = None
+    for index, chunk in enumerate(response.iter_content(chunk_size=64 * 1024)):
+        # .xml.gz files are usually served without Content-Encoding
+        if index == 0 and chunk[:2] == b"\x1f\x8b":
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        yield decompressor.decompress(chunk) if decompressor is not None else chunk
+    # The decompressor may still hold the end of the file
+    if decompressor is not None:
+        yield decompressor.flush()
+
+
+class SiteDiscovery:
+    """
+    Discovers a site's pages from robots.txt and its sitemaps.
+
+    Sitemaps are parsed incrementally as they download, so sitemap indexes, gzipped
+    sitemaps and files with 50,000 entries are handled in bounded memory.
+    The parsed result for each site is cached on disk for `ttl` seconds.
+    """
+
+    def __init__(self, cache_dir, session_manager=None, scheduler=None, ttl=24 * 3600,
+                 max_urls=200000, max_sitemaps=100):
+        """
+        Initialize the SiteDiscovery
+
+        Args:
+            cache_dir: Folder to cache parsed sites in
+            session_manager: HTTPSessionManager to fetch with (default: shared pool)
+            scheduler: PolitenessScheduler to pace fetches and apply Crawl-delay (default: shared scheduler)
+            ttl: Seconds a cached site is reused before fetching again
+            max_urls: Maximum number of page URLs kept per site
+            max_sitemaps: Maximum number of sitemap files read per site
+        """
+        self.cache_dir = cache_dir
+        self.session_manager = session_manager or get_session_manager()
+        self.scheduler = scheduler or get_scheduler()
+        self.ttl = ttl
+        self.max_urls = max_urls
+        self.max_sitemaps = max_sitemaps
+        self._robots = {}
+        self._lock = threading.Lock()
+
+        # Create cache folder if it doesn't exist
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+    def _origin(self, url):
+        """Get the scheme://host[:port] origin of a URL"""
+        parts = urlsplit(normalize_url(url))
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _cache_path(self, origin):
+        """Get the cache file path for a site"""
+        digest = hashlib.sha1(origin.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"site_{digest}.json")
+
+    def discover(self, url, refresh=False):
+        """
+        Get the robots.txt rules and sitemap entries of a site
+
+        Args:
+            url: Any URL on the site
+            refresh: Ignore the cached result
+
+        Returns:
+            dict: origin, robots_txt, crawl_delay, sitemaps, urls and fetched_at
+        """
+        origin = self._origin(url)
+        cache_path = self._cache_path(origin)
+
+        site = None
+        if not refresh:
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    site = json.load(f)
+            except (OSError, ValueError):
+                site = None
+            if site and (site.get("origin") != origin or time.time() - site.get("fetched_at", 0) > self.ttl):
+                site = None
+
+        if site is None:
+            site = self._fetch_site(origin)
+            # A temp file per call, so overlapping discoveries never write into each other's file
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.cache_dir, prefix="site_",
+                                             suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                json.dump(site, f)
+            os.replace(tmp_path, cache_path)
+        else:
+            logger.info(f"Using cached discovery for {origin} ({len(site['urls'])} URLs)")
+
+        self._apply_robots(origin, site)
+        return site
+
+    def _fetch_site(self, origin):
+        """
+        Fetch robots.txt and every sitemap it lists
+
+        Args:
+            origin: Site origin
+
+        Returns:
+            dict: Parsed site
+        """
+        robots_txt = self._fetch_text(f"{origin}/robots.txt")
+
+        parser = RobotFileParser()
+        parser.parse(robots_txt.splitlines())
+        crawl_delay = parser.crawl_delay(ROBOTS_USER_AGENT)
+        sitemaps = parser.site_maps() or [f"{origin}/sitemap.xml"]
+
+        urls = []
+        seen = set()
+        for entry in self._iter_sitemaps(sitemaps):
+            key = canonicalize_url(entry["url"])
+            if key in seen:
+                continue
+            seen.add(key)
+            urls.append(entry)
+            if len(urls) >= self.max_urls:
+                logger.warning(f"Sitemaps of {origin} truncated at {self.max_urls} URLs")
+                break
+
+        logger.info(f"Discovered {len(urls)} URLs for {origin} from {len(sitemaps)} sitemap(s)")
+        return {
+            "origin": origin,
+            "robots_txt": robots_txt,
+            "crawl_delay": crawl_delay,
+            "sitemaps": sitemaps,
+            "urls": urls,
+            "fetched_at": time.time()
+        }
+
+    def _fetch_text(self, url):
+        """Fetch a small text resource, returning "" if it is missing"""
+        try:
+            self.scheduler.wait(url)
+            response = self.session_manager.get(url)
+            self.scheduler.record_response(url, response.status_code, response.headers.get("Retry-After"))
+            if response.status_code != 200:
+                return ""
+            return response.text
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {str(e)}")
+            return ""
+
+    def _iter_sitemaps(self, sitemap_urls):
+        """
+        Yield page entries from sitemaps, following sitemap indexes
+
+        Args:
+            sitemap_urls: Sitemap URLs to start from
+
+        Yields:
+            dict: {"url", "lastmod"} page entries
+        """
+        queue = list(sitemap_urls)
+        visited = set()
+        while queue and len(visited) < self.max_sitemaps:
+            sitemap_url = queue.pop(0)
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+
+            for kind, entry in self._parse_sitemap(sitemap_url):
+                if kind == "sitemap":
+                    queue.append(entry["url"])
+                else:
+                    yield entry
+
+    def _parse_sitemap(self, sitemap_url):
+        """
+        Stream-parse one sitemap or sitemap index
+
+        Args:
+            sitemap_url: URL of the sitemap (plain or gzipped XML)
+
+        Yields:
+            tuple: ("url" or "sitemap", {"url", "lastmod"})
+        """
+        try:
+            self.scheduler.wait(sitemap_url)
+            response = self.session_manager.get(sitemap_url, stream=True)
+            self.scheduler.record_response(sitemap_url, response.status_code, response.headers.get("Retry-After"))
+            if response.status_code != 200:
+                logger.info(f"No sitemap at {sitemap_url} (HTTP {response.status_code})")
+                response.close()
+                return
+        except Exception as e:
+            logger.error(f"Error fetching sitemap {sitemap_url}: {str(e)}")
+            return
+
+        try:
+            parser = ET.XMLPullParser(events=("end",))
+            loc = lastmod = None
+            for chunk in _sitemap_chunks(response):
+                parser.feed(chunk)
+
+                for _, elem in parser.read_events():
+                    tag = elem.tag.rsplit("}", 1)[-1]
+                    if tag == "loc":
+                        loc = (elem.text or "").strip()
+                    elif tag == "lastmod":
+                        lastmod = (elem.text or "").strip()
+                    elif tag in ("url", "sitemap"):
+                        if loc:
+                            yield tag, {"url": urljoin(sitemap_url, loc), "lastmod": lastmod}
+                        loc = lastmod = None
+                        elem.clear()
+        except (ET.ParseError, zlib.error, OSError) as e:
+            logger.error(f"Error parsing sitemap {sitemap_url}: {str(e)}")
+        finally:
+            response.close()
+
+    def _apply_robots(self, origin, site):
+        """Build the robots.txt parser for a site and apply its Crawl-delay"""
+        parser = RobotFileParser()
+        parser.parse(site.get("robots_txt", "").splitlines())
+        with self._lock:
+            self._robots[origin] = parser
+
+        crawl_delay = site.get("crawl_delay")
+        if crawl_delay:
+            # Crawl-delay may only slow a host down, never speed it up
+            rate = min(self.scheduler.default_rate, 1.0 / float(crawl_delay))
+            self.scheduler.set_host_rate(urlsplit(origin).netloc, rate, burst=1)
+            logger.info(f"Applied Crawl-delay of {crawl_delay}s to {origin}")
+
+    def can_fetch(self, url):
+        """
+        Check a URL against its site's robots.txt
+
+        Sites that were never discovered are allowed.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            bool: True if robots.txt allows fetching the URL
+        """
+        with self._lock:
+            parser = self._robots.get(self._origin(url))
+        if parser is None:
+            return True
+        return parser.can_fetch(ROBOTS_USER_AGENT, url)
+
+    def seed_urls(self, base_url, limit=None):
+        """
+        Get sitemap URLs under a base URL that robots.txt allows
+
+        Only URLs under the base URL's directory are returned, so a docs
+        version such as /en/latest/ does not pull in every other version.
+
+        Args:
+            base_url: URL whose directory bounds the result
+            limit: Optional maximum number of URLs
+
+        Returns:
+            list: Absolute URLs in sitemap order
+        """
+        site = self.discover(base_url)
+        base = urlsplit(normalize_url(base_url))
+        prefix = base.path[:base.path.rfind("/") + 1] or "/"
+
+        urls = []
+        for entry in site["urls"]:
+            url = normalize_url(entry["url"])
+            parts = urlsplit(url)
+            if parts.netloc != base.netloc or not parts.path.startswith(prefix):
+                continue
+            if not self.can_fetch(url):
+                continue
+            urls.append(url)
+            if limit and len(urls) >= limit:
+                break
+        return urls
+
+    def doc_links(self, base_url, limit=None):
+        """
+        Get sitemap URLs under a base URL as link dictionaries
+
+        The link text is derived from the last path segment, since
+        sitemaps carry no anchor text.
+
+        Args:
+            base_url: URL whose directory bounds the result
+            limit: Optional maximum number of links
+
+        Returns:
+            list: [{'url', 'text'}] link dictionaries
+        """
+        links = []
+        for url in self.seed_urls(base_url, limit):
+            segment = unquote(urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1])
+            text = os.path.splitext(segment)[0].replace("-", " ").replace("_", " ").strip() or url
+            links.append({"url": url, "text": text})
+        return links
@@ -0,0 +1,145 @@
+"""
+Streaming HTML module for the WebScraperUI application
+
+Reads a response body in chunks, tokenizing the HTML as it arrives so links
+and headings are reported before the download finishes, and stops reading
+bodies that exceed a size limit.
+"""
+import codecs
+import logging
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from webscraperui.extraction import HEADING_LEVELS
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the connection at a time
+CHUNK_SIZE = 64 * 1024
+
+
+class StreamingHTMLParser(HTMLParser):
+    """
+    Incremental tokenizer reporting links and headings as they are parsed.
+
+    Links are reported as {"text", "href"} records with absolute URLs and
+    headings as {"level", "text"}, the same records extract_elements returns.
+    """
+
+    def __init__(self, base_url, on_link=None, on_heading=None):
+        """
+        Initialize the StreamingHTMLParser
+
+        Args:
+            base_url: URL of the page, for resolving relative links
+            on_link: Optional callable receiving each link record when its </a> is parsed
+            on_heading: Optional callable receiving each heading record when it is closed
+        """
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.on_link = on_link
+        self.on_heading = on_heading
+        self.links = []
+        self.headings = []
+        self._anchor = None
+        self._heading = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href and not href.startswith("#") and not href.startswith("javascript:"):
+                self._anchor = {"href": urljoin(self.base_url, href), "parts": []}
+        elif tag in HEADING_LEVELS:
+            self._heading = {"level": HEADING_LEVELS[tag], "parts": []}
+        elif tag == "base":
+            # A <base href> changes how every later relative link resolves
+            href = dict(attrs).get("href")
+            if href:
+                self.base_url = urljoin(self.base_url, href)
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._anchor is not None:
+            link = {"text": "".join(self._anchor["parts"]).strip(), "href": self._anchor["href"]}
+            self._anchor = None
+            self.links.append(link)
+            if self.on_link:
+                self.on_link(link)
+        elif tag in HEADING_LEVELS and self._heading is not None:
+            heading = {"level": self._heading["level"], "text": "".join(self._heading["parts"]).strip()}
+            self._heading = None
+            self.headings.append(heading)
+            if self.on_heading:
+                self.on_heading(heading)
+
+    def handle_data(self, data):
+        if self._anchor is not None:
+            self._anchor["parts"].append(data)
+        if self._heading is not None:
+            self._heading["parts"].append(data)
+
+
+def stream_html(response, url, max_bytes=None, on_link=None, on_heading=None, chunk_size=CHUNK_SIZE):
+    """
+    Read an HTML response body incrementally
+
+    The response must have been requested with stream=True. Chunks are
+    decoded and tokenized as they arrive; reading stops once max_bytes have
+    been received and the connection is released. The body is only
+    tokenized when a callback wants its links or headings; otherwise the
+    caller's own parse is the only one.
+
+    Args:
+        response: Streaming requests.Response
+        url: URL of the page, for resolving relative links
+        max_bytes: Optional largest body size to read
+        on_link: Optional callable receiving each link record as soon as it is parsed
+        on_heading: Optional callable receiving each heading record as soon as it is parsed
+        chunk_size: Bytes read at a time
+
+    Returns:
+        tuple: (html, truncated, parser) with the decoded body, whether the body
+            was cut off at max_bytes and the StreamingHTMLParser holding the links
+            and headings found (empty when no callback was given)
+    """
+    encoding = response.encoding or "utf-8"
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    except LookupError:
+        encoding = "utf-8"
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    parser = StreamingHTMLParser(url, on_link=on_link, on_heading=on_heading)
+    tokenize = on_link is not None or on_heading is not None
+    parts = []
+    received = 0
+    truncated = False
+
+    try:
+        for chunk in response.iter_content(chunk_size):
+            if max_bytes is not None and received + len(chunk) > max_bytes:
+                chunk = chunk[:max_bytes - received]
+                truncated = True
+            received += len(chunk)
+
+            text = decoder.decode(chunk)
+            if text:
+                parts.append(text)
+                if tokenize:
+                    parser.feed(text)
+
+            if truncated:
+                logger.warning(f"Stopped reading {url} at the {max_bytes} byte body limit")
+                break
+
+        text = decoder.decode(b"", final=True)
+        if text:
+            parts.append(text)
+            if tokenize:
+                parser.feed(text)
+        parser.close()
+    finally:
+        response.close()
+
+    # Record the encoding used so the body can be re-encoded the same way (e.g. for caching)
+    response.encoding = encoding
+    return "".join(parts), truncated, parser
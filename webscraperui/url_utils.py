@@ -0,0 +1,285 @@
+"""
+URL utilities module for the WebScraperUI application
+
+Canonicalizes URLs so that trivially different spellings of the same page
+deduplicate, and provides a compact visited-set for very large crawls.
+"""
+import os
+import math
+import mmap
+import hashlib
+import logging
+import tempfile
+import threading
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Trailing path segments that serve the same page as their directory
+INDEX_PAGES = ("index.html", "index.htm")
+
+# Query parameters that never change page content
+TRACKING_PARAMS = ("utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "gclid", "fbclid")
+
+
+def normalize_url(url, base_url=None):
+    """
+    Resolve a URL and apply normalizations that are always safe to fetch
+
+    Lowercases the scheme and host, drops default ports and the fragment.
+
+    Args:
+        url: URL or relative reference
+        base_url: Optional base URL to resolve against
+
+    Returns:
+        str: Normalized absolute URL
+    """
+    if base_url:
+        url = urljoin(base_url, url)
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS:
+        return url
+
+    netloc = _normalize_netloc(parts, scheme)
+    path = parts.path or "/"
+    return urlunsplit((scheme, netloc, path, parts.query, ""))
+
+
+def canonicalize_url(url, base_url=None):
+    """
+    Build the canonical identity of a URL for deduplication
+
+    On top of normalize_url this sorts query parameters, removes tracking
+    parameters, strips a trailing index.html and the trailing slash.
+
+    Args:
+        url: URL or relative reference
+        base_url: Optional base URL to resolve against
+
+    Returns:
+        str: Canonical URL
+    """
+    if base_url:
+        url = urljoin(base_url, url)
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS:
+        return url
+
+    netloc = _normalize_netloc(parts, scheme)
+
+    path = parts.path or "/"
+    for index_page in INDEX_PAGES:
+        if path.endswith("/" + index_page):
+            path = path[:-len(index_page)]
+            break
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    params = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS
+    ]
+    query = urlencode(sorted(params))
+
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def _normalize_netloc(parts, scheme):
+    """Lowercase the host and drop the scheme's default port"""
+    host = (parts.hostname or "").lower()
+    # hostname strips the brackets of IPv6 literals, which the URL needs back
+    if ":" in host:
+        host = f"[{host}]"
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+
+    netloc = host
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if parts.username:
+        userinfo = parts.username
+        if parts.password:
+            userinfo += f":{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+    return netloc
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    The bit array lives in memory, or in a memory-mapped file when a path
+    is given so the operating system can page it out.
+    """
+
+    def __init__(self, capacity, error_rate=0.0001, path=None):
+        """
+        Initialize the BloomFilter
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: Target false-positive rate at capacity
+            path: Optional file to memory-map the bit array from
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.count = 0
+        self.path = path
+
+        num_bytes = (self.num_bits + 7) // 8
+        if path:
+            with open(path, "wb") as f:
+                f.truncate(num_bytes)
+            self._file = open(path, "r+b")
+            self.bits = mmap.mmap(self._file.fileno(), num_bytes)
+        else:
+            self._file = None
+            self.bits = bytearray(num_bytes)
+
+    def _positions(self, item):
+        """Get the bit positions for an item using double hashing"""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """
+        Add an item
+
+        Args:
+            item: String to add
+        """
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def close(self):
+        """Release the memory map, if any"""
+        if self._file is not None:
+            self.bits.close()
+            self._file.close()
+            self._file = None
+
+
+class VisitedURLSet:
+    """
+    Membership set of canonical URLs for crawl deduplication.
+
+    URLs are kept in an exact set until exact_limit is reached; after that
+    they move into a chain of Bloom filters that doubles in size as it
+    fills, memory-mapped from spill_dir so multi-million-URL crawls fit.
+    """
+
+    def __init__(self, exact_limit=100000, error_rate=0.0001, spill_dir=None):
+        """
+        Initialize the VisitedURLSet
+
+        Args:
+            exact_limit: Number of URLs tracked exactly before switching to Bloom filters
+            error_rate: False-positive rate of each Bloom filter layer
+            spill_dir: Optional folder for memory-mapped filter files
+        """
+        self.exact_limit = exact_limit
+        self.error_rate = error_rate
+        self.spill_dir = spill_dir
+        self._exact = set()
+        self._layers = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _new_layer(self, capacity):
+        """Append a Bloom filter layer with the given capacity"""
+        path = None
+        if self.spill_dir:
+            if not os.path.exists(self.spill_dir):
+                os.makedirs(self.spill_dir)
+            fd, path = tempfile.mkstemp(prefix="visited_", suffix=".bloom", dir=self.spill_dir)
+            os.close(fd)
+        # Tighten each new layer so the compound error rate stays bounded
+        error_rate = self.error_rate * (0.5 ** len(self._layers))
+        layer = BloomFilter(capacity, error_rate, path)
+        self._layers.append(layer)
+        logger.info(f"Visited set grew a Bloom filter layer for {capacity} URLs")
+        return layer
+
+    def _spill(self):
+        """Move the exact set into the first Bloom filter layer"""
+        layer = self._new_layer(self.exact_limit * 2)
+        for key in self._exact:
+            layer.add(key)
+        self._exact = set()
+
+    def add(self, url):
+        """
+        Add a URL
+
+        Args:
+            url: URL to add (canonicalized internally)
+
+        Returns:
+            bool: True if the URL was not seen before
+        """
+        key = canonicalize_url(url)
+        with self._lock:
+            if self._contains(key):
+                return False
+
+            if not self._layers:
+                self._exact.add(key)
+                if len(self._exact) > self.exact_limit:
+                    self._spill()
+            else:
+                layer = self._layers[-1]
+                if layer.count >= layer.capacity:
+                    layer = self._new_layer(layer.capacity * 2)
+                layer.add(key)
+
+            self._size += 1
+            return True
+
+    def _contains(self, key):
+        """Check membership of a canonical key (caller holds the lock)"""
+        if key in self._exact:
+            return True
+        return any(key in layer for layer in self._layers)
+
+    def __contains__(self, url):
+        with self._lock:
+            return self._contains(canonicalize_url(url))
+
+    def __len__(self):
+        return self._size
+
+    def update(self, urls):
+        """
+        Add several URLs
+
+        Args:
+            urls: Iterable of URLs
+        """
+        for url in urls:
+            self.add(url)
+
+    def close(self):
+        """Release and delete any memory-mapped filter files"""
+        with self._lock:
+            for layer in self._layers:
+                layer.close()
+                if layer.path and os.path.exists(layer.path):
+                    os.remove(layer.path)
+            self._layers = []